@@ -30,6 +30,7 @@ def bootstrap_json_file(
 		prefer: Literal['project', 'user'] = "project",
 		app: str = "sciwork",
 		overwrite: bool = False,
+		precomputed_bytes: Optional[bytes] = None,
 ) -> Path:
 	"""
 	Ensure a config JSON *name* exists in the resolved configs dir, writing *payload* if missing.
@@ -46,6 +47,8 @@ def bootstrap_json_file(
 	:param prefer: ``'project'``  (default) or ``'user'``.
 	:param app: Namespace directory (default ``'sciwork'``).
 	:param overwrite: Overwrite even if the file exists.
+	:param precomputed_bytes: Optional already-serialized (UTF-8 JSON) form of *payload*;
+		when given, it is written verbatim instead of re-serializing *payload*.
 	:return: Absolute path to the (existing or created) file.
 	"""
 	dest = store.resolve_config_path(name, prefer=prefer, app=app)
@@ -57,10 +60,14 @@ def bootstrap_json_file(
 	if payload is not None and not isinstance(payload, Mapping):
 		raise TypeError("payload must be a mapping (JSON object) when provided.")
 
-	effective_payload: Dict[str, Any] = deepcopy(DEFAULT_PROJECT_SCHEMA) if payload is None else payload
 	dest.parent.mkdir(parents=True, exist_ok=True)
 
 	existed = dest.exists()
-	store.write_json(dest, effective_payload, overwrite=True, backup_ext=".bak" if existed else None)
+	backup_ext = ".bak" if existed else None
+	if precomputed_bytes is not None:
+		store.write_bytes(dest, precomputed_bytes, overwrite=True, backup_ext=backup_ext)
+	else:
+		effective_payload: Dict[str, Any] = deepcopy(DEFAULT_PROJECT_SCHEMA) if payload is None else payload
+		store.write_json(dest, effective_payload, overwrite=True, backup_ext=backup_ext)
 	LOG.info("%s config %s at %s", "Overwrote" if existed else "Created", name, dest)
 	return dest
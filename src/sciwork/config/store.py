@@ -84,9 +84,9 @@ def _ensure_parent(path: Path) -> None:
 	path.parent.mkdir(parents=True, exist_ok=True)
 
 
-def _atomic_write_text(dest: Path, text: str, *, encoding: str = "utf-8", backup_ext: Optional[str] = None) -> None:
+def _atomic_write_bytes(dest: Path, data: bytes, *, backup_ext: Optional[str] = None) -> None:
 	"""
-	Atomically write *text* to *dest*. Optionally, create a backup of the original.
+	Atomically write *data* to *dest*. Optionally, create a backup of the original.
 
 	Strategy:
 		- write to a temporary file in the same directory,
@@ -95,16 +95,15 @@ def _atomic_write_text(dest: Path, text: str, *, encoding: str = "utf-8", backup
 		- os.replace(temp, dest) (atomic on POSIX/NTFS).
 
 	:param dest: Destination file path.
-	:param text: Text content to write.
-	:param encoding: Target encoding.
+	:param data: Raw content to write.
 	:param backup_ext: If provided (e.g., ``".bak"``), make a backup of *dest* when it exists.
 	:raises OSError: On I/O errors.
 	"""
 	_ensure_parent(dest)
 	tmp_fd, tmp_path = tempfile.mkstemp(prefix=dest.name + ".", dir=str(dest.parent))
 	try:
-		with os.fdopen(tmp_fd, "w", encoding=encoding, newline="\n") as fh:
-			fh.write(text)
+		with os.fdopen(tmp_fd, "wb") as fh:
+			fh.write(data)
 			fh.flush()
 			os.fsync(fh.fileno())
 
@@ -128,6 +127,19 @@ def _atomic_write_text(dest: Path, text: str, *, encoding: str = "utf-8", backup
 		raise
 
 
+def _atomic_write_text(dest: Path, text: str, *, encoding: str = "utf-8", backup_ext: Optional[str] = None) -> None:
+	"""
+	Atomically write *text* to *dest* encoded as *encoding* (see :func:`_atomic_write_bytes`).
+
+	:param dest: Destination file path.
+	:param text: Text content to write.
+	:param encoding: Target encoding.
+	:param backup_ext: If provided (e.g., ``".bak"``), make a backup of *dest* when it exists.
+	:raises OSError: On I/O errors.
+	"""
+	_atomic_write_bytes(dest, text.encode(encoding), backup_ext=backup_ext)
+
+
 def _atomic_write_json(dest: Path, obj: Any, *, indent: int = 2, backup_ext: Optional[str] = None) -> None:
 	"""
 	Atomically write JSON *obj* to *dest* with UTF-8 encoding.
@@ -205,6 +217,34 @@ def write_text(
 	return dest
 
 
+def write_bytes(
+		path: PathLike,
+		data: bytes,
+		*,
+		overwrite: bool = True,
+		backup_ext: Optional[str] = ".bak"
+) -> Path:
+	"""
+	Write pre-encoded content atomically, optionally creating a backup of the previous content.
+
+	Useful when the payload is static and already serialized (e.g., a default JSON theme).
+
+	:param path: Destination path.
+	:param data: Content to write.
+	:param overwrite: If ``False`` and the file exist, raise ``FileExistsError``.
+	:param backup_ext: Backup extension; set ``None`` to disable backups.
+	:return: Absolute path written.
+	:raises FileExistsError: When destination exists and ``overwrite=False``.
+	:raises OSError: On I/O errors.
+	"""
+	dest = Path(path).expanduser().resolve()
+	if dest.exists() and not overwrite:
+		raise FileExistsError(f"Destination file already exists at {dest}")
+	_atomic_write_bytes(dest, data, backup_ext=backup_ext)
+	LOG.info("Wrote bytes to %s", dest)
+	return dest
+
+
 def read_json(path: PathLike) -> Any:
 	"""
 	Read and parse JSON from *path*.
@@ -269,6 +309,7 @@ __all__ = [
 	"ensure_config_file",
 	"read_text",
 	"write_text",
+	"write_bytes",
 	"read_json",
 	"write_json",
 	"list_configs"
@@ -1,10 +1,14 @@
 from __future__ import annotations
 
+import functools
+import io
 import json
 import logging
+import os
 from pathlib import Path
-from typing import Any, Dict, Iterable, Mapping, Optional, Tuple, Union
+from typing import IO, Any, Callable, Dict, Iterable, Mapping, Optional, Tuple, Union
 
+from ..imports import orjson
 from .schema import (
 	KeySpec,
 	load_schema_template_from_json
@@ -20,6 +24,56 @@ def _ensure_parent(path: Path) -> None:
 	path.parent.mkdir(parents=True, exist_ok=True)
 
 
+def _open_for_write(dest: Path, *, overwrite: bool, mode: str = "w", **kwargs: Any) -> IO:
+	"""
+	Open *dest* for writing through a single :func:`os.open` call.
+
+	The descriptor is created with ``O_CREAT|O_TRUNC`` (plus ``O_EXCL`` when
+	``overwrite=False``, so a file appearing after the upfront check is not
+	clobbered) and wrapped by :func:`os.fdopen` with a 1 MiB buffer.
+
+	:param dest: Destination file path.
+	:param overwrite: When False, fail if *dest* already exists.
+	:param mode: ``"w"`` (text) or ``"wb"`` (binary).
+	:param kwargs: Extra arguments for :func:`os.fdopen` (``encoding``, ``newline``...).
+	:return: Open file object.
+	:raises FileExistsError: If *dest* exists and ``overwrite=False``.
+	:raises OSError: On open errors.
+	"""
+	flags = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_CLOEXEC", 0) | getattr(os, "O_BINARY", 0)
+	if not overwrite:
+		flags |= os.O_EXCL
+	fd = os.open(dest, flags, 0o644)
+	try:
+		return os.fdopen(fd, mode, buffering=1 << 20, **kwargs)
+	except Exception:
+		os.close(fd)
+		raise
+
+
+# Exact types whose INI form depends only on the value (floats are left out: -0.0 == 0.0)
+_INI_CACHEABLE_TYPES = frozenset({type(None), bool, int, str})
+
+
+def _to_ini_scalar_impl(value: Any) -> str:
+	"""Uncached conversion behind :func:`_to_ini_scalar`."""
+	if value is None:
+		return "null"
+	if isinstance(value, bool):
+		return "true" if value else "false"
+	if isinstance(value, (int, float, str)):
+		return str(value)
+	# lists, dicts, tuples... -> JSON
+	try:
+		return json.dumps(value, ensure_ascii=False)
+	except Exception:
+		return str(value)
+
+
+# typed=True keeps True/1 apart
+_to_ini_scalar_cached = functools.lru_cache(maxsize=256, typed=True)(_to_ini_scalar_impl)
+
+
 def _to_ini_scalar(value: Any) -> str:
 	"""
 	Convert a Python value to a string suitable for INI emission.
@@ -35,20 +89,14 @@ def _to_ini_scalar(value: Any) -> str:
 		- "true"/"false" -> booleans,
 		- JSON-like for complex types is safely parseable again.
 
+	Conversions of repeated plain scalars (``None``, bools, ints, strings) are memoized.
+
 	:param value: Python value to convert.
 	:return: String suitable for INI emission.
 	"""
-	if value is None:
-		return "null"
-	if isinstance(value, bool):
-		return "true" if value else "false"
-	if isinstance(value, (int, float, str)):
-		return str(value)
-	# lists, dicts, tuples... -> JSON
-	try:
-		return json.dumps(value, ensure_ascii=False)
-	except Exception:
-		return str(value)
+	if type(value) in _INI_CACHEABLE_TYPES:
+		return _to_ini_scalar_cached(value)
+	return _to_ini_scalar_impl(value)
 
 
 def _build_mapping_from_schema(
@@ -72,11 +120,17 @@ def _build_mapping_from_schema(
 	:param placeholder: Value used for keys without defaults (can be '', None, or text).
 	:return: Dictionary ready to be dumped as INI/JSON content.
 	"""
-	target_sections = list(sections) if sections else list(schema.keys())
+	requested = tuple(sections) if sections is not None else ()
+	if requested and requested != tuple(schema):
+		target_sections: Iterable[Tuple[str, Mapping[str, KeySpec]]] = (
+			(sec, schema.get(sec, {})) for sec in requested
+		)
+	else:
+		# Sections match the schema order (the usual case): walk the schema directly
+		target_sections = schema.items()
 	out: Dict[str, Dict[str, Any]] = {}
 
-	for sec in target_sections:
-		keyspecs = schema.get(sec, {})
+	for sec, keyspecs in target_sections:
 		sec_defaults = defaults.get(sec, {}) if include_defaults else {}
 		bucket: Dict[str, Any] = {}
 
@@ -90,6 +144,52 @@ def _build_mapping_from_schema(
 	return out
 
 
+def _mapping_from_template(
+		schema_json_path: PathLike,
+		*,
+		template: str,
+		sections: Iterable[str],
+		project: Optional[str],
+		include_defaults: bool,
+		placeholder: Optional[str]
+) -> Dict[str, Dict[str, Any]]:
+	"""
+	Load a schema **template** and build the section→key→value mapping for *sections*.
+
+	:return: Dictionary ready to be dumped as INI/JSON content.
+	:raises ConfigError: On IO/parse errors or invalid schema shapes.
+	"""
+	sections = list(sections)
+	parsed_schema, defaults = load_schema_template_from_json(
+		schema_json_path,
+		template=template,
+		project=project,
+		sections=sections
+	)
+	return _build_mapping_from_schema(
+		parsed_schema,
+		defaults=defaults,
+		sections=sections,
+		include_defaults=include_defaults,
+		placeholder=placeholder
+	)
+
+
+def _emit_ini(mapping: Mapping[str, Mapping[str, Any]], write: Callable[[str], Any]) -> None:
+	"""
+	Stream INI text for *mapping* through *write* (section by section, blank line between).
+
+	:param mapping: Section → key → value.
+	:param write: Text sink, e.g. ``StringIO.write`` or an open file's ``write``.
+	"""
+	sep = ""
+	for sec, kv in mapping.items():
+		write(f"{sep}[{sec}]\n")
+		for key, val in kv.items():
+			write(f"{key} = {_to_ini_scalar(val)}\n")
+		sep = "\n"
+
+
 # --- Public API: render and write INI / JSON from template schema
 def render_ini_from_template(
 		schema_json_path: PathLike,
@@ -118,31 +218,19 @@ def render_ini_from_template(
 	:return: ``(ini_text, mapping)`` where *mapping* is ``section -> key -> value``.
 	:raises ConfigError: On IO/parse errors or invalid schema shapes.
 	"""
-	# Parse schema template → (KeySpec mapping, defaults)
-	parsed_schema, defaults = load_schema_template_from_json(
+	mapping = _mapping_from_template(
 		schema_json_path,
 		template=template,
-		project=project,
-		sections=list(sections)
-	)
-	mapping = _build_mapping_from_schema(
-		parsed_schema,
-		defaults=defaults,
 		sections=sections,
+		project=project,
 		include_defaults=include_defaults,
 		placeholder=placeholder
 	)
 
 	# Compose INI text manually (we avoid extra interpolation side effects)
-	lines: list[str] = []
-	for sec in mapping:
-		lines.append(f"[{sec}]")
-		for key, val in mapping[sec].items():
-			lines.append(f"{key} = {_to_ini_scalar(val)}")
-		lines.append("")  # blank line between sections
-
-	ini_text = "\n".join(lines).rstrip() + "\n"
-	return ini_text, mapping
+	buf = io.StringIO()
+	_emit_ini(mapping, buf.write)
+	return buf.getvalue(), mapping
 
 
 def write_ini_from_template(
@@ -178,7 +266,7 @@ def write_ini_from_template(
 	if dest.exists() and not overwrite:
 		raise FileExistsError(f"Destination already exists: {dest}")
 
-	ini_text, _ = render_ini_from_template(
+	mapping = _mapping_from_template(
 		schema_json_path,
 		template=template,
 		sections=sections,
@@ -189,14 +277,16 @@ def write_ini_from_template(
 
 	_ensure_parent(dest)
 	try:
-		with dest.open("w", encoding="utf-8", newline="\n") as fh:
+		with _open_for_write(dest, overwrite=overwrite, encoding="utf-8", newline="\n") as fh:
 			if header_comment:
 				for line in header_comment.strip("\n").splitlines():
 					fh.write(f";{line}\n")
 				fh.write("\n")
-			fh.write(ini_text)
+			# Stream sections straight into the file (no intermediate INI string)
+			_emit_ini(mapping, fh.write)
 	except Exception as exc:
-		LOG.exception("Failed writing INI to %s: %s", dest, exc)
+		# the caller gets the exception anyway; format the traceback only when debugging
+		LOG.error("Failed writing INI to %s: %s", dest, exc, exc_info=LOG.isEnabledFor(logging.DEBUG))
 		raise
 	LOG.info("Wrote INI template to %s", dest)
 	return dest
@@ -225,23 +315,20 @@ def render_json_from_template(
 	:return: A mapping ``section -> {key: value}`` is ready for JSON dumping.
 	:raises ConfigError: On schema/template errors.
 	"""
-	parsed_schema, defaults = load_schema_template_from_json(
+	mapping = _mapping_from_template(
 		schema_json_path,
 		template=template,
-		project=project,
-		sections=list(sections),
-	)
-	mapping = _build_mapping_from_schema(
-		parsed_schema,
-		defaults,
 		sections=sections,
+		project=project,
 		include_defaults=include_defaults,
 		placeholder=placeholder,
 	)
 
 	if drop_nulls:
-		for sec, kv in list(mapping.items()):
-			mapping[sec] = {k: v for k, v in kv.items() if v is not None}
+		for sec, kv in mapping.items():
+			# only rebuild sections that actually contain nulls
+			if None in kv.values():
+				mapping[sec] = {k: v for k, v in kv.items() if v is not None}
 	return mapping
 
 
@@ -270,7 +357,8 @@ def write_json_from_template(
 	:param placeholder: Placeholder value for missing defaults.
 	:param drop_nulls: Remove keys with the value ``None`` from the output.
 	:param overwrite: When False and file exist, it raises ``FileExistsError``.
-	:param indent: JSON indent for readability (default 2).
+	:param indent: JSON indent for readability (default 2). With ``indent=2`` the
+		C-accelerated :mod:`orjson` serializer is used when installed.
 	:return: Absolute path to a written JSON file.
 	:raises FileExistsError: If the destination exists and ``overwrite=False``.
 	:raises OSError: On write errors.
@@ -290,12 +378,25 @@ def write_json_from_template(
 		drop_nulls=drop_nulls,
 	)
 
+	# orjson (optional) only mirrors the 2-space layout; everything else goes through stdlib json
+	data: Optional[bytes] = None
+	if indent == 2:
+		try:
+			data = orjson.dumps(payload, option=orjson.OPT_INDENT_2)
+		except (ImportError, TypeError):
+			data = None
+
 	_ensure_parent(dest)
 	try:
-		with dest.open("w", encoding="utf-8") as fh:
-			json.dump(payload, fh, ensure_ascii=False, indent=indent)
+		if data is not None:
+			with _open_for_write(dest, overwrite=overwrite, mode="wb") as fh:
+				fh.write(data)
+		else:
+			with _open_for_write(dest, overwrite=overwrite, encoding="utf-8") as fh:
+				json.dump(payload, fh, ensure_ascii=False, indent=indent)
 	except Exception as exc:
-		LOG.exception("Failed writing JSON to %s: %s", dest, exc)
+		# the caller gets the exception anyway; format the traceback only when debugging
+		LOG.error("Failed writing JSON to %s: %s", dest, exc, exc_info=LOG.isEnabledFor(logging.DEBUG))
 		raise
 	LOG.info("Wrote JSON template to %s", dest)
 	return dest
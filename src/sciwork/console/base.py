@@ -19,6 +19,9 @@ class _SupportsWriteAndFlush(_SupportsWrite, Protocol):
 
 _Stream = _SupportsWriteAndFlush | TextIO
 
+# Cached animation frames for ``next_dots``, keyed by ``max_dots``
+_DOT_FRAMES: dict[int, list[str]] = {}
+
 
 def format_interval(start_time: float, end_time: float, *, ms: bool = False) -> str:
 	"""
@@ -110,7 +113,9 @@ def next_dots(
 	:return: Updated dot counter to be fed back into the next call.
 	"""
 	n = max(0, min(current_count, max_dots - 1))
-	dots = "." * (n + 1)
-	pad = " " * (max_dots - (n + 1))
-	print(f"\r{prefix}{dots}{pad}{suffix}", end="", flush=True, file=stream)
+	frames = _DOT_FRAMES.get(max_dots)
+	if frames is None:
+		frames = ["." * (i + 1) + " " * (max_dots - i - 1) for i in range(max(1, max_dots))]
+		_DOT_FRAMES[max_dots] = frames
+	print(f"\r{prefix}{frames[n]}{suffix}", end="", flush=True, file=stream)
 	return 0 if n + 1 >= max_dots else (n + 1)
@@ -2,8 +2,10 @@
 
 from __future__ import annotations
 
+import json
 from pathlib import Path
-from typing import Dict, Literal
+from types import MappingProxyType
+from typing import Dict, Literal, Mapping
 
 from ..logutil import get_logger
 from ..config import bootstrap_json_file
@@ -11,7 +13,7 @@ from ..config import bootstrap_json_file
 LOG = get_logger(__name__)
 
 # Minimal default palette; will be extended later
-DEFAULT_ANSI_THEME: Dict[str, Dict[str, str]] = {
+_DEFAULT_RAW: Dict[str, Dict[str, str]] = {
 	"style": {"RESET": "\u001b[0m"},
 	"bfg": {
 		"GREEN": "\u001b[92m",
@@ -25,6 +27,12 @@ DEFAULT_ANSI_THEME: Dict[str, Dict[str, str]] = {
 	}
 }
 
+# Read-only view of the palette (nested groups frozen too) and its serialized form
+DEFAULT_ANSI_THEME: Mapping[str, Mapping[str, str]] = MappingProxyType(
+	{group: MappingProxyType(colors) for group, colors in _DEFAULT_RAW.items()}
+)
+_DEFAULT_BYTES = json.dumps(_DEFAULT_RAW, ensure_ascii=False, indent=2).encode("utf-8")
+
 
 def ensure_ansi_colors(
 		*,
@@ -49,7 +57,8 @@ def ensure_ansi_colors(
 		payload=DEFAULT_ANSI_THEME,
 		prefer=prefer,
 		app="sciwork",
-		overwrite=overwrite
+		overwrite=overwrite,
+		precomputed_bytes=_DEFAULT_BYTES
 	)
 	LOG.info("ANSI theme ready at: %s", path)
 	return path
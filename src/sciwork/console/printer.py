@@ -2,8 +2,12 @@
 
 from __future__ import annotations
 
+import functools
 import sys
-from typing import Any, Optional, Protocol, Literal
+import weakref
+from itertools import repeat
+from operator import itemgetter
+from typing import Any, Iterator, Optional, Protocol, Literal, Sequence
 from collections.abc import Mapping as _Mapping, Iterable as _Iterable
 
 from ..logutil import get_logger
@@ -19,6 +23,52 @@ class _Writable(Protocol):
 	def isatty(self) -> bool: ...
 
 
+@functools.lru_cache(maxsize=4)
+def _load_palette_theme(theme_path: str, mtime_ns: int) -> dict[str, dict[str, Any]]:
+	"""
+	Load and parse an ANSI theme JSON once per path and modification time.
+
+	The result is shared between printer instances and must be treated as read-only.
+
+	:param theme_path: Absolute path to ``ansi_colors.json``.
+	:param mtime_ns: File modification time; part of the cache key so edits are picked up.
+	:return: Theme dict.
+	"""
+	return RobustConfig().load_json_config(theme_path).to_dict()
+
+
+@functools.lru_cache(maxsize=128)
+def _type_tag_str(t: type) -> str:
+	"""Return the type tag text for *t*, e.g. ``" (int)"`` (built once per type)."""
+	return f" ({t.__name__})"
+
+
+class _BlankPalette(dict):
+	"""Palette used when colors are off: every role resolves to an empty string."""
+	def __missing__(self, key: str) -> str:
+		return ""
+
+
+_BLANK_PALETTE = _BlankPalette()
+
+_SCALAR_BASES = (str, bytes, int, float, bool, type(None))
+_SCALAR_TYPES = frozenset(_SCALAR_BASES)
+
+
+def _is_scalar(x: Any) -> bool:
+	"""
+	Decide if an object is a scalar value (printed directly).
+
+	Scalars are str, bytes, int, float, bool, or None (subclasses included, e.g. NumPy
+	floats). Exact built-in types are answered by a set lookup before the ``isinstance`` walk.
+	Everything else is considered a container.
+
+	:param x: Object to test.
+	:return: True if scalar, False otherwise.
+	"""
+	return type(x) in _SCALAR_TYPES or isinstance(x, _SCALAR_BASES)
+
+
 class Printer:
 	"""
     Color-aware, nest-friendly pretty printer for Python structures.
@@ -49,9 +99,15 @@ class Printer:
 		self._indent_unit = int(indent_unit)
 		self._use_color_flag = bool(use_color)
 		self._ctx_stack: list[dict[str, object]] = []
+		# stream -> isatty() result; streams are held weakly so a recycled id() can never match
+		self._tty_cache: "weakref.WeakKeyDictionary[Any, bool]" = weakref.WeakKeyDictionary()
+		# lines collected during one top-level printer() call, written in a single go
+		self._buf: Optional[list[str]] = None
+		# memoized padding strings, indexed by indent level
+		self._pads: list[str] = [""]
 
 		theme_path = ensure_ansi_colors(prefer=prefer)
-		palette_theme = RobustConfig().load_json_config(theme_path).to_dict()
+		palette_theme = _load_palette_theme(str(theme_path), theme_path.stat().st_mtime_ns)
 		self.palette = self._load_palette(palette_theme)
 
 	def __repr__(self) -> str:
@@ -140,27 +196,19 @@ class Printer:
 		return self.palette
 
 	# --- small helpers ---
-	@staticmethod
-	def _is_scalar(x: Any) -> bool:
-		"""
-        Decide if an object is a scalar value (printed directly).
-
-        Scalars are str, bytes, int, float, bool, or None.
-        Everything else is considered a container.
-
-        :param x: Object to test.
-        :return: True if scalar, False otherwise.
-        """
-		return isinstance(x, (str, bytes, int, float, bool, type(None)))
-
 	def _pad(self, indent: int) -> str:
 		"""
-        Return spaces for the given indent level.
+        Return spaces for the given indent level (memoized per level).
 
         :param indent: Current indent level.
         :return: The actual indent.
         """
-		return " " * (indent * self._indent_unit)
+		pads = self._pads
+		if indent < len(pads):
+			return pads[indent] if indent > 0 else ""
+		while len(pads) <= indent:
+			pads.append(" " * (len(pads) * self._indent_unit))
+		return pads[indent]
 
 	@staticmethod
 	def _type_tag(x: Any, show_types: bool) -> str:
@@ -172,7 +220,7 @@ class Printer:
         :param show_types: Flag controlling type output.
         :return: String like "(str)" or "" if 'show_types=False'.
         """
-		return f" ({type(x).__name__})" if show_types else ""
+		return _type_tag_str(type(x)) if show_types else ""
 
 	@staticmethod
 	def _truncate(s: str, max_str: Optional[int]) -> str:
@@ -187,28 +235,41 @@ class Printer:
 			return s[: max(0, max_str - 1)] + "..."
 		return s
 
-	@staticmethod
-	def _supports_color(stream: _Writable, use_color: bool) -> bool:
+	def _supports_color(self, stream: _Writable, use_color: bool) -> bool:
 		"""
         Determine whether ANSI colors should be enabled.
         Colors are enabled only if:
          - the 'use_color' flag is True, and
          - the output stream is a TTY or colorama is available.
 
+        The ``isatty()`` probe is cached per stream.
+
         :param stream: Output stream (e.g., sys.stdout).
         :param use_color: Boolean flag to allow/disallow colors.
         :return: True if colors are supported, False otherwise.
         """
+		if not use_color:
+			return False
+		try:
+			return self._tty_cache[stream]
+		except (KeyError, TypeError):
+			pass
 		try:
-			return use_color and hasattr(stream, "isatty") and stream.isatty()
+			is_tty = bool(hasattr(stream, "isatty") and stream.isatty())
 		except Exception:
 			return False
+		try:
+			self._tty_cache[stream] = is_tty
+		except TypeError:
+			pass  # not weak-referenceable/hashable: probe again next time
+		return is_tty
 
 	@staticmethod
-	def _normalize_iterable(obj: _Iterable) -> tuple[list[Any], bool, bool]:
+	def _normalize_iterable(obj: _Iterable) -> tuple[Sequence[Any], bool, bool]:
 		"""
-        Normalize an arbitrary iterable into a list and identify its container kind.
+        Normalize an arbitrary iterable into a sequence and identify its container kind.
 
+        Lists and tuples are returned as they are (they are only iterated, never mutated).
         For sets the function attempts to produce a *stable* order (sorted by ``str(x)``),
         falling back to an arbitrary list order if sorting fails. Tuples are reported via
         the ``is_tuple`` flag, so the caller may render different index labels.
@@ -216,146 +277,191 @@ class Printer:
         :param obj: Iterable object to normalize (strings and mappings are handled elsewhere).
         :return: A triple ``(items, is_set, is_tuple)``.
         """
-		is_set = isinstance(obj, set)
-		is_tuple = isinstance(obj, tuple)
-		if is_set:
+		if isinstance(obj, tuple):
+			return obj, False, True
+		if isinstance(obj, list):
+			return obj, False, False
+		if isinstance(obj, set):
 			try:
-				return sorted(obj, key=lambda x: str(x)), True, is_tuple
+				return sorted(obj, key=lambda x: str(x)), True, False
 			except Exception:
-				return list(obj), True, is_tuple
-		if isinstance(obj, (list, tuple)):
-			return list(obj), False, is_tuple
+				return list(obj), True, False
 		# Generic iterables (avoid strings/dicts which are handled elsewhere)
 		try:
-			return list(obj), False, is_tuple
+			return list(obj), False, False
 		except Exception:
-			return [obj], False, is_tuple
+			return [obj], False, False
 
-	def _label_for(self, idx: int, is_tuple: bool, is_set: bool) -> str:
-		"""
-        Build a label for tuple and set iterable items.
-
-        :param idx: Index of item.
-        :param is_tuple: True, if the item is a tuple.
-        :param is_set: True, if the item is a set.
-        :return: Index label to be printed.
-        """
-		if is_tuple:
-			return f"{self.palette['tuple']}({idx}){self.palette['reset']}"
-		if is_set:
-			return f"{self.palette['set']}{{•}}{self.palette['reset']}"
-		return f"{self.palette['list']}[{idx}]{self.palette['reset']}"
-
-	# --- helpers: printers per kind ---
-	def _print_scalar(
+	# --- helpers: rows per kind ---
+	def _scalar_line(
 			self,
 			obj: Any,
 			*,
+			pal: _Mapping[str, str],
 			pad: str,
 			max_str: Optional[int],
-			show_types: bool,
-			stream: _Writable
-	) -> None:
+			show_types: bool
+	) -> str:
 		"""
-        Print a scalar value (str, bytes, int, float, bool, None) on a single line.
+        Format a standalone value (scalar or non-iterable object) as a single line.
 
-        :param obj: Scalar value to print.
+        :param obj: Value to format.
+        :param pal: Effective palette for this call (blank when colors are off).
         :param pad: Left padding (spaces) derived from the current indent.
         :param max_str: Max length for strings; longer strings are truncated with an ellipsis.
         :param show_types: Whether to append a dimmed type tag like "(str)".
-        :param stream: Output stream to write to.
+        :return: Newline-terminated line.
         """
+		reset = pal["reset"]
 		val = self._truncate(obj, max_str) if isinstance(obj, str) else obj
-		type_str = f"{self.palette['type']}{self._type_tag(obj, show_types)}{self.palette['reset']}"
-		print(f"{pad}{self.palette['scalar']}{val}{self.palette['reset']}{type_str}", file=stream)
+		return f"{pad}{pal['scalar']}{val}{reset}{pal['type']}{self._type_tag(obj, show_types)}{reset}\n"
 
-	def _print_mapping(
+	def _mapping_rows(
 			self,
 			mapping: _Mapping,
 			*,
+			pal: _Mapping[str, str],
 			indent: int,
-			sort_keys: bool,
-			show_types: bool,
-			max_str: Optional[int],
-			stream: _Writable
-	) -> None:
+			sort_keys: bool
+	) -> Iterator[tuple[str, Any]]:
 		"""
-        Print a mapping (dict-like). Scalar values are printed inline as 'key: value'.
-        Nested containers are printed on the next line with increased indentation.
+        Prepare the rows of a mapping (dict-like) as ``(head, value)`` pairs, where *head*
+        is the padded, colored key.
 
         :param mapping: The dictionary-like object to print.
-        :param indent: Current indentation level.
+        :param pal: Effective palette for this call (blank when colors are off).
+        :param indent: Indentation level of the rows.
         :param sort_keys: Sort keys alphabetically (safe only if keys are comparable).
-        :param show_types: Whether to append a dimmed type tak for values.
-        :param max_str: Max length for strings; longer strings are truncated.
-        :param stream: Output stream to write to.
+        :return: Iterator over ``(head, value)`` pairs.
         """
 		items = mapping.items()
-		if sort_keys:
-			try:
-				items = sorted(items, key=lambda kv: str(kv[0]))
-			except Exception:
-				# Keep original order when keys are not comparable
-				pass
-
-		pad = self._pad(indent)
-		for k, v in items:
-			key_str = f"{self.palette['key']}{k}{self.palette['reset']}"
-			if self._is_scalar(v):
-				sval = self._truncate(v, max_str) if isinstance(v, str) else v
-				type_str = f"{self.palette['type']}{self._type_tag(v, show_types)}{self.palette['reset']}"
-				print(f"{pad}{key_str}: {self.palette['scalar']}{sval}{self.palette['reset']}{type_str}", file=stream)
+		if sort_keys and len(mapping) > 1:
+			if all(type(k) is str for k in mapping):
+				# str(k) is k: compare the keys directly, no per-key str() call
+				items = sorted(items, key=itemgetter(0))
 			else:
-				print(f"{pad}{key_str}:", file=stream)
-				self.printer(
-					v,
-					indent=indent + 1,
-					sort_keys=sort_keys,
-					show_types=show_types,
-					max_str=max_str,
-					stream=stream
-				)
+				try:
+					items = sorted(items, key=lambda kv: str(kv[0]))
+				except Exception:
+					# Keep original order when keys are not comparable
+					pass
+
+		# Resolve palette roles once per mapping, not per key
+		key_open, reset = pal["key"], pal["reset"]
+		pad = self._pad(indent)
+		return iter([(f"{pad}{key_open}{k}{reset}", v) for k, v in items])
 
-	def _print_iterable(
+	def _iterable_rows(
 			self,
 			iterable: _Iterable,
 			*,
-			indent: int,
-			show_types: bool,
-			max_str: Optional[int],
-			stream: _Writable
-	) -> None:
+			pal: _Mapping[str, str],
+			indent: int
+	) -> Iterator[tuple[str, Any]]:
 		"""
-        Print iterable (list/tuple/set/another sequence). Scalar items are printed inline
-        with an index/label on the same line; nested containers expand with indentation.
+        Prepare the rows of an iterable (list/tuple/set/another sequence) as ``(head, item)``
+        pairs, where *head* is the padded, colored index/label.
 
         :param iterable: The iterable to print (must not be a string/bytes/dict).
-        :param indent: Current indentation level.
-        :param show_types: Whether to append a dimmed type tag for values.
-        :param max_str: Max length for strings; longer strings are truncated.
-        :param stream: Output stream to write to.
+        :param pal: Effective palette for this call (blank when colors are off).
+        :param indent: Indentation level of the rows.
+        :return: Iterator over ``(head, item)`` pairs.
         """
 		norm, is_set, is_tuple = self._normalize_iterable(iterable)
+		reset = pal["reset"]
 		pad = self._pad(indent)
 
-		for idx, item in enumerate(norm):
-			label = self._label_for(idx, is_tuple, is_set)
-			label_col = f"{label}{self.palette['reset']}"
+		# One label template per container: '{•}' for sets, '(idx)' for tuples, '[idx]' otherwise
+		if is_set:
+			return zip(repeat(f"{pad}{pal['set']}{{•}}{reset}{reset}"), norm)
+		if is_tuple:
+			opener, closer = f"{pad}{pal['tuple']}(", f"){reset}{reset}"
+		else:
+			opener, closer = f"{pad}{pal['list']}[", f"]{reset}{reset}"
+		return iter([(f"{opener}{idx}{closer}", item) for idx, item in enumerate(norm)])
 
-			if self._is_scalar(item):
-				sval = self._truncate(item, max_str) if isinstance(item, str) else item
-				type_str = f"{self.palette['type']}{self._type_tag(item, show_types)}{self.palette['reset']}"
-				print(f"{pad}{label_col}: {self.palette['scalar']}{sval}{self.palette['reset']}{type_str}", file=stream)
-			else:
-				print(f"{pad}{label_col}:", file=stream)
-				self.printer(
-					item,
-					indent=indent + 1,
-					sort_keys=True,  # sorting only applies to dicts deeper down
-					show_types=show_types,
-					max_str=max_str,
-					stream=stream
+	def _open_node(
+			self,
+			obj: Any,
+			*,
+			pal: _Mapping[str, str],
+			indent: int,
+			sort_keys: bool,
+			show_types: bool,
+			max_str: Optional[int]
+	) -> Optional[tuple[Iterator[tuple[str, Any]], bool]]:
+		"""
+        Start rendering *obj* at *indent*.
+
+        Containers are not printed here; their rows are returned for the caller's work-stack
+        together with the ``sort_keys`` value their nested children use (mappings pass theirs
+        on, iterables reset it to ``True``). Anything else is emitted as a single line.
+
+        :return: ``(rows, child_sort_keys)`` for containers, ``None`` for standalone values.
+        """
+		if isinstance(obj, _Mapping):
+			return self._mapping_rows(obj, pal=pal, indent=indent, sort_keys=sort_keys), sort_keys
+		if isinstance(obj, _Iterable) and not isinstance(obj, (str, bytes, dict)):
+			# sorting only applies to dicts deeper down
+			return self._iterable_rows(obj, pal=pal, indent=indent), True
+		self._buf.append(
+			self._scalar_line(obj, pal=pal, pad=self._pad(indent), max_str=max_str, show_types=show_types)
+		)
+		return None
+
+	def _render(
+			self,
+			obj: Any,
+			*,
+			pal: _Mapping[str, str],
+			indent: int,
+			sort_keys: bool,
+			show_types: bool,
+			max_str: Optional[int]
+	) -> None:
+		"""
+        Render *obj* into the active buffer with an explicit work-stack (no recursion).
+
+        Each stack frame holds the remaining rows of one container. Scalar rows are emitted
+        inline as ``head: value``; a nested container emits ``head:`` and pushes its own rows,
+        so output keeps the natural depth-first order. *pal* is the palette chosen once by
+        :meth:`printer` (the real one, or a blank one when colors are off).
+
+        :raises RecursionError: If a container (directly or indirectly) contains itself.
+        """
+		opened = self._open_node(
+			obj, pal=pal, indent=indent, sort_keys=sort_keys, show_types=show_types, max_str=max_str
+		)
+		if opened is None:
+			return
+
+		scalar_open, type_open, reset = pal["scalar"], pal["type"], pal["reset"]
+		out = self._buf
+		is_scalar, truncate, type_tag = _is_scalar, self._truncate, self._type_tag
+
+		rows, child_sort = opened
+		stack: list[tuple[Iterator[tuple[str, Any]], int, bool, int]] = [(rows, indent, child_sort, id(obj))]
+		active = {id(obj)}  # containers on the current path (cycle guard)
+		while stack:
+			rows, level, child_sort, _ = stack[-1]
+			for head, v in rows:
+				if is_scalar(v):
+					sval = truncate(v, max_str) if isinstance(v, str) else v
+					out.append(f"{head}: {scalar_open}{sval}{reset}{type_open}{type_tag(v, show_types)}{reset}\n")
+					continue
+
+				out.append(f"{head}:\n")
+				if id(v) in active:
+					raise RecursionError(f"Cyclic reference detected while printing {type(v).__name__} object.")
+				opened = self._open_node(
+					v, pal=pal, indent=level + 1, sort_keys=child_sort, show_types=show_types, max_str=max_str
 				)
+				if opened is not None:
+					stack.append((opened[0], level + 1, opened[1], id(v)))
+					active.add(id(v))
+					break
+			else:
+				active.discard(stack.pop()[3])
 
 	# ----------------- public API -------------------
 	def printer(
@@ -381,7 +487,7 @@ class Printer:
         * Scalars: printed directly; long strings are truncated to 'max_str' characters.
 
         :param obj: Object to be printed.
-        :param indent: Current indentation level (internal for recursion).
+        :param indent: Starting indentation level.
         :param sort_keys: Sort dictionary keys alphabetically (safe if keys are comparable).
         :param show_types: Append the value's type in a dim style, e.g., '(str)'.
         :param max_str: Truncate strings longer than this length with an ellipsis.
@@ -390,38 +496,26 @@ class Printer:
         Notes
         -----
         * Colors automatically fall back to plain text if ANSI is not supported.
+        * Output is buffered and written to *stream* once per top-level call.
         * Errors are logged using 'logging.error(..., exc_info=True)'.
         """
-		enable_color = self._supports_color(stream, self._use_color_flag)
-		orig_palette = self.palette
+		# Pick the palette once; helpers receive it explicitly (no swapping of self.palette)
+		pal = self.palette if self._supports_color(stream, self._use_color_flag) else _BLANK_PALETTE
+		top_level = self._buf is None
+		if top_level:
+			self._buf = []
 		try:
-			if not enable_color:
-				self.palette = {k: "" for k in orig_palette}
-
-			# Mapping
-			if isinstance(obj, _Mapping):
-				self._print_mapping(
-					obj, indent=indent, sort_keys=sort_keys, show_types=show_types,
-					max_str=max_str, stream=stream
-				)
-				return
-
-			# Iterable
-			if isinstance(obj, _Iterable) and not isinstance(obj, (str, bytes, dict)):
-				self._print_iterable(
-					obj, indent=indent, show_types=show_types,
-					max_str=max_str, stream=stream
-				)
-				return
-
-			# Scalar
-			self._print_scalar(
-				obj, pad=self._pad(indent), max_str=max_str, show_types=show_types,
-				stream=stream
-			)
+			self._render(obj, pal=pal, indent=indent, sort_keys=sort_keys, show_types=show_types, max_str=max_str)
 
 		except Exception as e:
 			LOG.error(f"Error while printing object: {e}", exc_info=True)
 			raise
 		finally:
-			self.palette = orig_palette
+			if top_level:
+				# one write per top-level call instead of one per line
+				buf, self._buf = self._buf, None
+				if buf:
+					stream.write("".join(buf))
+					flush = getattr(stream, "flush", None)
+					if flush is not None:
+						flush()
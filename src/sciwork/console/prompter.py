@@ -24,6 +24,15 @@ class _SupportsWriteAndFlush(_SupportsWrite, Protocol):
 
 _Stream = _SupportsWriteAndFlush | TextIO
 
+# (role, palette key it defaults to)
+_PROMPT_ALIASES = (
+	("prompt", "green"),
+	("value", "reset"),
+	("hint", "blue"),
+	("error", "red"),
+	("reset", "reset"),
+)
+
 
 class Prompter(Printer):
 	"""
@@ -44,14 +53,12 @@ class Prompter(Printer):
 		self._ensure_prompt_palette()
 
 	def _ensure_prompt_palette(self) -> None:
-		"""Add prompt-specific semantic roles to the palette (non-destructively)."""
-		pal = dict(self.palette or {})
-		pal.setdefault("prompt", pal.get("green", ""))
-		pal.setdefault("value", pal.get("reset", ""))
-		pal.setdefault("hint", pal.get("blue", ""))
-		pal.setdefault("error", pal.get("red", ""))
-		pal.setdefault("reset", pal.get("reset", ""))
-		self.palette = pal
+		"""Add prompt-specific semantic roles to the palette (existing roles are kept)."""
+		if self.palette is None:
+			self.palette = {}
+		pal = self.palette
+		for role, source in _PROMPT_ALIASES:
+			pal.setdefault(role, pal.get(source, ""))
 
 	def print_lines(self, lines: Iterable[str], *, stream: _Writable = sys.stdout) -> None:
 		"""
@@ -82,6 +89,22 @@ class Prompter(Printer):
 			parts.append(f"{hint_color}(default: {default})")
 		return ((" ".join(parts)) + reset) if parts else ""
 
+	def _compose_prompt(
+			self,
+			message: str,
+			*,
+			default: Optional[str],
+			choices: Optional[Sequence[Any]]
+	) -> str:
+		"""Build the full colored prompt line, e.g. ``Message [a|b] (default: a): ``."""
+		prompt_c = self.palette.get("prompt", "")
+		hint_c = self.palette.get("hint", "")
+		reset = self.palette.get("reset", "")
+
+		hint_suffix = self._build_hint_suffix(default=default, choices=choices, hint_color=hint_c, reset=reset)
+		base = f"{prompt_c}{message}{reset}"
+		return (f"{base} {hint_suffix}" if hint_suffix else base) + ": "
+
 	@staticmethod
 	def _normalize_retries(retries: int) -> int:
 		"""Return a safe, positive number of attempts."""
@@ -153,17 +176,15 @@ class Prompter(Printer):
 		:return: Final (validated and transformed) value.
 		:raises ValueError: If the user exceeds the allowed number of attempts or input is invalid.
 		"""
-		prompt_c = self.palette.get("prompt", "")
-		hint_c = self.palette.get("hint", "")
+		full_prompt = self._compose_prompt(message, default=default, choices=choices)
 		err_c = self.palette.get("error", "")
 		reset = self.palette.get("reset", "")
 
-		hint_suffix = self._build_hint_suffix(default=default, choices=choices, hint_color=hint_c, reset=reset)
-		base = f"{prompt_c}{message}{reset}"
-		full_prompt = (f"{base} {hint_suffix}" if hint_suffix else base) + ": "
-
 		attempts = self._normalize_retries(retries)
-		for _ in range(attempts):
+		for attempt in range(attempts):
+			if attempt:
+				# make the previous error visible before asking again
+				stream.flush()
 			raw = self._readline(input_func, full_prompt)
 
 			if raw == "":
@@ -171,7 +192,7 @@ class Prompter(Printer):
 					return default
 				if allow_empty:
 					return ""
-				print(f"{err_c}Input cannot be empty.{reset}", file=stream, flush=True)
+				stream.write(f"{err_c}Input cannot be empty.{reset}\n")
 				continue
 
 			try:
@@ -180,7 +201,8 @@ class Prompter(Printer):
 				self._run_validator(value, validate)
 				return value
 			except Exception as exc:
-				print(f"{err_c}{exc}{reset}", file=stream, flush=True)
+				stream.write(f"{err_c}{exc}{reset}\n")
+		stream.flush()
 		raise ValueError("Too many invalid attempts.")
 
 	def confirm(
@@ -208,16 +230,35 @@ class Prompter(Printer):
 		:return: ``True`` for yes, ``False`` for no.
 		"""
 		allowed = tuple(x.lower() for x in (*yes_values, *no_values))
+		yes_set = frozenset(v.lower() for v in yes_values)
+		no_set = frozenset(v.lower() for v in no_values)
 		y0 = next(iter(yes_values), "Y")
 		n0 = next(iter(no_values), "N")
 		yn_hint = "/".join([y0.upper() if default else y0, n0 if default else n0.upper()])
 
-		ans = self.prompt(
-			f"{message} {yn_hint}",
-			default=("y" if default else "n"),
-			choices=allowed,
-			transform=transform,
-			stream=stream,
-			input_func=input_func
+		# A dedicated read loop: no generic transform/choices/validator plumbing per answer
+		full_prompt = self._compose_prompt(
+			f"{message} {yn_hint}", default=("y" if default else "n"), choices=allowed
 		)
-		return ans in {v.lower() for v in yes_values}
+		err_c = self.palette.get("error", "")
+		reset = self.palette.get("reset", "")
+		choices_msg = f"{err_c}Please choose one of: {', '.join(allowed)}.{reset}\n"
+
+		for attempt in range(3):
+			if attempt:
+				stream.flush()
+			raw = self._readline(input_func, full_prompt)
+			if raw == "":
+				return default
+			try:
+				ans = transform(raw)
+				if ans in yes_set:
+					return True
+				if ans in no_set:
+					return False
+			except Exception as exc:
+				stream.write(f"{err_c}{exc}{reset}\n")
+				continue
+			stream.write(choices_msg)
+		stream.flush()
+		raise ValueError("Too many invalid attempts.")
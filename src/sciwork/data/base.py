@@ -4,10 +4,12 @@
 
 from __future__ import annotations
 
+from collections import Counter
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Dict, Iterable, List, Optional, Sequence, TYPE_CHECKING
+from typing import Dict, List, Optional, Sequence, Tuple, TYPE_CHECKING
 
+from ..imports import numpy as np  # type: ignore
 from ..imports import pandas as pd  # type: ignore
 from ..logutil import get_logger
 from .config import DataHandlerConfig, FilterSetConfig
@@ -16,9 +18,10 @@ LOG = get_logger(__name__)
 
 if TYPE_CHECKING:  # pragma no cover - only for type checkers
 	from ..fs.load import Load
+	from .filters import _FilterCache
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class DataSet:
 	"""Container representing a named collection of data frames."""
 
@@ -35,6 +38,7 @@ class _DataHandlerBase:
 		self.filtered_filenames: Dict[str, List[str]] = {}
 		self.data_sets: Dict[str, List[pd.DataFrame]] = {}
 		self._path_loader: Optional["Load"] = None
+		self._filter_cache: Optional["_FilterCache"] = None
 		self._validate_root()
 
 	# -----------------------------------------------------
@@ -58,8 +62,15 @@ class _DataHandlerBase:
 			return list(self.data_sets.keys())
 		return [f"Set {num}" for num in set_numbers]
 
+	@staticmethod
+	def _unique_columns(column_indices: Sequence[int]) -> Tuple[List[int], np.ndarray]:
+		"""Return distinct column indices in order together with how often each was given."""
+		counts = Counter(column_indices)
+		return list(counts), np.fromiter(counts.values(), dtype=np.intp, count=len(counts))
+
 	def _register_dataset(self, set_config: FilterSetConfig, frames: Sequence[pd.DataFrame]) -> None:
-		self.data_sets[self._set_key(set_config)] = list(frames)
+		# Lists are stored as given (callers hand over freshly built lists); other sequences are copied
+		self.data_sets[self._set_key(set_config)] = frames if isinstance(frames, list) else list(frames)
 
 	def get_dataset(self, set_number: int) -> DataSet:
 		"""Return a dataset by numeric identifier."""
@@ -69,9 +80,3 @@ class _DataHandlerBase:
 		if frames is None:
 			raise KeyError(f"Dataset {set_number} has not been loaded.")
 		return DataSet(name=key, frames=frames)
-
-	# -----------------------------------------------------
-	@staticmethod
-	def _iter_files(folder: Path, patterns: Iterable[str]) -> Iterable[Path]:
-		for pattern in patterns:
-			yield from folder.glob(pattern)
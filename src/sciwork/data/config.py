@@ -5,12 +5,14 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, Iterable, Iterator, List, Optional, Tuple
 
 from ..config import bootstrap_json_file
 from ..config import store, templates
 from ..logutil import get_logger
+from .utils import dedup_ordered
 
 LOG = get_logger(__name__)
 
@@ -36,7 +38,7 @@ and individual keywords by commas, matching the legacy utility format.
 """
 
 
-@dataclass
+@dataclass(frozen=True)
 class FilterSetConfig:
 	"""Keyword/metadata configuration for a single dataset group."""
 
@@ -47,7 +49,7 @@ class FilterSetConfig:
 	sheet_name: Optional[str] = None
 
 
-@dataclass
+@dataclass(frozen=True)
 class DataHandlerConfig:
 	"""Structured configuration parsed from INI/CLI parameters."""
 
@@ -58,10 +60,10 @@ class DataHandlerConfig:
 
 	@staticmethod
 	def _split_csv(value: str, *, sep: str = ",") -> Tuple[str, ...]:
-		items = [chunk.strip() for chunk in value.split(sep)] if value else []
-		filtered = [item for item in items if item]
-		unique_ordered = list(dict.fromkeys(filtered))
-		return tuple(unique_ordered)
+		if not value:
+			return tuple()
+		stripped = (chunk.strip() for chunk in value.split(sep))
+		return tuple(dedup_ordered(item for item in stripped if item))
 
 	@staticmethod
 	def _split_optional(value: str, *, sep: str = ";") -> Tuple[Optional[str], ...]:
@@ -82,8 +84,28 @@ class DataHandlerConfig:
 			header_rows: str = "",
 			sheet_names: str = ""
 	) -> "DataHandlerConfig":
-		"""Parse the legacy comma/semicolon separated strings."""
+		"""
+		Parse the legacy comma/semicolon separated strings.
+
+		Results are memoized per argument combination; the returned config is
+		immutable, so handlers built from the same strings share one instance.
+		"""
+		return _from_strings_cached(
+			cls, data_folderpath, general_keywords, general_antikeywords,
+			keywords, antikeywords, header_rows, sheet_names
+		)
 
+	@classmethod
+	def _parse_strings(
+			cls,
+			data_folderpath: str,
+			general_keywords: str,
+			general_antikeywords: str,
+			keywords: str,
+			antikeywords: str,
+			header_rows: str,
+			sheet_names: str
+	) -> "DataHandlerConfig":
 		general_kw = cls._split_csv(general_keywords)
 		general_akw = cls._split_csv(general_antikeywords)
 
@@ -151,6 +173,11 @@ class DataHandlerConfig:
 		return iter(self.sets)
 
 
+@lru_cache(maxsize=128)
+def _from_strings_cached(cls: type, *args: str) -> DataHandlerConfig:
+	return cls._parse_strings(*args)
+
+
 def bootstrap_data_handler_config(
 		*,
 		prefer: str = "project",
@@ -4,13 +4,21 @@
 
 from __future__ import annotations
 
+import fnmatch
+import os
+import re
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from functools import lru_cache
+from itertools import repeat
 from pathlib import Path
-from typing import Any, Iterable, List, Sequence, Tuple, TYPE_CHECKING
+from typing import Any, Callable, FrozenSet, Iterable, List, Sequence, Tuple, TYPE_CHECKING
 
-from ..imports import pandas as pd  # type: ignore
+from ..imports import ahocorasick, pandas as pd  # type: ignore
 from ..logutil import get_logger
 from .base import _DataHandlerBase
-from .config import FilterSetConfig
+from .config import DataHandlerConfig, FilterSetConfig
+from .utils import dedup_ordered
 
 LOG = get_logger(__name__)
 
@@ -18,24 +26,88 @@ if TYPE_CHECKING:  # pragma no cover - for static analysis only
 	from ..fs.load import Load
 
 
+@lru_cache(maxsize=64)
+def _glob_matcher(pattern: str) -> Callable[[str], Any]:
+	"""Compile a flat glob pattern into a match function for normcased names."""
+	return re.compile(fnmatch.translate(os.path.normcase(pattern))).match
+
+
+@dataclass(frozen=True)
+class _FilterCache:
+	"""Lower-cased per-set tokens and matchers derived from one configuration."""
+
+	config: DataHandlerConfig
+	sets: Tuple[Tuple[FilterSetConfig, FrozenSet[str], FrozenSet[str]], ...]
+	kw_hits: Callable[[str], FrozenSet[str]]
+	akw_hits: Callable[[str], FrozenSet[str]]
+
+
 class _FilterAndLoadMixin(_DataHandlerBase):
 	"""Augment the base handler with file filtering and loading utilities."""
 
 	# --- Helpers ---
 	@staticmethod
-	def _gather_files(folder: Path, patterns: Iterable[str]) -> List[Path]:
+	def _scandir_filtered(folder: Path, patterns: Sequence[str]) -> List[Path]:
+		"""
+		Return files directly under *folder* matching any of the flat *patterns*.
+
+		The directory is listed once with :func:`os.scandir` and the cached
+		``DirEntry.is_file()`` result replaces a ``stat()`` per path. Order matches
+		the previous per-pattern ``sorted(folder.glob(pattern))`` concatenation.
+		"""
+		with os.scandir(folder) as it:
+			files = sorted(Path(entry.path) for entry in it if entry.is_file())
+		names = [os.path.normcase(path.name) for path in files]
+
+		matchers = [_glob_matcher(pattern) for pattern in patterns]
+		return dedup_ordered(
+			path
+			for match in matchers
+			for path, name in zip(files, names)
+			if match(name)
+		)
+
+	@classmethod
+	def _gather_files(cls, folder: Path, patterns: Iterable[str]) -> List[Path]:
+		patterns = list(patterns)
+		if not any("/" in p or os.sep in p or "**" in p for p in patterns):
+			return cls._scandir_filtered(folder, patterns)
+
+		# Patterns reaching into subdirectories still need the recursive glob
 		files: List[Path] = []
 		for pattern in patterns:
 			files.extend(sorted(folder.glob(pattern)))
-		unique = list(dict.fromkeys(files))
-		return [path for path in unique if path.is_file()]
+		return [path for path in dedup_ordered(files) if path.is_file()]
 
 	@staticmethod
-	def _filename_matches(name: str, keywords: Sequence[str], antikeywords: Sequence[str]) -> bool:
-		lowered = name.lower()
-		kw_pass = all(kw.lower() in lowered for kw in keywords) if keywords else True
-		akw_pass = not any(akw.lower() in lowered for akw in antikeywords) if antikeywords else True
-		return kw_pass and akw_pass
+	def _token_matcher(tokens: Iterable[str]) -> Callable[[str], FrozenSet[str]]:
+		"""
+		Build a callable returning the *tokens* contained in a lower-cased name.
+
+		All tokens are scanned in a single pass with a pyahocorasick automaton when
+		the package is installed; otherwise one compiled alternation rejects names
+		without any hit before the individual substring checks run.
+		"""
+		ordered = tuple(dedup_ordered(token.lower() for token in tokens))
+		if not ordered:
+			return lambda name: frozenset()
+
+		try:
+			automaton = ahocorasick.Automaton()
+			for token in ordered:
+				automaton.add_word(token, token)
+			automaton.make_automaton()
+		except ImportError:
+			search = re.compile("|".join(map(re.escape, ordered))).search
+
+			def hits(name: str) -> FrozenSet[str]:
+				if search(name) is None:
+					return frozenset()
+				return frozenset(token for token in ordered if token in name)
+
+			return hits
+
+		return lambda name: frozenset(token for _, token in automaton.iter(name))
 
 	@staticmethod
 	def _merge_tokens(primary: Sequence[str], secondary: Sequence[str]) -> Tuple[str, ...]:
@@ -46,6 +118,36 @@ class _FilterAndLoadMixin(_DataHandlerBase):
 					ordered.append(token)
 		return tuple(ordered)
 
+	def _refresh_filter_cache(self) -> _FilterCache:
+		"""
+		Rebuild the per-set keyword sets and matchers from ``self.config``.
+
+		:meth:`filter_datafiles` rebuilds automatically when ``config`` is replaced;
+		call this after mutating the current configuration in place.
+		"""
+		set_filters = []
+		for set_config in self.config.iter_sets():
+			effective_kw = self._merge_tokens(
+				self.config.general_keywords, set_config.keywords
+			)
+			effective_akw = self._merge_tokens(
+				self.config.general_antikeywords, set_config.antikeywords
+			)
+			set_filters.append((
+				set_config,
+				frozenset(kw.lower() for kw in effective_kw),
+				frozenset(akw.lower() for akw in effective_akw),
+			))
+
+		cache = _FilterCache(
+			config=self.config,
+			sets=tuple(set_filters),
+			kw_hits=self._token_matcher(kw for _, kws, _ in set_filters for kw in kws),
+			akw_hits=self._token_matcher(akw for _, _, akws in set_filters for akw in akws),
+		)
+		self._filter_cache = cache
+		return cache
+
 	def _ensure_loader(self) -> "Load":
 		loader = self._path_loader
 		if loader is None:
@@ -68,17 +170,8 @@ class _FilterAndLoadMixin(_DataHandlerBase):
 			LOG.debug("Loaded %s via any_data_loader with type %s", path, type(loaded))
 		return loaded
 
-	# --------
-	def filter_datafiles(self, patterns: Sequence[str] | None = None) -> None:
-		"""
-		Populate ``filtered_files`` and ``filtered_filenames`` per dataset.
-
-		:param patterns: Optional glob patterns that are used to locate candidate files.
-			When omitted, every file directly under ``data_folderpath`` is considered.
-		:raises FileNotFoundError: If no files matching the provided patterns are found
-			in the configured directory.
-		"""
-
+	def _match_sets(self, patterns: Sequence[str] | None) -> List[Tuple[FilterSetConfig, List[Path]]]:
+		"""Match candidate files against every set, record them and return ``(set, files)`` pairs."""
 		folder = self.config.data_folderpath
 		if patterns is None:
 			patterns = ["*"]
@@ -90,29 +183,79 @@ class _FilterAndLoadMixin(_DataHandlerBase):
 		self.filtered_files = {}
 		self.filtered_filenames = {}
 
-		for set_config in self.config.iter_sets():
-			effective_kw = self._merge_tokens(
-				self.config.general_keywords, set_config.keywords
-			)
-			effective_akw = self._merge_tokens(
-				self.config.general_antikeywords, set_config.antikeywords
-			)
+		cache = self._filter_cache
+		if cache is None or cache.config is not self.config:
+			cache = self._refresh_filter_cache()
 
-			matched: List[Path] = []
-			for file in all_files:
-				name = file.name.lower()
-				if self._filename_matches(name, effective_kw, effective_akw):
-					matched.append(file)
+		# Scan every filename once against the union of all sets' tokens
+		hits = []
+		for file in all_files:
+			name = file.name.lower()
+			hits.append((cache.kw_hits(name), cache.akw_hits(name)))
+
+		jobs: List[Tuple[FilterSetConfig, List[Path]]] = []
+		for set_config, keywords, antikeywords in cache.sets:
+			matched = [
+				file for file, (kw_found, akw_found) in zip(all_files, hits)
+				if keywords <= kw_found and antikeywords.isdisjoint(akw_found)
+			]
 
 			key = self._set_key(set_config)
 			self.filtered_files[key] = matched
 			self.filtered_filenames[key] = [path.name for path in matched]
 			LOG.debug("Filtered %d files for %s", len(matched), key)
+			jobs.append((set_config, matched))
+		return jobs
+
+	def _load_sets(self, jobs: Sequence[Tuple[FilterSetConfig, List[Path]]], *, parallel: bool) -> None:
+		"""Load the files of every ``(set, files)`` job and register the resulting datasets."""
+		total = sum(len(files) for _, files in jobs)
 
-	def data_loader(self) -> None:
+		if parallel and total > 1:
+			# Create the shared loader up front so worker threads never race its lazy init
+			self._ensure_loader()
+			workers = min(32, (os.cpu_count() or 1) * 4, total)
+			with ThreadPoolExecutor(max_workers=workers) as executor:
+				loaded = [
+					executor.map(self._load_single_file, files, repeat(set_config))
+					for set_config, files in jobs
+				]
+				results = [list(frames) for frames in loaded]
+		else:
+			results = [
+				[self._load_single_file(path, set_config) for path in files]
+				for set_config, files in jobs
+			]
+
+		for (set_config, _), frames in zip(jobs, results):
+			if not frames:
+				LOG.warning("No data loaded for %s", self._set_key(set_config))
+			self._register_dataset(set_config, frames)
+
+	def _filter_and_load_fused(self, *, parallel: bool = True) -> None:
+		"""Filter and load in one walk over the sets (the ``auto_load`` path)."""
+		self._load_sets(self._match_sets(None), parallel=parallel)
+
+	# --------
+	def filter_datafiles(self, patterns: Sequence[str] | None = None) -> None:
+		"""
+		Populate ``filtered_files`` and ``filtered_filenames`` per dataset.
+
+		:param patterns: Optional glob patterns that are used to locate candidate files.
+			When omitted, every file directly under ``data_folderpath`` is considered.
+		:raises FileNotFoundError: If no files matching the provided patterns are found
+			in the configured directory.
+		"""
+		self._match_sets(patterns)
+
+	def data_loader(self, *, parallel: bool = True) -> None:
 		"""
 		Load filtered files into adequate data structures.
 
+		:param parallel: When ``True`` (default), files are read concurrently on a
+			thread pool so that disk I/O overlaps; frames keep the filtered order.
+			Pass ``False`` to load strictly one file after another.
+
 		Notes
 		-----
 		File parsing is delegated to :meth:`sciwork.fs.load.Load.any_data_loader`
@@ -123,10 +266,8 @@ class _FilterAndLoadMixin(_DataHandlerBase):
 		if not self.filtered_files:
 			self.filter_datafiles()
 
-		for set_config in self.config.iter_sets():
-			key = self._set_key(set_config)
-			files = self.filtered_files.get(key, [])
-			frames = [self._load_single_file(path, set_config) for path in files]
-			if not frames:
-				LOG.warning("No data loaded for %s", key)
-			self._register_dataset(set_config, frames)
+		jobs = [
+			(set_config, self.filtered_files.get(self._set_key(set_config), []))
+			for set_config in self.config.iter_sets()
+		]
+		self._load_sets(jobs, parallel=parallel)
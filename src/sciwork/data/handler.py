@@ -45,8 +45,7 @@ class DataHandler(DataOps):
 			config = DataHandlerConfig.from_strings(**legacy_kwargs)
 		super().__init__(config)
 		if auto_load:
-			self.filter_datafiles()
-			self.data_loader()
+			self._filter_and_load_fused()
 
 	@classmethod
 	def from_ini(
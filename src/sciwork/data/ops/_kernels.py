@@ -0,0 +1,88 @@
+# src/sciwork/data/ops/_kernels.py
+
+"""Numeric inner loops shared by the data operation mixins."""
+
+from __future__ import annotations
+
+from functools import lru_cache
+from typing import Callable
+
+from ...imports import numba  # type: ignore
+from ...imports import numpy as np  # type: ignore
+from ...logutil import get_logger
+
+LOG = get_logger(__name__)
+
+__all__ = ["segmented_subtract"]
+
+
+def _segmented_subtract_numpy(
+		data: np.ndarray,
+		blank: np.ndarray,
+		indices: np.ndarray,
+		fractions: np.ndarray,
+		out: np.ndarray
+) -> None:
+	previous_end = -1
+	for k in range(len(indices) - 1):
+		start, end = indices[k], indices[k + 1]
+		segment = out[start:end]
+		np.subtract(data[start:end], blank[start:end] * fractions[k], out=segment)
+		if previous_end >= 0 and start < end:
+			# Leading empty segments wrote nothing: chain onto 0, not onto out[-1]
+			anchor = out[previous_end - 1] if previous_end > 0 else 0.0
+			segment += anchor - segment[0]
+		previous_end = end
+
+
+def _segmented_subtract_loop(data, blank, indices, fractions, out):  # pragma: no cover - compiled
+	previous_end = -1
+	for k in range(len(indices) - 1):
+		start = indices[k]
+		end = indices[k + 1]
+		fraction = fractions[k]
+		for i in range(start, end):
+			out[i] = data[i] - blank[i] * fraction
+		if previous_end >= 0 and start < end:
+			anchor = out[previous_end - 1] if previous_end > 0 else 0.0
+			delta = anchor - out[start]
+			for i in range(start, end):
+				out[i] += delta
+		previous_end = end
+
+
+@lru_cache(maxsize=1)
+def _segmented_kernel() -> Callable[..., None]:
+	"""Return the Numba-compiled kernel, or the NumPy loop when Numba is missing."""
+	try:
+		return numba.njit(cache=True, nogil=True)(_segmented_subtract_loop)
+	except ImportError:
+		LOG.debug("numba not available; using the NumPy segmented subtraction")
+		return _segmented_subtract_numpy
+
+
+def segmented_subtract(
+		data: np.ndarray,
+		blank: np.ndarray,
+		indices: np.ndarray,
+		fractions: np.ndarray,
+		out: np.ndarray
+) -> None:
+	"""
+	Write ``data - blank * fraction`` segment by segment into ``out``.
+
+	Every segment after the first is shifted so that it starts where the
+	previous one ended, keeping the subtracted curve continuous.
+
+	:param data: Float column to subtract from.
+	:param blank: Float blank column, at least as long as ``data``.
+	:param indices: Segment boundaries, starting with ``0`` and ending with ``len(data)``.
+	:param fractions: One blank multiplier per segment.
+	:param out: Preallocated float array shaped like ``data``.
+	:raises ValueError: If ``blank`` is shorter than ``data``.
+	"""
+	if blank.shape[0] < data.shape[0]:
+		raise ValueError(
+			f"Blank column has {blank.shape[0]} rows but the data column has {data.shape[0]}."
+		)
+	_segmented_kernel()(data, blank, indices, fractions, out)
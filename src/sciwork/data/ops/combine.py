@@ -4,12 +4,13 @@
 
 from __future__ import annotations
 
+import warnings
 from typing import List, Sequence, Optional, Literal
 
 from ...imports import numpy as np  # type: ignore
 from ...imports import pandas as pd  # type: ignore
-from ...stats.outliers import outliers_iqr
 from ..filters import _FilterAndLoadMixin
+from ..utils import dedup_ordered
 
 __all__ = ["Combine"]
 
@@ -43,68 +44,122 @@ class Combine(_FilterAndLoadMixin):
 		if not dataset.frames:
 			raise ValueError(f"Set {set_number} is empty; load data first.")
 
-		indices = list(dict.fromkeys(column_indices))
+		indices = dedup_ordered(column_indices)
 		if not indices:
 			raise ValueError("column_indices must contain at least one entry.")
 
-		pieces: List[pd.DataFrame] = []
-		if x_column is not None:
-			pieces.append(dataset.frames[0].iloc[:, [x_column]].copy())
+		frames = dataset.frames
+		max_index = max(indices)
+		if any(max_index >= frame.shape[1] for frame in frames):
+			raise IndexError("column index out of range for frame")
 
-		for frame in dataset.frames:
-			if max(indices) >= frame.shape[1]:
-				raise IndexError("column index out of range for frame")
-			pieces.append(frame.iloc[:, indices].reset_index(drop=True))
+		combined = self._concatenate_uniform(frames, indices, x_column)
+		if combined is None:
+			pieces: List[pd.DataFrame] = []
+			if x_column is not None:
+				pieces.append(frames[0].iloc[:, [x_column]].copy())
+			for frame in frames:
+				pieces.append(frame.iloc[:, indices].reset_index(drop=True))
+			combined = pd.concat(pieces, axis=1, ignore_index=True)
 
-		combined = pd.concat(pieces, axis=1, ignore_index=True)
 		self.data_sets[dataset.name] = [combined]
 		return combined
 
 	@staticmethod
-	def _coefficient_of_variation(arr: np.ndarray) -> float:
-		if arr.size == 0:
-			return float("nan")
-		mean = float(np.mean(arr))
-		if np.isclose(mean, 0.0):
-			return float("nan")
-		return float(np.std(arr, ddof=0) / mean)
+	def _concatenate_uniform(
+			frames: Sequence[pd.DataFrame],
+			indices: Sequence[int],
+			x_column: Optional[int]
+	) -> Optional[pd.DataFrame]:
+		"""
+		Copy the selected columns into one preallocated array when that is lossless.
+
+		Applies when every frame has the same length and a default ``RangeIndex``, and
+		all selected columns share one numeric dtype. Returns ``None`` otherwise so the
+		caller can fall back to ``pd.concat`` with its index alignment and per-column dtypes.
+		"""
+		first = frames[0]
+		n_rows = first.shape[0]
+		if not first.index.equals(pd.RangeIndex(n_rows)):
+			return None
+		if any(frame.shape[0] != n_rows for frame in frames):
+			return None
+
+		dtypes = {dtype for frame in frames for dtype in frame.dtypes.iloc[indices]}
+		if x_column is not None:
+			dtypes.add(first.dtypes.iloc[x_column])
+		if len(dtypes) != 1:
+			return None
+		dtype = dtypes.pop()
+		if not isinstance(dtype, np.dtype) or dtype.kind not in "biufc":
+			return None
+
+		offset = 0 if x_column is None else 1
+		out = np.empty((n_rows, offset + len(indices) * len(frames)), dtype=dtype)
+		if x_column is not None:
+			out[:, 0] = first.iloc[:, x_column].to_numpy()
+		for frame in frames:
+			for column in indices:
+				out[:, offset] = frame.iloc[:, column].to_numpy()
+				offset += 1
+		return pd.DataFrame(out, copy=False)
+
+	@staticmethod
+	def _coefficient_of_variation(masked: np.ndarray) -> np.ndarray:
+		mean = np.nanmean(masked, axis=1)
+		std = np.nanstd(masked, axis=1, ddof=0)
+		out = np.full_like(mean, np.nan)
+		np.divide(std, mean, out=out, where=~np.isclose(mean, 0.0) & np.isfinite(mean))
+		return out
 
 	@staticmethod
+	def _mask_row_outliers(arr: np.ndarray, *, threshold: float, max_iterations: int = 5) -> np.ndarray:
+		"""
+		Replace IQR outliers with NaN row by row, mirroring
+		:func:`~sciwork.stats.outliers.outliers_iqr`.
+
+		Quartiles are recomputed for all rows at once on every pass until no row
+		loses another value or ``max_iterations`` is reached.
+		"""
+		masked = arr.copy()
+		for _ in range(max_iterations):
+			q1, q3 = np.nanpercentile(masked, [25, 75], axis=1, keepdims=True)
+			iqr = q3 - q1
+			outliers = (masked < q1 - threshold * iqr) | (masked > q3 + threshold * iqr)
+			if not outliers.any():
+				break
+			masked[outliers] = np.nan
+		return masked
+
+	@classmethod
 	def _compute_row_statistics(
+			cls,
 			values: pd.DataFrame,
 			*,
 			option: Literal["average", "sum", "min", "max", "std", "median", "coeff_var"],
 			threshold: float
 	) -> pd.Series:
-		allowed = {
-			"average": "mean",
-			"sum": "sum",
-			"min": "min",
-			"max": "max",
-			"std": "std",
-			"median": "median",
-			"coeff_var": "coeff_var"
-		}
-		if option not in allowed:
-			raise ValueError(f"'option' must be one of {allowed.keys()}: {option}")
-
-		filtered = values.apply(
-			lambda row: outliers_iqr(row.astype(float), threshold=threshold), axis=1
-		)
-
-		computations = {
-			"average": filtered.apply(np.mean),
-			"sum": filtered.apply(np.sum),
-			"min": filtered.apply(np.min),
-			"max": filtered.apply(np.max),
-			"std": filtered.apply(np.std, ddof=0),
-			"median": filtered.apply(np.median),
-			"coeff_var": filtered.apply()
+		reducers = {
+			"average": np.nanmean,
+			"sum": np.nansum,
+			"min": np.nanmin,
+			"max": np.nanmax,
+			"std": lambda masked, axis: np.nanstd(masked, axis=axis, ddof=0),
+			"median": np.nanmedian,
+			"coeff_var": lambda masked, axis: cls._coefficient_of_variation(masked)
 		}
-
-		series = computations[option]
-		series = series.replace({np.inf: np.nan, -np.inf: np.nan})
-		return series
+		if option not in reducers:
+			raise ValueError(f"'option' must be one of {reducers.keys()}: {option}")
+
+		arr = values.to_numpy(dtype=np.float64)
+		with warnings.catch_warnings(), np.errstate(invalid="ignore"):
+			# Rows left without inliers reduce to NaN; the empty-slice warnings are noise here
+			warnings.simplefilter("ignore", RuntimeWarning)
+			masked = cls._mask_row_outliers(arr, threshold=threshold)
+			result = reducers[option](masked, axis=1)
+
+		result[~np.isfinite(result)] = np.nan
+		return pd.Series(result, index=values.index)
 
 	def rows_param_in_dataframe(
 			self,
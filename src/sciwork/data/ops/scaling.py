@@ -6,8 +6,10 @@ from __future__ import annotations
 
 from typing import Sequence, Optional, Tuple
 
+from ...imports import numpy as np  # type: ignore
 from ...imports import pandas as pd  # type: ignore
 from ..filters import _FilterAndLoadMixin
+from ..utils import dedup_ordered
 
 __all__ = ["Scaling"]
 
@@ -16,6 +18,13 @@ class Scaling(_FilterAndLoadMixin):
 	"""Provide scaling, normalization, and offset utilities."""
 
 	# --- Helpers ---
+	@staticmethod
+	def _nan_min_max(values: np.ndarray) -> Tuple[float, float]:
+		"""Return ``(min, max)`` ignoring NaN like ``Series.min/max``; NaN when nothing is left."""
+		if values.size == 0:
+			return float("nan"), float("nan")
+		return float(np.fmin.reduce(values)), float(np.fmax.reduce(values))
+
 	def _max_range_across_sets(
 			self, set_numbers: Sequence[int], column_indices: Sequence[int]
 	) -> float:
@@ -42,9 +51,12 @@ class Scaling(_FilterAndLoadMixin):
 			raise TypeError(f"'factor' must be metric (int, float): {type(factor)}")
 
 		dataset = self.get_dataset(set_number)
+		start = 0 if include_x_column else 1
 		for frame in dataset.frames:
-			start = 0 if include_x_column else 1
-			frame.iloc[:, start:] = frame.iloc[:, start:] * factor
+			if frame.shape[1] <= start:
+				continue
+			# One block product and one assignment instead of a scaled DataFrame copy
+			frame.iloc[:, start:] = frame.iloc[:, start:].to_numpy() * factor
 
 	def normalize_data(
 			self,
@@ -61,23 +73,28 @@ class Scaling(_FilterAndLoadMixin):
 			ref_set, ref_df, ref_col = reference_data
 			ref_dataset = self.get_dataset(ref_set)
 			reference_frame = ref_dataset.frames[ref_df]
-			series = reference_frame.iloc[:, ref_col].astype(float)
-			new_min_max = (float(series.min()), float(series.max()))
+			new_min_max = self._nan_min_max(reference_frame.iloc[:, ref_col].to_numpy(dtype=np.float64))
+
+		min_val, max_val = new_min_max
+		span = max_val - min_val
+		if span == 0:
+			raise ValueError("Normalization range span ('new_min_max' subtraction) must be non-zero.")
 
 		for key in target_sets:
 			frames = self.data_sets.get(key, [])
 			for frame in frames:
 				for column in column_indices:
-					series = frame.iloc[:, column].astype(float)
-					min_val, max_val = new_min_max
-					span = max_val - min_val
-					if span == 0:
-						raise ValueError("Normalization range span ('new_min_max' subtraction) must be non-zero.")
-					current_span = float(series.max()) - float(series.min())
+					data = frame.iloc[:, column].to_numpy(dtype=np.float64)
+					lo, hi = self._nan_min_max(data)
+					current_span = hi - lo
 					if current_span == 0:
 						continue
-					normalized = (series - series.min()) / current_span
-					frame.iloc[:, column] = normalized * span + min_val
+					out = np.empty_like(data)
+					np.subtract(data, lo, out=out)
+					np.divide(out, current_span, out=out)
+					np.multiply(out, span, out=out)
+					np.add(out, min_val, out=out)
+					frame.iloc[:, column] = out
 
 	def factorize_data(
 			self,
@@ -94,18 +111,25 @@ class Scaling(_FilterAndLoadMixin):
 		if discrete_factorization:
 			max_range = self._max_range_across_sets(set_numbers, column_indices)
 
+		columns = dedup_ordered(column_indices)
 		for set_number in set_numbers:
 			dataset = self.get_dataset(set_number)
+			if not columns:
+				continue
 			for frame in dataset.frames:
+				column_max = dict(zip(columns, frame.iloc[:, columns].max().tolist()))
+				added = dict.fromkeys(columns, 0.0)
 				for column in column_indices:
 					if discrete_factorization:
 						offset = total_offset
 						total_offset += max_range * scaling_factor
 					else:
-						column_max = float(frame.iloc[:, column].max())
 						offset = total_offset
-						total_offset = (column_max + total_offset) * scaling_factor
-					frame.iloc[:, column] = frame.iloc[:, column] + offset
+						# A repeated index sees the offsets already applied to its column
+						total_offset = (column_max[column] + added[column] + total_offset) * scaling_factor
+					added[column] += offset
+				offsets = np.fromiter((added[column] for column in columns), dtype=float, count=len(columns))
+				frame.iloc[:, columns] = frame.iloc[:, columns].to_numpy() + offsets
 
 		return total_offset if not discrete_factorization else len(set_numbers) * max_range * scaling_factor
 
@@ -117,8 +141,11 @@ class Scaling(_FilterAndLoadMixin):
 	) -> None:
 		"""Add ``value`` to each selected column across ``set_numbers``."""
 
+		columns, counts = self._unique_columns(column_indices)
+		increments = counts * value
 		for set_number in set_numbers:
 			dataset = self.get_dataset(set_number)
+			if not columns:
+				continue
 			for frame in dataset.frames:
-				for column in column_indices:
-					frame.iloc[:, column] = frame.iloc[:, column] + value
+				frame.iloc[:, columns] = frame.iloc[:, columns].to_numpy() + increments
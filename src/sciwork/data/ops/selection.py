@@ -6,6 +6,7 @@ from __future__ import annotations
 
 from typing import Sequence, Optional
 
+from ...imports import numpy as np  # type: ignore
 from ...imports import pandas as pd  # type: ignore
 from ..filters import _FilterAndLoadMixin
 
@@ -15,6 +16,16 @@ __all__ = ["Selection"]
 class Selection(_FilterAndLoadMixin):
 	"""Provide helpers to keep only rows within requested bounds."""
 
+	@staticmethod
+	def _crop_frame(df: pd.DataFrame, column_index: int, range_min: float, range_max: float) -> pd.DataFrame:
+		column = df.iloc[:, column_index].to_numpy()
+		mask = (column >= range_min) & (column <= range_max)
+		if mask.all() and df.index.equals(pd.RangeIndex(len(df))):
+			return df
+		if not mask.any():
+			return df.iloc[:0].reset_index(drop=True)
+		return df.take(np.flatnonzero(mask)).reset_index(drop=True)
+
 	def crop_data(
 			self,
 			column_index: int,
@@ -28,8 +39,6 @@ class Selection(_FilterAndLoadMixin):
 		targets = self._resolve_set_numbers(set_numbers)
 		for key in targets:
 			frames = self.data_sets.get(key, [])
-			updated: list[pd.DataFrame] = []
-			for df in frames:
-				mask = df.iloc[:, column_index].between(range_min, range_max)
-				updated.append(df.loc[mask].reset_index(drop=True))
-			self.data_sets[key] = updated
+			self.data_sets[key] = [
+				self._crop_frame(df, column_index, range_min, range_max) for df in frames
+			]
@@ -8,6 +8,7 @@ from typing import List, Sequence, Optional, Union
 
 from ...imports import numpy as np  # type: ignore
 from ..filters import _FilterAndLoadMixin
+from ._kernels import segmented_subtract
 
 __all__ = ["Subtraction"]
 
@@ -19,23 +20,19 @@ class Subtraction(_FilterAndLoadMixin):
 	def _get_segment_indices(x_values: Sequence[float], positions: Sequence[float]) -> List[int]:
 		if not positions:
 			return [0, len(x_values)]
-		arr = np.array(x_values, dtype=float)
+		arr = np.ascontiguousarray(x_values, dtype=np.float64)
 		if arr.ndim != 1:
 			raise ValueError(f"'x_values' must be 1-dimensional, not {arr.ndim}-dimensional")
 		diffs = np.diff(arr)
-		if np.any(diffs == 0):
+		increasing = bool((diffs > 0).all())
+		if not increasing and not (diffs < 0).all():
 			raise ValueError("'x_values' must be strictly monotonic")
-		increasing = np.all(diffs > 0)
-		indices = [0]
-		for position in positions:
-			if increasing:
-				idx = int(np.searchsorted(arr, position, side="right"))
-			else:
-				idx = int(np.searchsorted(arr[::-1], position, side="left"))
-				idx = len(arr) - idx
-			indices.append(idx)
-		indices.append(len(arr))
-		return indices
+		targets = np.ascontiguousarray(positions, dtype=np.float64)
+		if increasing:
+			idx = np.searchsorted(arr, targets, side="right")
+		else:
+			idx = len(arr) - np.searchsorted(arr[::-1], targets, side="left")
+		return [0, *idx.tolist(), len(arr)]
 
 	def subtract_dataset(
 			self,
@@ -62,9 +59,13 @@ class Subtraction(_FilterAndLoadMixin):
 
 		if positions is None or isinstance(fractions, (int, float)):
 			fraction_value = float(fractions)
+			columns, counts = self._unique_columns(columns_in_set)
+			if not columns:
+				return
+			# One broadcast subtraction over the whole column block; repeated columns subtract repeatedly
+			scaled_blank = np.multiply.outer(subtarget_data, counts * fraction_value)
 			for frame in target.frames:
-				for column in columns_in_set:
-					frame.iloc[:, column] = frame.iloc[:, column] - subtarget_data * fraction_value
+				frame.iloc[:, columns] = frame.iloc[:, columns].to_numpy(dtype=float) - scaled_blank
 			return
 
 		if not isinstance(fractions, Sequence):
@@ -72,19 +73,20 @@ class Subtraction(_FilterAndLoadMixin):
 		if len(fractions) != len(positions) + 1:
 			raise ValueError(f"'fractions' must have length len(positions) + 1)")
 
+		previous_x: Optional[np.ndarray] = None
+		indices = np.empty(0, dtype=np.intp)
+		fraction_values = np.asarray(fractions, dtype=float)
+		adjusted = np.empty(0)
 		for frame in target.frames:
 			x_values = frame.iloc[:, x_column].to_numpy(dtype=float)
-			indices = self._get_segment_indices(x_values, positions)
+			# Frames of one set usually share their x-axis; search the positions only once then
+			if previous_x is None or not np.array_equal(x_values, previous_x):
+				indices = np.asarray(self._get_segment_indices(x_values, positions), dtype=np.intp)
+				previous_x = x_values
+			if adjusted.shape != x_values.shape:
+				adjusted = np.empty_like(x_values)
 			for column in columns_in_set:
 				data = frame.iloc[:, column].to_numpy(dtype=float)
-				adjusted = np.zeros_like(data)
-				previous_end = None
-				for idx, (start, end) in enumerate(zip(indices[:-1], indices[1:])):
-					fraction = float(fractions[idx])
-					segment = data[start:end] - subtarget_data[start:end] * fraction
-					if previous_end is not None and start < len(adjusted):
-						delta = adjusted[previous_end - 1] - segment[0]
-						segment = segment + delta
-					adjusted[start:end] = segment
-					previous_end = end
+				segmented_subtract(data, subtarget_data, indices, fraction_values, adjusted)
+				# Assignment copies, so the buffer is reused for the next column
 				frame.iloc[:, column] = adjusted
@@ -4,11 +4,13 @@
 
 from __future__ import annotations
 
-from typing import Sequence, Literal
+import math
+from typing import Literal, Optional, Sequence
 
 from ..filters import _FilterAndLoadMixin
 from ...imports import numpy as np  # type: ignore
 from ...imports import pandas as pd  # type: ignore
+from ...imports import scipy as sp  # type: ignore
 from ...stats.transforms import moving_average as _moving_average
 
 __all__ = ["Transform"]
@@ -30,19 +32,50 @@ class Transform(_FilterAndLoadMixin):
 		if transform_type not in {"log", "power"}:
 			raise ValueError(f"'transform_type' must be 'log' or 'power': {transform_type}")
 
+		if transform_type == "log":
+			if base <= 0 or base == 1:
+				raise ValueError(f"'base' must be greater than 0 and not equal to 1: {base}.")
+			log_base = math.log(base)
+
 		for set_number in set_number:
 			dataset = self.get_dataset(set_number)
 			for frame in dataset.frames:
 				for column in column_indices:
 					if column >= frame.shape[1]:
 						raise IndexError(f"column index is out of range.")
-					data = frame.iloc[:, column].astype(float)
+					data = frame.iloc[:, column].to_numpy(dtype=np.float64)
+					out = np.empty_like(data)
 					if transform_type == "log":
-						if base <= 0 or base == 1:
-							raise ValueError(f"'base' must be greater than 0 and not equal to 1: {base}.")
-						frame.iloc[:, column] = np.log(data) / np.log(base)
+						np.log(data, out=out)
+						np.divide(out, log_base, out=out)
 					else:
-						frame.iloc[:, column] = np.power(base, data)
+						np.power(base, data, out=out)
+					frame.iloc[:, column] = out
+
+	@staticmethod
+	def _box_smooth(values: np.ndarray, *, window_size: int, iterations: int) -> Optional[np.ndarray]:
+		"""
+		Run the moving average through SciPy's running-sum box filter when it is exact.
+
+		``uniform_filter1d(mode="mirror")`` equals the reflect-padded convolution of
+		:func:`~sciwork.stats.transforms.moving_average` for odd windows, at O(n) per
+		pass instead of O(n * window). Returns ``None`` when the caller has to use the
+		reference implementation: even or invalid windows, NaN input (a running sum
+		would spread NaN past the window), or SciPy not being installed.
+		"""
+		if window_size % 2 == 0 or not 1 <= window_size <= values.size or iterations < 1:
+			return None
+		if np.isnan(values).any():
+			return None
+		try:
+			uniform_filter1d = sp.ndimage.uniform_filter1d
+		except ImportError:
+			return None
+
+		out = values
+		for _ in range(iterations):
+			out = uniform_filter1d(out, window_size, mode="mirror")
+		return out
 
 	def moving_average(
 			self,
@@ -62,12 +95,15 @@ class Transform(_FilterAndLoadMixin):
 		if column_index >= frame.shape[1]:
 			raise IndexError("'column_index' out of range")
 
-		averaged = _moving_average(
-			frame.iloc[:, column_index],
-			column=None,
-			window_size=window_size,
-			iterations=iterations,
-		)
+		values = frame.iloc[:, column_index].to_numpy(dtype=np.float64)
+		averaged = self._box_smooth(values, window_size=window_size, iterations=iterations)
+		if averaged is None:
+			averaged = _moving_average(
+				values,
+				column=None,
+				window_size=window_size,
+				iterations=iterations,
+			)
 		series = pd.Series(averaged)
 		frame.iloc[:, column_index] = series.values
 		return series
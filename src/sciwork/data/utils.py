@@ -0,0 +1,23 @@
+# src/sciwork/data/utils.py
+
+"""Small helpers shared by the :mod:`sciwork.data` modules."""
+
+from __future__ import annotations
+
+from typing import Hashable, Iterable, List, TypeVar
+
+__all__ = ["dedup_ordered"]
+
+T = TypeVar("T", bound=Hashable)
+
+
+def dedup_ordered(iterable: Iterable[T]) -> List[T]:
+	"""
+	Return the items of *iterable* without duplicates, keeping first occurrences in order.
+
+	:param iterable: Any iterable of hashable items; consumed once.
+	:return: New list of the distinct items.
+	"""
+	seen: set = set()
+	seen_add = seen.add
+	return [item for item in iterable if not (item in seen or seen_add(item))]
@@ -0,0 +1,150 @@
+# src/sciwork/fs/_dirwatch.py
+
+"""Wake up on new directory entries (inotify / kqueue / ReadDirectoryChanges) instead of sleeping."""
+
+from __future__ import annotations
+
+import ctypes
+import os
+import select
+import sys
+from typing import Optional, Protocol
+
+from ..logutil import get_logger
+from .base import PathLike
+
+LOG = get_logger(__name__)
+
+__all__ = ["DirWatch", "open_dir_watch"]
+
+# inotify(7)
+_IN_CLOEXEC = 0o2000000
+_IN_NONBLOCK = 0o4000
+_IN_CREATE = 0x00000100
+_IN_MOVED_TO = 0x00000080
+
+# Windows (winbase.h)
+_FILE_NOTIFY_CHANGE_FILE_NAME = 0x00000001
+_FILE_NOTIFY_CHANGE_DIR_NAME = 0x00000002
+_WAIT_OBJECT_0 = 0x00000000
+_INVALID_HANDLE_VALUE = ctypes.c_void_p(-1).value
+
+
+class DirWatch(Protocol):
+	"""A watch on one directory that can block until an entry is created or moved in."""
+
+	def wait(self, timeout: float) -> bool:
+		"""Block for at most *timeout* seconds; True if the directory changed meanwhile."""
+		...
+
+	def close(self) -> None:
+		"""Release the OS handle."""
+		...
+
+
+class _InotifyWatch:
+	"""
+	Linux: ``IN_CREATE | IN_MOVED_TO`` on the directory, woken up via :func:`select.poll`
+	(unlike ``select.select`` it has no ``FD_SETSIZE`` limit on the fd number).
+	"""
+
+	def __init__(self, path: str) -> None:
+		libc = ctypes.CDLL(None, use_errno=True)
+		fd = libc.inotify_init1(_IN_NONBLOCK | _IN_CLOEXEC)
+		if fd < 0:
+			err = ctypes.get_errno()
+			raise OSError(err, os.strerror(err))
+		if libc.inotify_add_watch(fd, os.fsencode(path), _IN_CREATE | _IN_MOVED_TO) < 0:
+			err = ctypes.get_errno()
+			os.close(fd)
+			raise OSError(err, os.strerror(err), path)
+		self._fd = fd
+		self._poller = select.poll()
+		self._poller.register(fd, select.POLLIN)
+
+	def wait(self, timeout: float) -> bool:
+		if not self._poller.poll(max(0, int(timeout * 1000))):
+			return False
+		try:
+			while os.read(self._fd, 65536):  # drain; the caller re-scans anyway
+				pass
+		except BlockingIOError:
+			pass
+		return True
+
+	def close(self) -> None:
+		os.close(self._fd)  # also drops the watch
+
+
+class _KqueueWatch:
+	"""macOS/BSD: ``EVFILT_VNODE`` / ``NOTE_WRITE`` on the directory fd."""
+
+	def __init__(self, path: str) -> None:
+		self._fd = os.open(path, getattr(os, "O_EVTONLY", os.O_RDONLY))
+		try:
+			self._kq = select.kqueue()
+			event = select.kevent(
+				self._fd,
+				filter=select.KQ_FILTER_VNODE,
+				flags=select.KQ_EV_ADD | select.KQ_EV_CLEAR,
+				fflags=select.KQ_NOTE_WRITE
+			)
+			self._kq.control([event], 0, 0)
+		except Exception:
+			os.close(self._fd)
+			raise
+
+	def wait(self, timeout: float) -> bool:
+		return bool(self._kq.control(None, 1, timeout))
+
+	def close(self) -> None:
+		self._kq.close()
+		os.close(self._fd)
+
+
+class _WindowsWatch:
+	"""Windows: ``FindFirstChangeNotificationW`` for file and directory name changes."""
+
+	def __init__(self, path: str) -> None:
+		kernel32 = ctypes.WinDLL("kernel32", use_last_error=True)  # type: ignore[attr-defined]
+		kernel32.FindFirstChangeNotificationW.restype = ctypes.c_void_p
+		kernel32.FindNextChangeNotification.argtypes = [ctypes.c_void_p]
+		kernel32.FindCloseChangeNotification.argtypes = [ctypes.c_void_p]
+		kernel32.WaitForSingleObject.argtypes = [ctypes.c_void_p, ctypes.c_uint32]
+		handle = kernel32.FindFirstChangeNotificationW(
+			path, False, _FILE_NOTIFY_CHANGE_FILE_NAME | _FILE_NOTIFY_CHANGE_DIR_NAME
+		)
+		if handle is None or handle == _INVALID_HANDLE_VALUE:
+			raise ctypes.WinError(ctypes.get_last_error())  # type: ignore[attr-defined]
+		self._k32 = kernel32
+		self._handle = handle
+
+	def wait(self, timeout: float) -> bool:
+		if self._k32.WaitForSingleObject(self._handle, int(timeout * 1000)) != _WAIT_OBJECT_0:
+			return False
+		self._k32.FindNextChangeNotification(self._handle)  # re-arm
+		return True
+
+	def close(self) -> None:
+		self._k32.FindCloseChangeNotification(self._handle)
+
+
+def open_dir_watch(path: PathLike) -> Optional[DirWatch]:
+	"""
+	Start watching *path* for new entries with the platform's native API.
+
+	:param path: Directory to watch.
+	:return: A :class:`DirWatch`, or ``None`` when no backend is available (or it
+			refused the directory); callers then fall back to plain polling.
+	"""
+	path = os.fspath(path)
+	try:
+		if sys.platform.startswith("linux"):
+			return _InotifyWatch(path)
+		if sys.platform == "win32":
+			return _WindowsWatch(path)
+		if hasattr(select, "kqueue"):
+			return _KqueueWatch(path)
+	except Exception as exc:  # e.g., inotify watch limit reached, unsupported filesystem
+		LOG.debug("Directory watch unavailable for %s (%s); polling instead.", path, exc)
+	return None
@@ -0,0 +1,82 @@
+# src/sciwork/fs/_iouring.py
+
+"""Batched ``unlinkat`` through io_uring (Linux only, optional ``liburing`` bindings)."""
+
+from __future__ import annotations
+
+import os
+import sys
+from typing import List, Optional, Sequence
+
+from ..imports import liburing
+from ..logutil import get_logger
+
+LOG = get_logger(__name__)
+
+__all__ = ["IOURING_ENV", "iouring_enabled", "unlink_batch"]
+
+IOURING_ENV = "SCIWORK_FS_IOURING"
+_BATCH = 128  # submissions per ring enter
+
+
+def iouring_enabled() -> bool:
+	"""
+	Return True when ``SCIWORK_FS_IOURING`` is set, the platform is Linux and
+	:mod:`liburing` can be imported and provides the expected bindings API.
+
+	Opt-in because io_uring may be disabled by the kernel or a container seccomp profile.
+	"""
+	if os.environ.get(IOURING_ENV, "").strip().lower() not in {"1", "true", "yes", "on"}:
+		return False
+	if not sys.platform.startswith("linux"):
+		return False
+	try:
+		# Bindings API this module is written against (liburing >= 2026.3.30)
+		liburing.Ring, liburing.Cqe, liburing.io_uring_prep_unlink  # noqa: B018 - lazy import
+	except ImportError:
+		LOG.warning("%s is set but liburing is not installed; deleting entry by entry.", IOURING_ENV)
+		return False
+	except (AttributeError, OSError) as exc:  # other bindings release / shared library failed to load
+		LOG.warning("%s is set but liburing is unusable (%s); deleting entry by entry.", IOURING_ENV, exc)
+		return False
+	return True
+
+
+def unlink_batch(paths: Sequence[str], *, batch: int = _BATCH) -> List[Optional[OSError]]:
+	"""
+	Unlink *paths* (files and symlinks, not directories) with ``IORING_OP_UNLINKAT``.
+
+	Up to *batch* requests are queued and submitted with a single ring enter, and
+	their completions are reaped before the next batch is queued.
+
+	:param paths: Absolute paths to remove.
+	:param batch: Submission queue depth.
+	:return: One item per path: ``None`` on success, otherwise the :class:`OSError`
+			(``FileNotFoundError``, ``PermissionError``, ...) the kernel reported.
+	:raises OSError: If the ring cannot be set up; nothing has been removed then.
+	"""
+	ring = liburing.Ring()
+	cqes = liburing.Cqe()
+	liburing.io_uring_queue_init(batch, ring)
+	results: List[Optional[OSError]] = [None] * len(paths)
+	try:
+		for start in range(0, len(paths), batch):
+			chunk = paths[start:start + batch]
+			for offset, path in enumerate(chunk):
+				sqe = liburing.io_uring_get_sqe(ring)
+				liburing.io_uring_prep_unlink(sqe, os.fsdecode(path))  # unlinkat(AT_FDCWD, path, 0)
+				sqe.user_data = start + offset
+			liburing.io_uring_submit(ring)
+			for _ in chunk:
+				liburing.io_uring_wait_cqe(ring, cqes)
+				cqe = cqes[0]
+				index = cqe.user_data
+				try:
+					cqe.res  # noqa: B018 - the bindings raise the errno of a failed request here
+				except OSError as exc:
+					results[index] = OSError(exc.errno, exc.strerror, paths[index])
+				finally:
+					liburing.io_uring_cqe_seen(ring, cqe)
+	finally:
+		liburing.io_uring_queue_exit(ring)
+	return results
@@ -2,73 +2,139 @@
 
 from __future__ import annotations
 
+import errno
+import ntpath
+import os
+import posixpath
+import shutil
+import stat
+import sys
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import suppress
+from functools import lru_cache
 from pathlib import Path
-from typing import Iterable, Literal, Optional, Any
+from typing import Iterable, Literal, Optional, Any, Tuple
 
 from ..logutil import get_logger
-from .inspect import build_metadata
-from ..imports import zipfile, tarfile, pyzipper
+from .inspect import _guess_mime
+from ..imports import zipfile, tarfile, pyzipper, zlib_ng, libarchive
 
 LOG = get_logger(__name__)
 
+_COPY_BUFSIZE = 1 << 20  # 1 MiB chunks when streaming archive members to disk
+_ZLIB_NG_ENV = "PYTHON_ZLIB_NG"
+_PARALLEL_MAX_MEMBER = 64 << 20  # larger members are deflated in-process to bound memory
+_PRECOMPRESSED_PYTHONS = ((3, 10), (3, 13))  # CPython releases the ZipFile internals were checked on
+_PREALLOC_MIN = 1 << 20  # only preallocate extracted members larger than 1 MiB
+_SENDFILE_UNSUPPORTED = {errno.EINVAL, errno.ENOSYS, errno.ENOTSOCK, errno.EOPNOTSUPP}
+
+# Trusted extensions; one or two trailing dot-suffixes (".tar.gz")
+_FAST_EXT_MAP = {
+	".tar": "tar", ".tar.gz": "tar", ".tgz": "tar", ".tar.bz2": "tar", ".tbz2": "tar",
+	".tar.xz": "tar", ".txz": "tar",
+	".zip": "zip",
+	".rar": "rar",
+}
+
+# Magic-byte sniffing: a single read covers every signature, including 'ustar' at offset 257
+_SNIFF_BYTES = 4096
+_ZIP_MAGIC = (b"PK\x03\x04", b"PK\x05\x06", b"PK\x07\x08")  # local / EOCD / spanned
+_RAR_MAGIC = (b"Rar!\x1a\x07\x00", b"Rar!\x1a\x07\x01\x00")  # RAR 4.x / 5.x
+_GZIP_MAGIC = b"\x1f\x8b"
+_7Z_MAGIC = b"7z\xbc\xaf\x27\x1c"
+
 __all__ = [
 	"detect_archive_type",
 	"assert_within_dir",
 	"safe_extract_zip", "safe_extract_tar", "safe_extract_rar",
+	"extract_with_libarchive",
 	"iter_archive_files",
 	"make_zip_archive", "make_tar_archive"
 ]
 
 
 # --- Detection & safety ---
-def detect_archive_type(archive: Path) -> Literal["zip", "tar", "rar", "unknown"]:
+def _kind_from_extension(name: str) -> Optional[str]:
+	"""Look up the last one or two dot-suffixes of a lower-cased *name* in ``_FAST_EXT_MAP``."""
+	stem, dot, last = name.rpartition(".")
+	if not dot:
+		return None
+	_, dot, prev = stem.rpartition(".")
+	if dot:
+		kind = _FAST_EXT_MAP.get(f".{prev}.{last}")
+		if kind:
+			return kind
+	return _FAST_EXT_MAP.get(f".{last}")
+
+
+def detect_archive_type(
+		archive: Path, *, strict: bool = False
+) -> Literal["zip", "tar", "rar", "7z", "unknown"]:
 	"""
 	Best-effort archive kind detection: 'zip' | 'tar' | 'rar' | 'unknown'.
 
+	Extension first, then the filename MIME hint, then magic bytes from the first 4 KiB.
+	A recognized extension returns without touching the file. Gzip streams count as 'tar'.
+	7z is recognized but reported as 'unknown' until there is a backend for it
+	(``"7z"`` is reserved in the return type).
+	Content probes are cached per ``(path, mtime_ns, size)``, so a modified file is re-sniffed.
+
 	:param archive: Path to the archive file.
+	:param strict: Ignore the name (extension and MIME hint) and decide from magic bytes
+				only, e.g. when the file name cannot be trusted.
 	:return: Type of the archive.
 	"""
 	p = Path(archive)
-	name = p.name.lower()
 
 	# 1) Fast guess based on file extension
-	if name.endswith((".tar", ".tar.gz", ".tgz", ".tar.bz2", ".tbz2", ".tar.xz", ".txz")):
-		return "tar"
-	if name.endswith(".zip"):
-		return "zip"
-	if name.endswith(".rar"):
-		return "rar"
+	if not strict:
+		kind = _kind_from_extension(p.name.lower())
+		if kind:
+			return kind
 
-	# 2) MIME hint from build_metadata()
-	meta = build_metadata(p) or {}
-	mime = (meta.get("mime") or "").lower()
-	if mime in {"application/zip", "application/x-zip-compressed"}:
-		return "zip"
-	if mime in {"application/x-tar", "application/x-gtar"}:
-		return "tar"
-	if mime in {"application/vnd.rar", "application/x-rar-compressed"}:
-		return "rar"
-
-	# Light "magic" sniff without external dependencies
+	# 2) Content probe, memoized per (path, mtime, size) so repeated probes skip the I/O
+	try:
+		st = os.stat(p)
+	except OSError as exc:
+		LOG.warning("stat() failed for %s: %s", p, exc)
+		return "unknown"
+	return _detect_cached(os.fspath(p), st.st_mtime_ns, st.st_size, strict)
+
+
+@lru_cache(maxsize=65536)
+def _detect_cached(
+		path: str, mtime_ns: int, size: int, strict: bool = False
+) -> Literal["zip", "tar", "rar", "7z", "unknown"]:
+	"""MIME hint + magic sniff for :func:`detect_archive_type`; the stat fields key the cache."""
+	p = Path(path)
+	if not strict:
+		# MIME hint (filename-based, as in build_metadata())
+		mime = (_guess_mime(p.name) or "").lower()
+		if mime in {"application/zip", "application/x-zip-compressed"}:
+			return "zip"
+		if mime in {"application/x-tar", "application/x-gtar"}:
+			return "tar"
+		if mime in {"application/vnd.rar", "application/x-rar-compressed"}:
+			return "rar"
+
+	# Light "magic" sniff without external dependencies: one read, all checks in memory
 	try:
 		with open(p, "rb") as f:
-			head = f.read(8)
+			head = f.read(_SNIFF_BYTES)
+	except OSError:
+		return "unknown"
 
-			# ZIP (local/EOCD/spanned)
-			if head.startswith(b"PK\x03\x04") or head.startswith(b"PK\x05\x06") or head.startswith(b"PK\x07\x08"):
-				return "zip"
-
-			# RAR 4.x and 5.x
-			if head.startswith(b"Rar!\x1a\x07\x00") or head.startswith(b"Rar!\x1a\x07\x01\x00"):
-				return "rar"
-
-			# TAR: 'ustar' signature at offset 257
-			f.seek(257)
-			sig = f.read(6)
-			if sig.startswith(b"ustar"):
-				return "tar"
-	except Exception:
-		pass
+	if head.startswith(_ZIP_MAGIC):
+		return "zip"
+	if head.startswith(_RAR_MAGIC):
+		return "rar"
+	# TAR: 'ustar' signature at offset 257; gzip is nearly always a wrapped tar here
+	if head[257:262] == b"ustar" or head.startswith(_GZIP_MAGIC):
+		return "tar"
+	if head.startswith(_7Z_MAGIC):
+		# Recognized, but no 7z backend yet; report it as unsupported
+		return "unknown"
 
 	return "unknown"
 
@@ -79,10 +145,101 @@ def assert_within_dir(base_dir: Path, target: Path) -> None:
 
 	:raises ValueError: If *target* escapes *base_dir*.
 	"""
-	base_dir = base_dir.resolve()
+	_assert_within_resolved(base_dir.resolve(), target)
+
+
+def _assert_within_resolved(base_resolved: Path, target: Path) -> None:
+	"""Like :func:`assert_within_dir` for a *base_resolved* the caller resolved once up front."""
 	target = Path(target).resolve()
-	if base_dir not in target.parents and base_dir != target:
-		raise ValueError(f"Blocked path traversal: {target} not within {base_dir}.")
+	if target != base_resolved and not target.is_relative_to(base_resolved):
+		raise ValueError(f"Blocked path traversal: {target} not within {base_resolved}.")
+
+
+def _check_member_name(name: str) -> None:
+	"""
+	Reject absolute member names and ``..`` escapes with string checks alone.
+
+	Catches the obvious cases before any filesystem call; the resolve-based check
+	still runs afterward for links already extracted into the destination.
+	"""
+	rel = posixpath.normpath(name)
+	if rel.startswith("/") or ntpath.splitdrive(rel)[0] or rel == ".." or rel.startswith("../"):
+		raise ValueError(f"Blocked path traversal: member '{name}' escapes the destination.")
+
+
+def _lstat_walk(dest: Path, name: str, checked: set) -> None:
+	"""
+	Reject member *name* if any existing component below *dest* is a symlink.
+
+	Uses :func:`os.lstat` on the unresolved path, so a link already planted in (or
+	extracted into) *dest* cannot redirect a write. The walk stops at the first missing
+	component. Ancestors that were seen to be real directories are remembered in
+	*checked* (one set per archive), so siblings cost no extra syscalls; the member's
+	own path is dropped from it, since extracting the member may change its type.
+
+	:raises ValueError: If a component is a symlink.
+	"""
+	parts = [part for part in posixpath.normpath(name).split("/") if part not in ("", ".")]
+	nodes = []
+	node = os.fspath(dest)
+	for part in parts:
+		node = os.path.join(node, part)
+		nodes.append(node)
+	if nodes:
+		checked.discard(nodes[-1])  # the member itself is about to be (re)written
+
+	for i, node in enumerate(nodes):
+		is_leaf = i == len(nodes) - 1
+		if not is_leaf and node in checked:
+			continue
+		try:
+			st = os.lstat(node)
+		except FileNotFoundError:
+			return
+		if stat.S_ISLNK(st.st_mode):
+			raise ValueError(f"Blocked path traversal: '{name}' would be written through symlink '{node}'.")
+		if not is_leaf:
+			checked.add(node)
+
+
+def _safe_join(base: str, name: str, *, is_dir: bool, checked: set) -> str:
+	"""
+	Per-member safety check on plain strings, the hot path of every ``safe_extract_*`` loop.
+
+	Runs :func:`_check_member_name` and :func:`_lstat_walk`, joins *name* onto *base*
+	and checks that one :func:`os.path.realpath` of the result (of its parent, for
+	directories) stays inside *base*. Same rules as :func:`assert_within_dir`, minus
+	the per-member :class:`~pathlib.Path` objects.
+
+	:param base: Destination directory, already resolved.
+	:param name: Member name as stored in the archive.
+	:param is_dir: Whether the member is a directory.
+	:param checked: Per-archive cache for :func:`_lstat_walk`.
+	:return: The target path (joined, not resolved).
+	:raises ValueError: If the member escapes *base* or would be written through a symlink.
+	"""
+	_check_member_name(name)
+	_lstat_walk(base, name, checked)
+	target = os.path.join(base, name)
+	probe = os.path.normcase(os.path.realpath(os.path.dirname(target.rstrip("/")) if is_dir else target))
+	root = os.path.normcase(base)
+	if probe != root and not probe.startswith(root if root.endswith(os.sep) else root + os.sep):
+		raise ValueError(f"Blocked path traversal: {probe} not within {base}.")
+	return target
+
+
+def _preallocate(out: Any, size: int) -> None:
+	"""
+	Reserve *size* bytes for a freshly opened output file so the filesystem can lay it out
+	in one go. Best effort: only for members above ``_PREALLOC_MIN`` and only where
+	:func:`os.posix_fallocate` exists and the filesystem supports it.
+	"""
+	if size < _PREALLOC_MIN or not hasattr(os, "posix_fallocate"):
+		return
+	try:
+		os.posix_fallocate(out.fileno(), 0, size)
+	except OSError as exc:
+		LOG.debug("posix_fallocate(%d) failed for %s: %s", size, getattr(out, "name", out), exc)
 
 
 # --- Safe Extraction Helpers ---
@@ -97,31 +254,58 @@ def safe_extract_zip(zf: Any, dest: Path, *, password: Optional[str]) -> None:
 	pwd = password.encode("utf-8") if password else None
 	if pwd and hasattr(zf, "setpassword"):
 		zf.setpassword(pwd)
+	base = os.fspath(dest.resolve())
+	checked: set = set()
+	made: set = set()
 	for info in zf.infolist():
-		name = info.filename
 		# zip can contain both folders and files
-		target = dest / Path(name)
-		assert_within_dir(dest, target.parent if info.is_dir() else target)
+		is_dir = info.is_dir()
+		target = _safe_join(base, info.filename, is_dir=is_dir, checked=checked)
 
-		if info.is_dir():
-			target.mkdir(parents=True, exist_ok=True)
+		if is_dir:
+			os.makedirs(target, exist_ok=True)
 			continue
 
-		target.parent.mkdir(parents=True, exist_ok=True)
-		with zf.open(name) as src, open(target, "wb") as out:
-			out.write(src.read())
+		parent = os.path.dirname(target)
+		if parent not in made:
+			os.makedirs(parent, exist_ok=True)
+			made.add(parent)
+		# Stream through a bounded buffer; passing the ZipInfo skips a name lookup
+		with zf.open(info) as src, open(target, "wb") as out:
+			_preallocate(out, info.file_size)
+			shutil.copyfileobj(src, out, _COPY_BUFSIZE)
 
 
 def safe_extract_tar(tf: Any, dest: Path) -> None:
 	"""
 	Extract TAR entries to *dest* with traversal protection.
 
+	Where :mod:`tarfile` ships extraction filters (Python 3.12, backported to 3.8.17+ /
+	3.11.4+), this is a single ``extractall(filter="data")`` pass. That filter also rejects
+	links pointing outside *dest* and device files, and drops setuid/group-write bits.
+	Older interpreters use the member-by-member check below.
+
 	:param tf: Instance of :class:`tarfile.TarFile`.
 	:param dest: Destination directory.
+	:raises ValueError: If a member escapes *dest* (or is otherwise refused by the filter).
 	"""
-	for member in tf.getmembers():
-		target = dest / Path(member.name)
-		assert_within_dir(dest, target.parent if member.isdir() else target)
+	checked: set = set()
+	if hasattr(tarfile, "data_filter"):
+		def _filter(member: Any, path: str) -> Any:
+			_check_member_name(member.name)
+			_lstat_walk(dest, member.name, checked)
+			return tarfile.data_filter(member, path)
+
+		try:
+			tf.extractall(dest, filter=_filter)
+		except tarfile.FilterError as exc:
+			raise ValueError(f"Unsafe TAR member refused: {exc}") from exc
+		return
+
+	base = os.fspath(dest.resolve())
+	# Iterate lazily so extraction starts without scanning (and decompressing) the whole archive first
+	for member in tf:
+		_safe_join(base, member.name, is_dir=member.isdir(), checked=checked)
 		tf.extract(member, dest)  # guarded by the check above
 
 
@@ -129,38 +313,258 @@ def safe_extract_rar(rf: Any, dest: Path, *, password: Optional[str]) -> None:
 	"""
 	Extract RAR entries to *dest* with traversal protection.
 
+	Each member is validated and extracted in the same step, so nothing can be swapped
+	in between the check and the write. A parent directory that already exists as a
+	symlink is rejected (see :func:`_lstat_walk`).
+
 	:param rf: Instance of :class:`rarfile.RarFile`.
 	:param dest: Destination directory.
 	:param password: Password to use, if any.
+	:raises ValueError: If a member escapes *dest* or would be written through a symlink.
 	"""
+	base = os.fspath(dest.resolve())
+	checked: set = set()
 	for info in rf.infolist():
-		target = dest / Path(info.filename)
 		# rarfile has info.isdir()
-		assert_within_dir(dest, target.parent if getattr(info, "isdir", lambda: False)() else target)
-	rf.extractall(path=str(dest), pwd=password)
+		_safe_join(base, info.filename, is_dir=info.isdir(), checked=checked)
+		rf.extract(info, path=str(dest), pwd=password)
+
+
+def extract_with_libarchive(
+		src: Path, dest: Path, *, password: Optional[str], safe: bool = True
+) -> bool:
+	"""
+	Extract *src* to *dest* in-process with :mod:`libarchive` (``libarchive-c``).
+
+	Entries are streamed block by block; with *safe* every entry gets the same name,
+	symlink and containment checks as the other ``safe_extract_*`` helpers. Only
+	directories and regular files are written; links and special entries are skipped.
+
+	:param src: Archive path.
+	:param dest: Destination directory.
+	:param password: Passphrase for encrypted archives, if any.
+	:param safe: Apply traversal protection.
+	:return: ``False`` (no file written; a partially written one is removed) when
+			libarchive is not installed or cannot read the archive format or an entry
+			(e.g., a missing passphrase), so the caller can fall back to another backend.
+	:raises ValueError: If *safe* and an entry escapes *dest*.
+	"""
+	try:
+		reader = libarchive.file_reader(str(src), passphrase=password)
+	except ImportError:
+		return False
+
+	base = os.fspath(dest.resolve())
+	checked: set = set()
+	written = False
+	partial: Optional[str] = None
+	try:
+		with reader as entries:
+			for entry in entries:
+				name = entry.pathname
+				if not (entry.isdir or entry.isreg):
+					LOG.warning("Skipping non-regular archive entry: '%s'", name)
+					continue
+				if safe:
+					target = _safe_join(base, name, is_dir=entry.isdir, checked=checked)
+				else:
+					target = os.path.join(base, name)
+
+				if entry.isdir:
+					os.makedirs(target, exist_ok=True)
+					continue
+				os.makedirs(os.path.dirname(target), exist_ok=True)
+				partial = target
+				with open(target, "wb") as out:
+					_preallocate(out, entry.size or 0)
+					for block in entry.get_blocks():  # encrypted entries fail here, not on open
+						out.write(block)
+				partial = None
+				written = True  # only complete files count; directories are harmless to redo
+	except libarchive.ArchiveError as exc:
+		if partial is not None:
+			with suppress(OSError):
+				os.unlink(partial)
+		if written:
+			raise
+		LOG.debug("libarchive cannot read '%s' (%s); falling back", src, exc)
+		return False
+	return True
 
 
 # --- File Enumeration (for compression) ---
 def iter_archive_files(src_dir: Path, *, include_hidden: bool = True) -> Iterable[Path]:
 	"""
 	Yield files under *src_dir* recursively. Optionally, skip dot-entries.
+
+	Walks with :func:`os.scandir` so file-type checks come from the directory listing.
+	Like the previous ``rglob`` walk, each directory's files are yielded before its
+	subdirectories are entered, and symlinked directories are neither listed nor followed.
 	"""
-	root = Path(src_dir)
-	for p in root.rglob("*"):
-		if p.is_dir():
-			continue
-		if not include_hidden:
-			try:
-				rel = p.relative_to(root)
-				if any(part.startswith(".") for part in rel.parts):
+	pending = [os.fspath(src_dir)]
+	while pending:
+		subdirs = []
+		with os.scandir(pending.pop()) as it:
+			for entry in it:
+				if not include_hidden and entry.name.startswith("."):
 					continue
-			except Exception:
-				if p.name.startswith("."):
-					continue
-		yield p
+				if entry.is_dir(follow_symlinks=False):
+					subdirs.append(entry.path)
+				elif not entry.is_dir():
+					yield Path(entry.path)
+		# Reversed so the first subdirectory listed is walked next
+		pending.extend(reversed(subdirs))
 
 
 # --- Compression Helpers ---
+@lru_cache(maxsize=1)
+def _use_zlib_ng() -> bool:
+	"""
+	Route ``zipfile`` and ``gzip`` DEFLATE through zlib-ng when ``PYTHON_ZLIB_NG`` is set.
+
+	Opt-in because it swaps the ``zlib`` module those stdlib modules use for the whole
+	process; archives stay standard DEFLATE and readable by any tool.
+	"""
+	if os.environ.get(_ZLIB_NG_ENV, "").strip().lower() not in {"1", "true", "yes", "on"}:
+		return False
+	try:
+		ng = zlib_ng.zlib_ng
+	except ImportError:
+		LOG.warning("%s is set but zlib-ng is not installed; using the standard zlib.", _ZLIB_NG_ENV)
+		return False
+	except (AttributeError, OSError) as exc:  # compiled zlib_ng.zlib_ng failed to load
+		LOG.warning("%s is set but zlib-ng is unusable (%s); using the standard zlib.", _ZLIB_NG_ENV, exc)
+		return False
+
+	import gzip
+	import zipfile as zipfile_mod
+
+	zipfile_mod.zlib = ng
+	gzip.zlib = ng
+	LOG.debug("DEFLATE for zipfile/gzip routed through zlib-ng")
+	return True
+
+
+def _arcnames(src_dir: Path, files: Iterable[Path]) -> Iterable[Tuple[Path, str]]:
+	"""
+	Pair each file with its archive name relative to *src_dir*.
+
+	Files produced by :func:`iter_archive_files` share the ``src_dir`` string prefix, so
+	slicing replaces a ``relative_to`` call per file; anything else still goes through it.
+	"""
+	prefix = os.path.join(os.fspath(src_dir), "")
+	cut = len(prefix)
+	for f in files:
+		name = os.fspath(f)
+		if name.startswith(prefix):
+			yield f, name[cut:]
+		else:
+			yield f, str(Path(f).relative_to(src_dir))
+
+
+def _deflate_file(path: str, compresslevel: Optional[int]) -> Tuple[int, int, bytes]:
+	"""Raw-DEFLATE one file in a worker process; returns ``(crc32, size, data)``."""
+	import zlib
+
+	level = zlib.Z_DEFAULT_COMPRESSION if compresslevel is None else compresslevel
+	compressor = zlib.compressobj(level, zlib.DEFLATED, -15)
+	crc, size, chunks = 0, 0, []
+	with open(path, "rb") as src:
+		while block := src.read(_COPY_BUFSIZE):
+			crc = zlib.crc32(block, crc)
+			size += len(block)
+			chunks.append(compressor.compress(block))
+	chunks.append(compressor.flush())
+	return crc, size, b"".join(chunks)
+
+
+def _write_precompressed(zf: Any, zinfo: Any, crc: int, size: int, data: bytes) -> None:
+	"""
+	Append an already-deflated member, doing what ``ZipFile.write`` does minus compression.
+
+	Relies on the same ``ZipFile`` internals as ``ZipFile._open_to_write``; callers check
+	:func:`_precompressed_supported` first.
+	"""
+	zinfo.compress_type = zipfile.ZIP_DEFLATED
+	zinfo.flag_bits = 0
+	zinfo.CRC = crc
+	zinfo.file_size = size
+	zinfo.compress_size = len(data)
+	if not zinfo.external_attr:
+		zinfo.external_attr = 0o600 << 16
+	zip64 = size > zipfile.ZIP64_LIMIT or len(data) > zipfile.ZIP64_LIMIT
+
+	zf.fp.seek(zf.start_dir)
+	zinfo.header_offset = zf.fp.tell()
+	zf._writecheck(zinfo)
+	zf._didModify = True
+	zf.fp.write(zinfo.FileHeader(zip64))
+	zf.fp.write(data)
+	zf.start_dir = zf.fp.tell()
+	zf.filelist.append(zinfo)
+	zf.NameToInfo[zinfo.filename] = zinfo
+
+
+def _precompressed_supported(zf: Any) -> bool:
+	"""
+	Whether :func:`_write_precompressed` may touch *zf*: it uses private ``ZipFile``
+	internals (``fp``, ``start_dir``, ``_writecheck``, ``_didModify``, ``NameToInfo``),
+	so it is limited to the CPython releases it was checked against, and only when
+	those attributes are actually there.
+	"""
+	return (
+		sys.implementation.name == "cpython"
+		and _PRECOMPRESSED_PYTHONS[0] <= sys.version_info[:2] <= _PRECOMPRESSED_PYTHONS[1]
+		and all(hasattr(zf, name) for name in ("fp", "start_dir", "_writecheck", "_didModify", "NameToInfo"))
+		and hasattr(zipfile.ZipInfo, "FileHeader")
+	)
+
+
+def _write_zip_parallel(
+		zf: Any,
+		entries: Iterable[Tuple[Path, str]],
+		*,
+		compresslevel: Optional[int],
+		workers: int
+) -> None:
+	"""
+	Deflate regular files on a process pool and append them to *zf* in input order.
+
+	At most ``2 * workers`` members are in flight: the next file is submitted only
+	after the oldest result has been written, so the compressed payloads held in
+	memory stay bounded for any tree size (each one is at most ``_PARALLEL_MAX_MEMBER``).
+	Falls back to plain ``zf.write`` when :func:`_precompressed_supported` says no.
+	"""
+	if not _precompressed_supported(zf):
+		LOG.debug("Parallel ZIP writing not supported on this Python; writing serially")
+		for f, arcname in entries:
+			zf.write(f, arcname)
+		return
+
+	window = 2 * workers
+	pending: deque = deque()
+
+	def write_oldest() -> None:
+		f, arcname, zinfo, future = pending.popleft()
+		if future is None:
+			zf.write(f, arcname)
+		else:
+			_write_precompressed(zf, zinfo, *future.result())
+
+	with ProcessPoolExecutor(max_workers=workers) as executor:
+		for f, arcname in entries:
+			zinfo = zipfile.ZipInfo.from_file(f, arcname)
+			# Directories and very large files stay on the serial path to bound memory
+			if zinfo.is_dir() or zinfo.file_size > _PARALLEL_MAX_MEMBER:
+				pending.append((f, arcname, zinfo, None))
+			else:
+				pending.append((f, arcname, zinfo, executor.submit(_deflate_file, os.fspath(f), compresslevel)))
+			if len(pending) >= window:
+				write_oldest()
+		while pending:
+			write_oldest()
+
+
 def make_zip_archive(
 		src_dir: Path,
 		files: Iterable[Path],
@@ -168,34 +572,94 @@ def make_zip_archive(
 		*,
 		password: Optional[str],
 		compresslevel: Optional[int],
+		workers: int = 1
 ) -> None:
 	"""
 	Create a ZIP archive at *dest_zip* from *files* under *src_dir*.
 
 	If *password* is provided, use AES-256 via ``pyzipper`` (lazy import).
+	``compresslevel=0`` stores entries uncompressed (``ZIP_STORED``), which suits
+	already-compressed data. Set ``PYTHON_ZLIB_NG=1`` to deflate with zlib-ng when it
+	is installed. With ``workers > 1`` (DEFLATE without password), files are compressed
+	on a process pool and written in the original order.
 	"""
 
-	comp = zipfile.ZIP_DEFLATED
-	kwargs = {"compression": comp}
-	if compresslevel is not None:
-		kwargs["compresslevel"] = compresslevel
+	if compresslevel == 0:
+		# Level 0 would still wrap every file in stored DEFLATE blocks; write it as-is instead
+		kwargs = {"compression": zipfile.ZIP_STORED}
+	else:
+		_use_zlib_ng()
+		kwargs = {"compression": zipfile.ZIP_DEFLATED}
+		if compresslevel is not None:
+			kwargs["compresslevel"] = compresslevel
 
 	if password:
+		# Encoded once, before the file is created. The per-entry PBKDF2 key is deliberately
+		# not cached: WinZip AES derives it from a fresh random salt per entry, and reusing
+		# one would reuse the CTR keystream.
+		pwd = password.encode("utf-8")
 		with pyzipper.AESZipFile(dest_zip, "w", **kwargs) as zf:
-			zf.setpassword(password.encode("utf-8"))
+			zf.setpassword(pwd)
 			zf.setencryption(pyzipper.WZ_AES, nbits=256)
-			for f in files:
-				arcname = Path(f).relative_to(src_dir)
+			for f, arcname in _arcnames(src_dir, files):
 				zf.write(f, arcname)
 		return
 
 	# Plain ZIP (no password)
 	with zipfile.ZipFile(dest_zip, "w", **kwargs) as zf:
-		for f in files:
-			arcname = Path(f).relative_to(src_dir)
+		if workers > 1 and kwargs["compression"] == zipfile.ZIP_DEFLATED:
+			_write_zip_parallel(zf, _arcnames(src_dir, files), compresslevel=compresslevel, workers=workers)
+			return
+		for f, arcname in _arcnames(src_dir, files):
 			zf.write(f, arcname)
 
 
+def _fast_tar_write(tf: Any, path: Path, arcname: str) -> None:
+	"""
+	Append a regular file to an uncompressed *tf* using :func:`os.sendfile` for the payload.
+
+	Header and padding are written as ``TarFile.addfile`` would. Anything that is not a
+	regular file (links, devices) goes through ``tf.add``. If the platform refuses
+	``sendfile`` for file-to-file copies, the payload is copied in Python instead.
+	"""
+	if tf.name is not None and os.path.abspath(path) == tf.name:
+		tf.add(path, arcname=arcname)  # lets tarfile skip the archive itself
+		return
+	tarinfo = tf.gettarinfo(path, arcname)
+	if tarinfo is None or not tarinfo.isreg():
+		tf.add(path, arcname=arcname)
+		return
+
+	header = tarinfo.tobuf(tf.format, tf.encoding, tf.errors)
+	tf.fileobj.write(header)
+	tf.offset += len(header)
+	tf.fileobj.flush()  # sendfile writes at the fd's offset, behind the buffer's back
+
+	size = tarinfo.size
+	sent = 0
+	with open(path, "rb") as src:
+		out_fd, in_fd = tf.fileobj.fileno(), src.fileno()
+		while sent < size:
+			try:
+				n = os.sendfile(out_fd, in_fd, sent, size - sent)
+			except OSError as exc:
+				if sent or exc.errno not in _SENDFILE_UNSUPPORTED:
+					raise
+				tarfile.copyfileobj(src, tf.fileobj, size)
+				sent = size
+				break
+			if n == 0:
+				raise tarfile.ReadError(f"unexpected end of data while reading '{path}'")
+			sent += n
+
+	blocks, remainder = divmod(size, tarfile.BLOCKSIZE)
+	if remainder:
+		tf.fileobj.write(tarfile.NUL * (tarfile.BLOCKSIZE - remainder))
+		blocks += 1
+	tf.offset += blocks * tarfile.BLOCKSIZE
+	tf.members.append(tarinfo)
+
+
 def make_tar_archive(
 		src_dir: Path,
 		files: Iterable[Path],
@@ -222,6 +686,8 @@ def make_tar_archive(
 	mode = mode_map.get(tar_format)
 	if mode is None:
 		raise ValueError(f"Unsupported TAR format: '{tar_format}'.")
+	if tar_format == "gztar":
+		_use_zlib_ng()
 
 	# tarfile.open supports compresslevel for bz2; ignored for plain tar/gz/xz
 	compress_invalid = {'tar', 'gztar', 'xztar'}
@@ -232,7 +698,11 @@ def make_tar_archive(
 		tf = tarfile.open(dest_tar, mode)
 	else:
 		tf = tarfile.open(dest_tar, mode, compresslevel=compresslevel)
+	# Plain tar: payload bytes equal the source bytes, so copy them in-kernel
+	fast = tar_format == "tar" and hasattr(os, "sendfile")
 	with tf:
-		for f in files:
-			arcname = Path(f).relative_to(src_dir)
-			tf.add(f, arcname=str(arcname))
+		for f, arcname in _arcnames(src_dir, files):
+			if fast:
+				_fast_tar_write(tf, f, arcname)
+			else:
+				tf.add(f, arcname=arcname)
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import os
 from pathlib import Path
 from typing import Literal, Optional
 
@@ -11,6 +12,7 @@ from ..imports import zipfile, pyzipper, tarfile, RARFILE
 from .archive_utils import (
 	detect_archive_type,
 	safe_extract_zip, safe_extract_tar, safe_extract_rar,
+	extract_with_libarchive,
 	iter_archive_files,
 	make_zip_archive, make_tar_archive
 )
@@ -44,15 +46,12 @@ class Archives(PathOpsBase):
 		"""Figure out (and prepare) the output directory for extraction."""
 		dest = self._abs(extract_to) if extract_to else src.with_suffix("")
 		if dest.exists():
-			# use Dirs.is_folder_empty for consistency
+			# Same answer as Dirs.is_folder_empty(dest) without building a Dirs instance:
+			# stop at the first entry; a non-directory or unreadable dest counts as not empty
 			try:
-				try:
-					from .dirs import Dirs
-				except Exception:
-					LOG.error("extract_archive requires the optional dependency 'sciwork.fs.Dirs' to work.")
-					raise
-				empty = Dirs().is_folder_empty(dest)
-			except Exception:
+				with os.scandir(dest) as it:
+					empty = next(it, None) is None
+			except OSError:
 				empty = False
 			if not empty and not overwrite:
 				raise FileExistsError(f"Destination not empty: '{dest}' (use overwrite=True).")
@@ -96,7 +95,13 @@ class Archives(PathOpsBase):
 
 	@staticmethod
 	def _extract_rar(src: Path, dest: Path, *, password: Optional[str], safe: bool) -> None:
-		"""Extract RAR archive."""
+		"""
+		Extract RAR archive. Prefer in-process libarchive when it is installed and built
+		with RAR support; otherwise use :mod:`rarfile` (external ``unrar`` backend).
+		libarchive cannot decrypt RAR, so password-protected archives go to :mod:`rarfile`.
+		"""
+		if not password and extract_with_libarchive(src, dest, password=None, safe=safe):
+			return
 		with RARFILE.RarFile(str(src), "r") as rf:  # type: ignore[attr-defined]
 			if safe:
 				safe_extract_rar(rf, dest, password=password)
@@ -161,7 +166,7 @@ class Archives(PathOpsBase):
 		Supported:
 			- ZIP (password optional; legacy ZipCrypto)
 			- TAR / TAR.GZ / TAR.BZ2 / TAR.XZ (no password)
-			- RAR (password optional, requires mod:`rarfile` and an external backend)
+			- RAR (password optional; libarchive-c if available, else mod:`rarfile` + external backend)
 
 		:param archive_path: Path to the archive file.
 		:param extract_to: Target directory; default is ``<archive_dir>/<archive_stem>``.
@@ -219,7 +224,8 @@ class Archives(PathOpsBase):
 			overwrite: bool = False,
 			password: Optional[str] = None,  # only for ZIP
 			include_hidden: bool = True,
-			compresslevel: Optional[int] = None  # 0..9 for zip / bz2
+			compresslevel: Optional[int] = None,  # 0..9 for zip / bz2
+			workers: int = 1
 	) -> Path:
 		"""
 		Compress a directory into an archive (ZIP/TAR*). Supports password only for ZIP via pyzipper.
@@ -232,6 +238,7 @@ class Archives(PathOpsBase):
 		:param password: Optional password (ZIP only; AES-256 via pyzipper).
 		:param include_hidden: Include dot-files/directories.
 		:param compresslevel: Compression level (None for default).
+		:param workers: Processes used to deflate ZIP entries in parallel (ZIP without password only).
 		:return: Absolute path to the created archive.
 		:raises FileNotFoundError: Source not found.
 		:raises NotADirectoryError: Source is not a directory.
@@ -257,7 +264,9 @@ class Archives(PathOpsBase):
 
 		if arch_format == "zip":
 			self._unlink_before_compression(dest, overwrite=overwrite)
-			make_zip_archive(src_dir, files, dest, password=password, compresslevel=compresslevel)
+			make_zip_archive(
+				src_dir, files, dest, password=password, compresslevel=compresslevel, workers=workers
+			)
 		else:
 			if password:
 				raise ValueError("Passwords are supported only for ZIP archives.")
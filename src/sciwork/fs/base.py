@@ -2,8 +2,13 @@
 
 from __future__ import annotations
 
+import errno
+import os
+import stat
+import time
+from functools import lru_cache
 from pathlib import Path
-from typing import Callable, Union, Optional, Protocol
+from typing import Callable, Dict, Union, Optional, Protocol, Tuple
 
 from ..logutil import get_logger
 
@@ -19,6 +24,22 @@ class PrompterProtocol(Protocol):
 	def __call__(self, message: str) -> Union[str, bool]: ...
 
 
+_NEG_STAT_TTL = 0.1  # seconds a cached "path is missing" answer is trusted
+_NEG_STAT_MAX = 1024  # negative cache entries per instance before it is reset
+
+
+@lru_cache(maxsize=256)
+def _abs_cached(base: str, p: str) -> Path:
+	"""
+	String-keyed :meth:`PathOpsBase._abs`: batches of calls with the same path string
+	(``ensure_parent`` → ``make_folder`` → ...) build the ``Path`` only once. Purely
+	lexical (no filesystem access), so nothing needs invalidating; keying on *base*
+	covers a changed ``base_dir``.
+	"""
+	pth = Path(p)
+	return pth if pth.is_absolute() else (Path(base) / pth)
+
+
 class PathOpsBase:
 	"""
 	Shared state and core helpers for filesystem operations.
@@ -34,6 +55,11 @@ class PathOpsBase:
 					the intended action and return early.
 	:param input_func: Function used for interactive prompts. Defaults to :func:`input`.
 	"""
+	# Public methods return ``target.resolve()`` (symlinks and ``..`` collapsed). Subclasses
+	# or batch callers may switch this off to get the already absolute ``_abs()`` path back
+	# without the per-component lstat walk.
+	_resolve_returns: bool = True
+
 	def __init__(
 			self,
 			base_dir: Optional[PathLike] = None,
@@ -45,6 +71,13 @@ class PathOpsBase:
 		self.base_dir = Path(base_dir).resolve() if base_dir else Path.cwd()
 		self.dry_run = bool(dry_run)
 		self.input_func = input_func or input
+		# Parent dirs ensured by this instance (see Create.ensure_parent);
+		# str -> resolved Path, or None until a public caller asked for it
+		self._ensured_dirs: Dict[str, Optional[Path]] = {}
+		# Directories found by Dirs.try_get_dir: (raw path, base_dir) -> (monotonic stamp, resolved)
+		self._dir_resolve_cache: Dict[Tuple[str, str], Tuple[float, Path]] = {}
+		# Recent "does not exist" answers from _quick_exists: str -> time.monotonic() stamp
+		self._neg_stat_cache: Dict[str, float] = {}
 
 	# --- Construction helpers ---
 	@classmethod
@@ -91,9 +124,73 @@ class PathOpsBase:
 		:param p: Absolute or relative file system path.
 		:return: Absolute path.
 		"""
+		if isinstance(p, str):
+			return _abs_cached(str(self.base_dir), p)
 		pth = Path(p)
 		return pth if pth.is_absolute() else (self.base_dir / pth)
 
+	def _final(self, target: Path) -> Path:
+		"""Return *target* the way public methods hand it back: resolved unless ``_resolve_returns`` is off."""
+		return target.resolve() if self._resolve_returns else target
+
+	def _forget_dir_caches(self) -> None:
+		"""Drop the ``ensure_parent`` and ``try_get_dir`` caches after directories were removed, moved or renamed."""
+		self._ensured_dirs.clear()
+		self._dir_resolve_cache.clear()
+
+	def _quick_exists(self, path: PathLike) -> bool:
+		"""
+		:func:`os.path.lexists` that trusts a "missing" answer for ``_NEG_STAT_TTL`` seconds.
+
+		Only for probes where a stale answer is harmless (e.g., ``dry_run`` planning);
+		creations by this instance drop the affected entries via :meth:`_note_created`.
+		"""
+		key = os.fspath(path)
+		now = time.monotonic()
+		seen = self._neg_stat_cache.get(key)
+		if seen is not None and now - seen < _NEG_STAT_TTL:
+			return False
+		if os.path.lexists(key):
+			self._neg_stat_cache.pop(key, None)
+			return True
+		if len(self._neg_stat_cache) >= _NEG_STAT_MAX:
+			self._neg_stat_cache.clear()
+		self._neg_stat_cache[key] = now
+		return False
+
+	def _note_created(self, path: PathLike) -> None:
+		"""Forget cached "missing" answers for *path* and all its parents."""
+		if not self._neg_stat_cache:
+			return
+		key = os.fspath(path)
+		while True:
+			self._neg_stat_cache.pop(key, None)
+			parent = os.path.dirname(key)
+			if parent == key:
+				break
+			key = parent
+
+	@staticmethod
+	def _classify(target: PathLike, *, follow_symlinks: bool = False) -> Optional[Tuple[int, os.stat_result]]:
+		"""
+		Stat *target* once and return ``(stat.S_IFMT(st_mode), st)``, or ``None`` if it is missing.
+
+		Lets callers branch on ``S_IFLNK`` / ``S_IFREG`` / ``S_IFDIR`` without one syscall
+		per ``exists()`` / ``is_*()`` question.
+
+		:param target: Path to inspect.
+		:param follow_symlinks: If False (default) use ``lstat`` so symlinks report ``S_IFLNK``.
+		:return: File type bits and the stat result, or ``None`` when nothing is there.
+		"""
+		try:
+			st = os.stat(target, follow_symlinks=follow_symlinks)
+		except OSError as exc:
+			# Same errors Path.exists() treats as "missing"
+			if exc.errno in (errno.ENOENT, errno.ENOTDIR, errno.EBADF, errno.ELOOP):
+				return None
+			raise
+		return stat.S_IFMT(st.st_mode), st
+
 	@staticmethod
 	def _apply_mode(target: Path, mode: Optional[int]) -> None:
 		"""Best-effort chmod; log, do not propagate errors."""
@@ -2,11 +2,13 @@
 
 from __future__ import annotations
 
+import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, Optional, Union
+from typing import Dict, Iterator, List, Optional, Tuple, Union
 
 from ..logutil import get_logger
-from .inspect import build_metadata
+from .inspect import _guess_mime, build_metadata
 
 LOG = get_logger(__name__)
 
@@ -18,6 +20,37 @@ except ImportError:
 
 __all__ = ["Classify"]
 
+#: Exact MIME -> label matches; checked before the family prefixes below.
+_EXACT_MIME: Dict[str, str] = {
+	# text specializations
+	"text/csv": "comma_separated_values",
+	"text/tab-separated-values": "comma_separated_values",
+	"text/xml": "extensible_markup_language",
+	# common apps
+	"application/vnd.ms-excel": "ms_excel_spreadsheet",
+	"application/vnd.openxmlformats-officedocument.spreadsheetml.sheet": "ms_excel_spreadsheet",
+	"application/vnd.ms-excel.sheet.macroenabled.12": "ms_excel_spreadsheet",
+	"application/pdf": "portable_document_format",
+	"application/json": "javascript_object_notation",
+	# archive types
+	"application/zip": "zip_archive",
+	"application/x-zip-compressed": "zip_archive",
+	"application/x-tar": "tar_archive",
+	"application/x-gtar": "tar_archive",
+	"application/vnd.rar": "rar_archive",
+	"application/x-rar-compressed": "rar_archive",
+	# data formats
+	"application/x-pkcs7-certificates": "uv_vis_spectrum_spc",
+}
+
+#: MIME family prefixes -> label.
+_PREFIX_MIME: Tuple[Tuple[str, str], ...] = (
+	("image/", "image"),
+	("video/", "video"),
+	("audio/", "audio"),
+	("text/", "text_only"),
+)
+
 
 class Classify:
 	"""
@@ -61,46 +94,14 @@ class Classify:
 			return None
 
 		m = mime.lower()
+		label = _EXACT_MIME.get(m)
+		if label:
+			return label
 
 		# broad families
-		if m.startswith("image/"):
-			return "image"
-		if m.startswith("video/"):
-			return "video"
-		if m.startswith("audio/"):
-			return "audio"
-		if m.startswith("text/"):
-			if m in {"text/csv", "text/tab-separated-values"}:
-				return "comma_separated_values"
-			if m == "text/xml":
-				return "extensible_markup_language"
-			return "text_only"
-
-		# common apps
-		if m in {
-			"application/vnd.ms-excel",
-			"application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
-			"application/vnd.ms-excel.sheet.macroenabled.12"
-		}:
-			return "ms_excel_spreadsheet"
-
-		if m == "application/pdf":
-			return "portable_document_format"
-
-		if m == "application/json":
-			return "javascript_object_notation"
-
-		# archive types
-		if m in {"application/zip", "application/x-zip-compressed"}:
-			return "zip_archive"
-		if m in {"application/x-tar", "application/x-gtar"}:
-			return "tar_archive"
-		if m in {"application/vnd.rar", "application/x-rar-compressed"}:
-			return "rar_archive"
-
-		# data formats
-		if m == "application/x-pkcs7-certificates":
-			return "uv_vis_spectrum_spc"
+		for prefix, label in _PREFIX_MIME:
+			if m.startswith(prefix):
+				return label
 
 		return None
 
@@ -125,3 +126,57 @@ class Classify:
 			return self.DEFAULT_TYPE_BY_EXT[ext]
 
 		return "unknown"
+
+	def _label_for_name(self, name: str) -> str:
+		"""Label a regular file from its name alone: MIME first, then the extension table."""
+		label = self._from_mime(_guess_mime(name))
+		if label:
+			return label
+		return self.DEFAULT_TYPE_BY_EXT.get(os.path.splitext(name)[1].lower(), "unknown")
+
+	def _scan_dir(self, folder: str) -> Tuple[List[Tuple[Path, str]], List[str]]:
+		"""Label the entries of one directory; return them with the subdirectories to descend into."""
+		labelled: List[Tuple[Path, str]] = []
+		subdirs: List[str] = []
+		with os.scandir(folder) as it:
+			for entry in it:
+				if entry.is_dir():
+					labelled.append((Path(entry.path), "folder"))
+					# Symlinked directories are labelled but not followed (no cycles)
+					if not entry.is_symlink():
+						subdirs.append(entry.path)
+				else:
+					labelled.append((Path(entry.path), self._label_for_name(entry.name)))
+		return labelled, subdirs
+
+	def classify_tree(self, root: Union[Path, str], *, workers: int = 1) -> Iterator[Tuple[Path, str]]:
+		"""
+		Classify everything below *root* in one :func:`os.scandir` walk.
+
+		Yields ``(path, label)`` with the same labels as :meth:`classify_path`, but
+		files are labelled from the directory listing and their name, without a
+		per-file ``stat``. Directories are yielded as ``"folder"``;
+		symlinked directories are not followed.
+
+		:param root: Directory to walk (absolute or relative to ``base_dir``).
+		:param workers: Threads listing directories concurrently (one tree level at a time).
+		:return: Iterator of ``(path, label)`` pairs, parents before children.
+		:raises NotADirectoryError: If *root* is not a directory.
+		"""
+		top = Paths().resolve_path(root)
+		if not top.is_dir():
+			raise NotADirectoryError(f"Not a directory: '{top}'.")
+
+		level = [os.fspath(top)]
+		executor = ThreadPoolExecutor(max_workers=workers) if workers > 1 else None
+		try:
+			while level:
+				scans = executor.map(self._scan_dir, level) if executor else map(self._scan_dir, level)
+				next_level: List[str] = []
+				for labelled, subdirs in scans:
+					yield from labelled
+					next_level.extend(subdirs)
+				level = next_level
+		finally:
+			if executor is not None:
+				executor.shutdown(wait=False, cancel_futures=True)
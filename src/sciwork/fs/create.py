@@ -2,8 +2,10 @@
 
 from __future__ import annotations
 
+import os
+import stat
 from pathlib import Path
-from typing import Optional
+from typing import Callable, Optional
 
 from ..logutil import get_logger
 from .base import PathOpsBase, PathLike
@@ -12,6 +14,8 @@ LOG = get_logger(__name__)
 
 __all__ = ["Create"]
 
+_ENSURED_DIRS_MAX = 1024  # ensure_parent cache entries per instance before it is reset
+
 
 class Create(PathOpsBase):
 	"""
@@ -25,14 +29,55 @@ class Create(PathOpsBase):
 
 		Resolves ``path`` relative to ``base_dir`` (if not absolute) and ensures
 		that ``path.parent`` exists (creating it if needed). Honors ``dry_run``.
+		Parents ensured before by this instance are returned from a cache without
+		touching the filesystem; deletes, moves and renames through this instance
+		clear that cache.
 
 		:param path: File path whose parent directory will be ensured.
 		:param mode: Permission bits for newly created directories (ignored on Windows).
 		:return: Resolved the absolute parent directory path.
 		"""
 		parent = self._abs(path).parent
-		self.make_folder(parent, exist_ok=True, mode=mode)
-		return parent.resolve()
+		self._ensure_dir(parent, mode=mode)
+		if not self._resolve_returns:
+			return parent
+
+		key = os.fspath(parent)
+		resolved = self._ensured_dirs.get(key)
+		if resolved is None:
+			resolved = parent.resolve()
+			if key in self._ensured_dirs:
+				self._ensured_dirs[key] = resolved
+		return resolved
+
+	def _ensure_dir(self, directory: Path, *, mode: int = 0o777) -> None:
+		"""
+		Make sure the absolute *directory* exists (no path resolution); directories
+		ensured before by this instance are skipped without touching the filesystem.
+		"""
+		key = os.fspath(directory)
+		if key in self._ensured_dirs:
+			return
+
+		self._mkdir(directory, exist_ok=True, mode=mode)
+		if not self.dry_run:
+			if len(self._ensured_dirs) >= _ENSURED_DIRS_MAX:
+				self._ensured_dirs.clear()
+			self._ensured_dirs[key] = None
+
+	def _create_with_parent(self, target: Path, action: Callable[[], None], *, create_parents: bool) -> None:
+		"""
+		Run *action* (which creates *target*); if the parent vanished after it was cached
+		by :meth:`ensure_parent`, forget the cache, re-create the parent once and retry.
+		"""
+		try:
+			action()
+		except FileNotFoundError:
+			if not create_parents:
+				raise
+			self._forget_dir_caches()
+			self._ensure_dir(target.parent)
+			action()
 
 	# --- Files ---
 	def touch_file(
@@ -60,9 +105,10 @@ class Create(PathOpsBase):
 		:raises OSError: Other OS-level errors.
 		"""
 		target = self.coerce_file_path(path)
+		found = self._classify(target, follow_symlinks=True)
 
-		if target.exists():
-			if not target.is_file():
+		if found is not None:
+			if found[0] != stat.S_IFREG:
 				msg = f"Path exists and is not a file: {target}"
 				LOG.error(msg)
 				raise IsADirectoryError(msg)  # or NotAFileError in future Python
@@ -72,7 +118,7 @@ class Create(PathOpsBase):
 				raise FileExistsError(msg)
 			if self.dry_run:
 				LOG.info("[dry-run] touch (update mtime): %s", target)
-				return target.resolve()
+				return self._final(target)
 			target.touch(exist_ok=True)
 			if mode is not None:
 				try:
@@ -80,25 +126,26 @@ class Create(PathOpsBase):
 				except Exception as exc:
 					LOG.warning("Failed to apply mode %o to %s: %s", mode, target, exc)
 			LOG.info("Touched file: %s", target)
-			return target.resolve()
+			return self._final(target)
 
 		# not exists
 		if create_parents:
-			self.ensure_parent(target)
+			self._ensure_dir(target.parent)
 
 		if self.dry_run:
 			LOG.info("[dry-run] create file: %s", target)
-			return target.resolve()
+			return self._final(target)
 
 		try:
-			target.touch(exist_ok=True)
+			self._create_with_parent(target, lambda: target.touch(exist_ok=True), create_parents=create_parents)
+			self._note_created(target)
 			if mode is not None:
 				try:
 					target.chmod(mode)
 				except Exception as exc:
 					LOG.warning("Failed to apply mode %o to %s: %s", mode, target, exc)
 			LOG.info("Created file: %s", target)
-			return target.resolve()
+			return self._final(target)
 		except PermissionError:
 			LOG.exception("Permission denied while touching file: %s", target)
 			raise
@@ -142,16 +189,20 @@ class Create(PathOpsBase):
 		target: Path = self.coerce_file_path(path)
 
 		if create_parents:
-			self.ensure_parent(target)
+			self._ensure_dir(target.parent)
 
 		if self.dry_run:
 			LOG.info("[dry-run] create file (%s): %s", op, target)
-			return target.resolve()
+			return self._final(target)
 
 		try:
 			# create / truncate, according to mode; we don't write content
-			with open(target, op, encoding=encoding):
-				pass
+			def _open() -> None:
+				with open(target, op, encoding=encoding):
+					pass
+
+			self._create_with_parent(target, _open, create_parents=create_parents)
+			self._note_created(target)
 		except PermissionError:
 			LOG.exception("Permission denied while creating file (%s): %s:", op, target)
 			raise
@@ -162,7 +213,7 @@ class Create(PathOpsBase):
 		self._apply_mode(target, permissions)
 
 		LOG.info("Created file (%s): %s", op, target)
-		return target.resolve()
+		return self._final(target)
 
 	# --- Folders ---
 	def make_folder(
@@ -190,27 +241,56 @@ class Create(PathOpsBase):
 		:raises OSError: For other OS-level errors.
 		"""
 		target = self._abs(path)
-
-		if target.exists():
-			if not target.is_dir():
+		self._mkdir(target, exist_ok=exist_ok, mode=mode)
+		return self._final(target)
+
+	def _mkdir(self, target: Path, *, exist_ok: bool, mode: int) -> None:
+		"""Body of :meth:`make_folder` for an absolute *target*; returns nothing, resolves nothing."""
+		missing = False
+		if exist_ok and not self.dry_run:
+			# Hot path (ensure_parent): the parent usually exists, so a single mkdir
+			# syscall beats pre-stat + mkdir; EEXIST/ENOENT fall through to the checks below
+			try:
+				os.mkdir(target, mode)
+				self._note_created(target)
+				LOG.info("Created directory: %s", target)
+				return
+			except FileExistsError:
+				pass
+			except FileNotFoundError:
+				missing = True  # a parent is missing, so is the target: no need to stat it
+			except PermissionError:
+				LOG.exception("Permission denied while creating directory: %s", target)
+				raise
+			except OSError as exc:
+				LOG.exception("OS error while creating directory '%s': %s", target, exc)
+				raise
+
+		if missing or (self.dry_run and exist_ok and not self._quick_exists(target)):
+			found = None  # dry-run batches re-probe the same missing parents: negative cache
+		else:
+			found = self._classify(target, follow_symlinks=True)
+
+		if found is not None:
+			if found[0] != stat.S_IFDIR:
 				msg = f"Path exists and is not a directory: {target}"
 				LOG.error(msg)
 				raise NotADirectoryError(msg)
 			if exist_ok:
 				LOG.info("Directory already exists: %s", target)
-				return target.resolve()
+				return
 			msg = f"Directory already exists: {target}"
 			LOG.error(msg)
 			raise FileExistsError(msg)
 
 		if self.dry_run:
 			LOG.info("[dry-run] mkdir -p %s", target)
-			return target.resolve()
+			return
 
 		try:
 			Path(target).mkdir(parents=True, exist_ok=True, mode=mode)
+			self._note_created(target)
 			LOG.info("Created directory: %s", target)
-			return target.resolve()
 		except PermissionError:
 			LOG.exception("Permission denied while creating directory: %s", target)
 			raise
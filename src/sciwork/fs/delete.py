@@ -2,18 +2,28 @@
 
 from __future__ import annotations
 
+import asyncio
+import os
+import stat
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import suppress
+from functools import partial
+from itertools import chain
 from pathlib import Path
-from typing import Optional
+from typing import Iterable, Iterator, List, Optional, Tuple
 
 from ..logutil import get_logger
 from .base import PathOpsBase, PathLike
-from .filters import matches_filters, is_hidden_path
+from .filters import compile_name_filters, name_predicate
+from ._iouring import iouring_enabled, unlink_batch
 from ..imports import Send2Trash
 from .delete_utils import (
 	delete_file as _delete_file,
 	delete_dir as _delete_dir,
 	delete_symlink as _delete_symlink,
-	iter_clear_candidates
+	iter_clear_candidates,
+	iter_post_order,
+	remove_tree
 )
 
 LOG = get_logger(__name__)
@@ -28,6 +38,9 @@ class Delete(PathOpsBase):
 	The class respects :attr:`dry_run` from :class:`~sciwork.fs.base.PathOpsBase` and
 	uses :class:`~sciwork.console.Prompter` for interactive confirmations (when available).
 	"""
+	#: Log labels for :func:`stat.S_IFMT` kinds; anything else is reported as a file.
+	_KIND_LABELS = {stat.S_IFLNK: "symlink", stat.S_IFDIR: "dir"}
+
 	# --- Confirmation Helper ---
 	def _confirm_removal(self, action: str) -> bool:
 		"""
@@ -72,17 +85,19 @@ class Delete(PathOpsBase):
 		:raises ValueError: Unsupported path type or path type.
 		"""
 		target = self._abs(path)
+		found = self._classify(target)
 
-		if not target.exists():
+		if found is None:
 			if missing_ok:
 				LOG.warning("delete skipped (missing): %s", target)
 				return
 			raise FileNotFoundError(f"Path '{target}' not found.")
+		kind = found[0]
 
 		if self.dry_run:
-			kind = "symlink" if target.is_symlink() else ("dir" if target.is_dir() else "file")
-			suffix = " (recursive)" if (kind == "dir" and recursive) else ""
-			LOG.info(f"[dry-run] delete %s%s: %s", kind, suffix, target)
+			label = self._KIND_LABELS.get(kind, "file")
+			suffix = " (recursive)" if (kind == stat.S_IFDIR and recursive) else ""
+			LOG.info(f"[dry-run] delete %s%s: %s", label, suffix, target)
 			return
 
 		confirmation = self._confirm_removal(f"delete {target}") if confirm else True
@@ -90,15 +105,17 @@ class Delete(PathOpsBase):
 		# Actual deletion
 		try:
 			if confirmation:
-				# Symlinks (to files or dirs) - unlink by default
-				if target.is_symlink() and not follow_symlinks:
+				if kind == stat.S_IFLNK:
+					# Symlinks (to files or dirs) - unlink by default; follow_symlinks removes a linked dir tree
 					_delete_symlink(target, follow_symlinks=follow_symlinks)
+					self._forget_dir_caches()
 					LOG.info("Deleted symlink: %s", target)
-				elif target.is_file():
+				elif kind == stat.S_IFREG:
 					_delete_file(target)
 					LOG.info("Deleted file: %s", target)
-				elif target.is_dir():
+				elif kind == stat.S_IFDIR:
 					_delete_dir(target, recursive=recursive)
+					self._forget_dir_caches()
 					LOG.info("Deleted %s directory: %s: ", "recursive" if recursive else "empty", target)
 				else:
 					# Fallback - unusual filesystem entry
@@ -123,7 +140,7 @@ class Delete(PathOpsBase):
 		:raises FileNotFoundError: When the path does not exist and ``missing_ok`` is False.
 		"""
 		target = self._abs(path)
-		if not target.exists():
+		if not os.path.exists(target):
 			if missing_ok:
 				LOG.warning("thrash skipped (missing): %s", target)
 				return
@@ -136,6 +153,7 @@ class Delete(PathOpsBase):
 		confirmation = self._confirm_removal(f"move to thrash {target}") if confirm else True
 		if confirmation:
 			Send2Trash.send2trash(str(target))
+			self._forget_dir_caches()
 		else:
 			LOG.warning("The user has not confirmed the thrashing of: %s", target)
 			return
@@ -143,6 +161,36 @@ class Delete(PathOpsBase):
 		LOG.info("Moved to thrash: %s", target)
 
 	# --- Bulk (Clear Folder) ---
+	@staticmethod
+	def _iter_filtered_candidates(
+			root: Path,
+			*,
+			trash: bool,
+			recursive: bool,
+			include_hidden: bool,
+			pattern: Optional[str],
+			antipattern: Optional[str],
+			shell_pattern: Optional[str]
+	) -> Iterator[str]:
+		"""
+		Yield :func:`iter_clear_candidates` entries that pass the hidden and name filters.
+		Entries stay plain ``str`` paths through the whole clear pipeline.
+		"""
+		if not trash and recursive and include_hidden and not (pattern or antipattern or shell_pattern):
+			# "Delete everything": stream children-before-parents, nothing to filter or sort
+			yield from iter_post_order(root)
+			return
+
+		# walk, hidden pruning and name tests are fused into the one scandir loop
+		accept = name_predicate(compile_name_filters(
+			pattern=pattern,
+			antipattern=antipattern,
+			shell_pattern=shell_pattern
+		))
+		yield from iter_clear_candidates(
+			root, trash=trash, recursive=recursive, include_hidden=include_hidden, accept=accept
+		)
+
 	def _preflight_confirm(
 			self,
 			root: Path,
@@ -154,11 +202,15 @@ class Delete(PathOpsBase):
 			antipattern: Optional[str],
 			shell_pattern: Optional[str],
 			threshold: int
-	) -> bool:
+	) -> Tuple[bool, Optional[Iterable[str]]]:
 		"""
 		Estimate the number of candidates and ask for confirmation if count ≥ threshold.
 		Uses :meth:`Prompter.confirm` when available; otherwise falls back to a plain prompt.
 
+		The scan is not thrown away: the returned candidates chain the entries already
+		counted with the rest of the same (unfinished) walk, so the deletion pass does
+		not list the tree a second time.
+
 		:param root: The root path.
 		:param trash: If True, moves files to trash.
 		:param recursive: If True, recursively traverses the directory tree.
@@ -167,42 +219,47 @@ class Delete(PathOpsBase):
 		:param antipattern: Exclude names containing this substring.
 		:param shell_pattern: Shell-like pattern for names (e.g., "*.jpg").
 		:param threshold: Maximal number of items to be removed without confirmation.
-		:return: True if confirmed or count<threshold; False if the user declined.
+		:return: ``(confirmed, candidates)``; *confirmed* is True if confirmed or count<threshold,
+				False if the user declined. *candidates* is ``None`` when the pre-scan failed
+				and the caller has to walk again.
 		"""
-		est = 0
+		candidates = self._iter_filtered_candidates(
+			root,
+			trash=trash,
+			recursive=recursive,
+			include_hidden=include_hidden,
+			pattern=pattern,
+			antipattern=antipattern,
+			shell_pattern=shell_pattern
+		)
+		counted: List[str] = []
+		reusable: Optional[Iterable[str]]
 		try:
-			for entry in iter_clear_candidates(root, trash=trash, recursive=recursive):
-				if not include_hidden and is_hidden_path(root, entry):
-					continue
-				if not matches_filters(
-						entry.name,
-						include_hidden=True,
-						pattern=pattern,
-						antipattern=antipattern,
-						shell_pattern=shell_pattern
-				):
-					continue
-				est += 1
-				if est >= threshold:
+			for entry in candidates:
+				counted.append(entry)
+				if len(counted) >= threshold:
 					break
+			reusable = chain(counted, candidates)
 		except PermissionError as exc:
 			LOG.warning("Permission error while pre-scanning '%s': %s", root, exc)
-			est = threshold
+			counted = []
+			reusable = None
+		est = threshold if reusable is None else len(counted)
 
 		if est >= threshold:
 			msg = f"About to remove at least {est} entr{'y' if est == 1 else 'ies'} from: {root}. Continue?"
 			try:
 				ask = self._pick_prompt(None, confirm=True)
-				return ask(msg)
+				return ask(msg), reusable
 			except Exception:
 				# very defensive fallback
 				ans = input(f"{msg} [y/N]: ").strip().lower()
-				return ans in {"y", "yes"}
-		return True
+				return ans in {"y", "yes"}, reusable
+		return True, reusable
 
 	def _delete_one(
 			self,
-			entry: Path,
+			entry: PathLike,
 			*,
 			trash: bool,
 			recursive: bool,
@@ -217,33 +274,198 @@ class Delete(PathOpsBase):
 		:param recursive: For directories, delete contents recursively when not trashing.
 		:param follow_symlinks: Follow symlinks to directories when not trashing.
 		"""
+		found = self._classify(entry)
+		kind = found[0] if found is not None else None
 		if self.dry_run:
 			action = "trash" if trash else "delete"
-			kind = "symlink" if entry.is_symlink() else ("dir" if entry.is_dir() else "file")
-			suffix = " (recursive)" if (not trash and entry.is_dir() and recursive) else ""
-			LOG.info(f"[dry-run] %s %s%s: %s", action, kind, suffix, entry)
+			label = self._KIND_LABELS.get(kind, "file")
+			suffix = " (recursive)" if (not trash and kind == stat.S_IFDIR and recursive) else ""
+			LOG.info(f"[dry-run] %s %s%s: %s", action, label, suffix, entry)
 			return
 
 		if trash:
 			self.trash(entry, missing_ok=True)
 			return
 
-		if entry.is_symlink():
+		if kind is None:
+			return  # already gone
+		if kind == stat.S_IFLNK:
 			_delete_symlink(entry, follow_symlinks=follow_symlinks)
-		elif entry.is_file():
+			if follow_symlinks:
+				# The linked tree is gone; drop the now-dangling link as well
+				with suppress(FileNotFoundError):
+					os.unlink(entry)
+		elif kind == stat.S_IFREG:
 			_delete_file(entry)
-		if entry.is_dir():
+		elif kind == stat.S_IFDIR:
 			_delete_dir(entry, recursive=recursive)
 		else:
-			# Rare FS entries (FIFO, sockets...). Best-effort unlink (3.12+ has missing_ok).
+			# Rare FS entries (FIFO, sockets...). Best-effort unlink.
+			with suppress(FileNotFoundError):
+				os.unlink(entry)
+
+	def _try_delete_one(
+			self,
+			entry: PathLike,
+			*,
+			trash: bool,
+			recursive: bool,
+			follow_symlinks: bool,
+			ignore_errors: bool
+	) -> bool:
+		"""
+		:meth:`_delete_one` with ``clear_folder`` error policy.
+
+		:return: True if removed; False if it failed and ``ignore_errors`` is set.
+		:raises Exception: The deletion error when ``ignore_errors`` is False.
+		"""
+		try:
+			self._delete_one(entry, trash=trash, recursive=recursive, follow_symlinks=follow_symlinks)
+			return True
+		except Exception as exc:
+			if ignore_errors:
+				LOG.error("Failed to delete '%s': %s", entry, exc)
+				return False
+			raise
+
+	def _split_dirs(self, candidates: Iterable[str]) -> Tuple[List[str], List[str]]:
+		"""Split *candidates* into ``(non_directories, directories)``, keeping their order."""
+		leaves: List[str] = []
+		dirs: List[str] = []
+		for entry in candidates:
+			found = self._classify(entry)
+			(dirs if found is not None and found[0] == stat.S_IFDIR else leaves).append(entry)
+		return leaves, dirs
+
+	def _clear_iouring(self, candidates: Iterable[str], **options) -> int:
+		"""
+		Remove *candidates*, unlinking non-directories in io_uring batches (see :mod:`._iouring`).
+
+		Entries the batch could not remove (other than already-missing ones), symlinks
+		that must be followed, and all directories go through :meth:`_try_delete_one`.
+
+		:param candidates: Filtered entries from :meth:`_iter_filtered_candidates`.
+		:param options: Keyword arguments for :meth:`_try_delete_one`.
+		:return: Number of entries removed.
+		"""
+		leaves, dirs = self._split_dirs(candidates)
+		if options["follow_symlinks"]:
+			# Links to directories must delete the linked tree; keep those on the slow path
+			dirs[:0] = [entry for entry in leaves if os.path.islink(entry)]
+			leaves = [entry for entry in leaves if not os.path.islink(entry)]
+
+		removed = 0
+		retry: List[str] = []
+		try:
+			errors = unlink_batch(leaves)
+		except Exception as exc:  # ring setup refused (seccomp, old kernel, bindings API)
+			LOG.warning("io_uring unlink unavailable (%s); deleting entry by entry.", exc)
+			retry = leaves
+		else:
+			for entry, error in zip(leaves, errors):
+				if error is None or isinstance(error, FileNotFoundError):
+					removed += 1
+				else:
+					retry.append(entry)  # e.g., read-only file: chmod + retry path
+
+		for entry in retry + dirs:
+			removed += self._try_delete_one(entry, **options)
+		return removed
+
+	def _clear_all(self, root: Path, **options) -> int:
+		"""
+		Empty *root* completely: one :func:`remove_tree` per top-level directory instead
+		of one :meth:`_try_delete_one` per descendant; other entries go through
+		:meth:`_try_delete_one`. Every removed descendant is counted, as in the generic loop.
+
+		If a tree fails and ``ignore_errors`` is set, the rest of that tree is removed
+		entry by entry (entries removed before the failure are not counted then).
+
+		:param root: Folder to empty.
+		:param options: Keyword arguments for :meth:`_try_delete_one`.
+		:return: Number of entries removed.
+		"""
+		with os.scandir(root) as it:
+			entries = [(entry.path, entry.is_dir(follow_symlinks=False)) for entry in it]
+
+		removed = 0
+		for path, is_dir in entries:
+			if not is_dir:
+				removed += self._try_delete_one(path, **options)
+				continue
 			try:
-				entry.unlink(missing_ok=True)  # type: ignore[arg-type]
-			except TypeError:
-				# fallback for older Python
-				try:
-					entry.unlink()
-				except FileNotFoundError:
-					pass
+				removed += remove_tree(path)
+				LOG.info("Deleted recursive directory: %s", path)
+			except Exception as exc:
+				if not options["ignore_errors"]:
+					raise
+				LOG.error("Failed to delete '%s': %s; retrying entry by entry", path, exc)
+				rest = chain(iter_post_order(path), [path])
+				removed += sum(self._try_delete_one(entry, **options) for entry in rest)
+		return removed
+
+	def _clear_parallel(self, candidates: Iterable[str], *, max_workers: int, **options) -> int:
+		"""
+		Remove *candidates* with non-directories spread over a thread pool.
+
+		Directories keep their candidate order (deepest first) and are removed on the
+		calling thread once all other entries are gone.
+
+		:param candidates: Filtered entries from :meth:`_iter_filtered_candidates`.
+		:param max_workers: Thread pool size.
+		:param options: Keyword arguments for :meth:`_try_delete_one`.
+		:return: Number of entries removed.
+		"""
+		leaves, dirs = self._split_dirs(candidates)
+		with ThreadPoolExecutor(max_workers=max_workers) as executor:
+			removed = sum(executor.map(partial(self._try_delete_one, **options), leaves))
+		for entry in dirs:
+			removed += self._try_delete_one(entry, **options)
+		return removed
+
+	def _plan_clear(
+			self,
+			folder: PathLike,
+			*,
+			missing_ok: bool,
+			confirm_if_over: Optional[int],
+			**filters
+	) -> Tuple[Optional[Path], Optional[Iterable[str]]]:
+		"""
+		Resolve the folder to clear, run the ``confirm_if_over`` safety rail and return
+		``(root, candidates)``; ``(None, None)`` when there is nothing to do (missing
+		folder with ``missing_ok`` or a declined confirmation).
+
+		:param filters: Keyword arguments for :meth:`_iter_filtered_candidates`.
+		"""
+		try:
+			from .dirs import Dirs
+		except Exception:
+			LOG.error("clear_folder requires the optional dependency 'sciwork.fs.Dirs' to work.")
+			raise
+
+		root = Dirs().try_get_dir(folder, missing_ok=missing_ok)
+		if root is None:
+			return None, None
+
+		# Safety rail: preflight confirmation (its scan is reused for the deletion pass)
+		candidates: Optional[Iterable[str]] = None
+		if confirm_if_over and confirm_if_over > 0:
+			confirmed, candidates = self._preflight_confirm(root, threshold=confirm_if_over, **filters)
+			if not confirmed:
+				LOG.warning("User declined clear_folder in %s", root)
+				return None, None
+
+		if candidates is None:
+			candidates = self._iter_filtered_candidates(root, **filters)
+		return root, candidates
+
+	def _finish_clear(self, root: Path, removed: int) -> int:
+		"""Invalidate the ``ensure_parent`` cache if anything went and log the summary."""
+		if removed:
+			self._forget_dir_caches()
+		LOG.info("Cleared %d entr%s from: %s", removed, "y" if removed == 1 else "ies", root)
+		return removed
 
 	def clear_folder(
 			self,
@@ -258,7 +480,8 @@ class Delete(PathOpsBase):
 			follow_symlinks: bool = False,
 			missing_ok: bool = False,
 			ignore_errors: bool = False,
-			confirm_if_over: Optional[int] = None
+			confirm_if_over: Optional[int] = None,
+			max_workers: int = 1
 	) -> int:
 		"""
 		Remove all entries from a folder while **keeping the folder itself**.
@@ -298,70 +521,119 @@ class Delete(PathOpsBase):
 		:param confirm_if_over: Threshold for interactive confirmation before deletion.
 								If the number of matching entries is >= this value,
 								prompt the user via ``input_func``.
+		:param max_workers: With more than one worker (permanent deletion, not ``dry_run``),
+							non-directory entries are removed on a thread pool; directories
+							are removed afterward on the calling thread, deepest first.
+							On Linux, ``SCIWORK_FS_IOURING=1`` (with :mod:`liburing` installed)
+							instead unlinks non-directories in io_uring batches.
 		:return: Number of entries removed (or that would be if ``dry_run`` is True).
 		:raises FileNotFoundError: If *folder* does not exist and ``missing_ok`` is False.
 		:raises NotADirectoryError: If *folder* exists but is not a directory.
 		"""
-		try:
-			from .dirs import Dirs
-		except Exception:
-			LOG.error("clear_folder requires the optional dependency 'sciwork.fs.Dirs' to work.")
-			raise
-
-		root = Dirs().try_get_dir(folder, missing_ok=missing_ok)
+		root, candidates = self._plan_clear(
+			folder,
+			missing_ok=missing_ok,
+			confirm_if_over=confirm_if_over,
+			trash=trash,
+			recursive=recursive,
+			include_hidden=include_hidden,
+			pattern=pattern,
+			antipattern=antipattern,
+			shell_pattern=shell_pattern
+		)
 		if root is None:
 			return 0
 
-		# Safety rail: preflight confirmation
-		if confirm_if_over and confirm_if_over > 0:
+		options = dict(
+			trash=trash,
+			recursive=recursive,
+			follow_symlinks=follow_symlinks,
+			ignore_errors=ignore_errors
+		)
+		# "rm -rf folder/*" without filters; nested links are never followed on that path
+		everything = (
+			not trash and recursive and include_hidden and not follow_symlinks
+			and not (pattern or antipattern or shell_pattern)
+		)
+		removed = 0
+		try:
+			if not trash and not self.dry_run and iouring_enabled():
+				removed = self._clear_iouring(candidates, **options)
+			elif max_workers > 1 and not trash and not self.dry_run:
+				removed = self._clear_parallel(candidates, max_workers=max_workers, **options)
+			elif everything and not confirm_if_over and not self.dry_run:
+				removed = self._clear_all(root, **options)
+			else:
+				for entry in candidates:
+					removed += self._try_delete_one(entry, **options)
+		except PermissionError as exc:
+			if ignore_errors:
+				LOG.warning("Permission error while clearing '%s': %s", root, exc)
+			else:
+				raise
 
-			if not self._preflight_confirm(
-				root,
-				trash=trash,
-				recursive=recursive,
-				include_hidden=include_hidden,
-				pattern=pattern,
-				antipattern=antipattern,
-				shell_pattern=shell_pattern,
-				threshold=confirm_if_over
-			):
-				LOG.warning("User declined clear_folder in %s", root)
-				return 0
+		return self._finish_clear(root, removed)
+
+	async def aclear_folder(
+			self,
+			folder: PathLike,
+			*,
+			recursive: bool = True,
+			include_hidden: bool = True,
+			pattern: Optional[str] = None,
+			antipattern: Optional[str] = None,
+			shell_pattern: Optional[str] = None,
+			trash: bool = False,
+			follow_symlinks: bool = False,
+			missing_ok: bool = False,
+			ignore_errors: bool = False,
+			confirm_if_over: Optional[int] = None
+	) -> int:
+		"""
+		Awaitable variant of :meth:`clear_folder` for code that already runs an event loop.
+
+		The candidate walk (and the ``confirm_if_over`` prompt) runs in a worker thread.
+		For permanent deletion, every non-directory entry is then removed in its own
+		:func:`asyncio.to_thread` call, all awaited together; directories follow
+		afterward one by one, deepest first. With ``trash`` or ``dry_run`` the entries
+		are handled sequentially in a single worker thread.
 
+		Parameters, return value and exceptions are those of :meth:`clear_folder`.
+		"""
+		root, candidates = await asyncio.to_thread(
+			self._plan_clear,
+			folder,
+			missing_ok=missing_ok,
+			confirm_if_over=confirm_if_over,
+			trash=trash,
+			recursive=recursive,
+			include_hidden=include_hidden,
+			pattern=pattern,
+			antipattern=antipattern,
+			shell_pattern=shell_pattern
+		)
+		if root is None:
+			return 0
+
+		options = dict(
+			trash=trash,
+			recursive=recursive,
+			follow_symlinks=follow_symlinks,
+			ignore_errors=ignore_errors
+		)
+		delete_one = partial(self._try_delete_one, **options)
 		removed = 0
 		try:
-			for entry in iter_clear_candidates(root, trash=trash, recursive=recursive):
-				# hidden filter
-				if not include_hidden and is_hidden_path(root, entry):
-					continue
-				# name filters
-				if not matches_filters(
-						entry.name,
-						include_hidden=True,  # hidden paths handled above
-						pattern=pattern,
-						antipattern=antipattern,
-						shell_pattern=shell_pattern
-				):
-					continue
-
-				try:
-					self._delete_one(
-						entry,
-						trash=trash,
-						recursive=recursive,
-						follow_symlinks=follow_symlinks
-					)
-					removed += 1
-				except Exception as exc:
-					if ignore_errors:
-						LOG.error("Failed to delete '%s': %s", entry, exc)
-						continue
-					raise
+			if trash or self.dry_run:
+				removed = await asyncio.to_thread(lambda: sum(map(delete_one, candidates)))
+			else:
+				leaves, dirs = await asyncio.to_thread(self._split_dirs, candidates)
+				done = await asyncio.gather(*(asyncio.to_thread(delete_one, entry) for entry in leaves))
+				removed = sum(done) + await asyncio.to_thread(lambda: sum(map(delete_one, dirs)))
 		except PermissionError as exc:
 			if ignore_errors:
 				LOG.warning("Permission error while clearing '%s': %s", root, exc)
 			else:
 				raise
 
-		LOG.info("Cleared %d entr%s from: %s", removed, "y" if removed == 1 else "ies", root)
-		return removed
+		return self._finish_clear(root, removed)
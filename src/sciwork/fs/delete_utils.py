@@ -5,11 +5,15 @@ from __future__ import annotations
 import os
 import shutil
 import stat
+import sys
+from operator import itemgetter
 from pathlib import Path
 from types import TracebackType
-from typing import Any, Callable, Iterable
+from typing import Any, Callable, Iterable, Iterator, Optional
 
 from ..logutil import get_logger
+from .base import PathLike
+from .filters import is_hidden_name
 
 LOG = get_logger(__name__)
 
@@ -18,7 +22,9 @@ __all__ = [
 	"delete_file",
 	"delete_dir",
 	"delete_symlink",
-	"iter_clear_candidates"
+	"remove_tree",
+	"iter_clear_candidates",
+	"iter_post_order"
 ]
 
 
@@ -50,51 +56,169 @@ def rmtree_onerror(
 		raise
 
 
-def delete_file(target: Path) -> None:
+# Removal relative to open directory fds (no per-entry path lookup), where the platform has it
+_FWALK_OK = hasattr(os, "fwalk") and {os.unlink, os.rmdir, os.chmod} <= os.supports_dir_fd
+
+
+def _raise(exc: OSError) -> None:
+	"""``onerror`` for :func:`os.fwalk`: an unreadable directory must not be skipped silently."""
+	raise exc
+
+
+def _remove_at(func: Callable[..., Any], name: str, dir_fd: int) -> None:
+	"""
+	Run ``func(name, dir_fd=dir_fd)``; on a permission error ``chmod +w`` and retry
+	once, mirroring :func:`rmtree_onerror`.
+	"""
+	try:
+		func(name, dir_fd=dir_fd)
+	except PermissionError as exc:
+		try:
+			os.chmod(name, stat.S_IWRITE, dir_fd=dir_fd)
+			func(name, dir_fd=dir_fd)
+		except Exception:
+			LOG.error("rmtree onerror: failed to remove %s after chmod +w", name, exc_info=exc)
+			raise
+
+
+def remove_tree(target: PathLike) -> int:
+	"""
+	Remove the directory tree at *target* bottom-up with :func:`os.fwalk`: every
+	unlink/rmdir goes through the open fd of its parent directory. Symlinks are
+	unlinked, never followed. Falls back to :func:`shutil.rmtree` where ``dir_fd``
+	is not supported (Windows).
+
+	:param target: Directory to remove (not a symlink).
+	:return: Number of removed entries, *target* included.
+	"""
+	if not _FWALK_OK:
+		count = sum(len(dirnames) + len(filenames) for _, dirnames, filenames in os.walk(target))
+		shutil.rmtree(target, onerror=rmtree_onerror)
+		return count + 1
+
+	count = 0
+	for _, dirnames, filenames, dir_fd in os.fwalk(
+			target, topdown=False, onerror=_raise, follow_symlinks=False
+	):
+		for name in filenames:
+			_remove_at(os.unlink, name, dir_fd)
+		for name in dirnames:
+			# symlinks to directories are listed here too (not descended into)
+			try:
+				_remove_at(os.rmdir, name, dir_fd)
+			except NotADirectoryError:
+				_remove_at(os.unlink, name, dir_fd)
+		count += len(filenames) + len(dirnames)
+	try:
+		os.rmdir(target)
+	except PermissionError:
+		rmtree_onerror(os.rmdir, os.fspath(target), sys.exc_info())
+	return count + 1
+
+
+def delete_file(target: PathLike) -> None:
 	"""Unlink a regular file; on permission error try to make it writable and retry.."""
+	path = os.fspath(target)
 	try:
-		target.unlink()
+		os.unlink(path)
 	except PermissionError:
 		# try to make writable then retry
-		target.chmod(stat.S_IWRITE)
-		target.unlink()
+		os.chmod(path, stat.S_IWRITE)
+		os.unlink(path)
 
 
-def delete_dir(target: Path, *, recursive: bool) -> None:
+def delete_dir(target: PathLike, *, recursive: bool) -> None:
 	"""Remove an empty directory or a whole tree (``recursive=True``)."""
 	if recursive:
-		shutil.rmtree(target, onerror=rmtree_onerror)
+		remove_tree(target)
 	else:
-		target.rmdir()
+		os.rmdir(target)
 
 
-def delete_symlink(target: Path, *, follow_symlinks: bool) -> None:
+def delete_symlink(target: PathLike, *, follow_symlinks: bool) -> None:
 	"""
 	Remove a symlink. If it points to a directory and ``follow_symlinks=True``,
 	delete the *target directory tree*; otherwise unlink the link itself.
 	"""
-	if follow_symlinks and target.is_dir():
-		# follow the link to dir → delete the tree it points to
-		shutil.rmtree(target.resolve(), onerror=rmtree_onerror)
+	if follow_symlinks and os.path.isdir(target):
+		# follow the link to dir → delete the tree it points to; one readlink instead
+		# of canonicalizing every component (an absolute link replaces the parent in join)
+		tree = os.path.join(os.path.dirname(target), os.readlink(target))
+		if os.path.islink(tree):
+			tree = os.path.realpath(tree)  # chained links: let realpath follow the rest
+		remove_tree(tree)
 	else:
-		target.unlink()
+		os.unlink(target)
 
 
 def iter_clear_candidates(
-		root: Path, *, trash: bool, recursive: bool
-) -> Iterable[Path]:
+		root: Path,
+		*,
+		trash: bool,
+		recursive: bool,
+		include_hidden: bool = True,
+		accept: Optional[Callable[[str], bool]] = None
+) -> Iterable[str]:
 	"""
 	Iterate entries to be cleared from *root* (the directory itself is kept).
 
 	:param root: Directory whose *contents* we clear.
 	:param trash: When trashing, return only top-level entries (trash can remove trees).
 	:param recursive: For permanent delete, optionally traverse recursively (files first).
-	:return: Iterable of candidate paths.
+	:param include_hidden: If False, skip entries with any component below *root*
+							starting with ``.``; hidden directories are not even entered.
+	:param accept: Optional name test (see :func:`~sciwork.fs.filters.name_predicate`);
+					rejected entries are not yielded, but rejected directories are
+					still walked.
+	:return: Iterable of candidate paths (``str``, joined onto *root*).
 	"""
-	if trash:
-		# Send2Trash can trash trees directly; top-level is enough
-		return list(root.iterdir())
-	if recursive:
-		# Files first, deepest directories later → sort by (is_dir, -depth)
-		return sorted(root.rglob("*"), key=lambda p: (p.is_dir(), -len(p.parts)))
-	return list(root.iterdir())
+	if trash or not recursive:
+		# Top-level only (Send2Trash can trash trees directly)
+		with os.scandir(root) as it:
+			return [
+				entry.path for entry in it
+				if (include_hidden or not is_hidden_name(entry.name))
+				and (accept is None or accept(entry.name))
+			]
+
+	# Files first, deepest directories later → sort by (is_dir, -depth). The type comes
+	# from the cached ``DirEntry`` data, so the walk and the sort key cost no extra stat.
+	# A hidden directory would only yield hidden candidates, so it is pruned whole.
+	# Name tests run inside the walk, so rejected entries are never collected or sorted.
+	found: list[tuple[bool, int, str]] = []
+	pending = [(os.fspath(root), 1)]
+	add, push, pop = found.append, pending.append, pending.pop
+	while pending:
+		folder, depth = pop()
+		with os.scandir(folder) as it:
+			for entry in it:
+				name = entry.name
+				if not include_hidden and name.startswith("."):
+					continue
+				is_dir = entry.is_dir(follow_symlinks=False)  # symlinked dirs are not descended into
+				if accept is None or accept(name):
+					add((is_dir, -depth, entry.path))
+				if is_dir:
+					push((entry.path, depth + 1))
+	found.sort(key=itemgetter(0, 1))  # stable: keeps walk order within (is_dir, depth)
+	return (path for _, _, path in found)
+
+
+def iter_post_order(root: PathLike) -> Iterator[str]:
+	"""
+	Stream every entry below *root* (the directory itself excluded) so that each
+	directory comes right after its contents, using :func:`os.walk` bottom-up.
+
+	Unlike :func:`iter_clear_candidates` nothing is collected or sorted, so entries
+	can be removed while the walk goes on. Symlinks to directories are yielded, not
+	descended into. Unreadable directories raise instead of being skipped.
+
+	:param root: Directory whose *contents* we clear.
+	:return: Iterator of entry paths (``str``), children before their parents.
+	"""
+	join = os.path.join
+	for folder, dirnames, filenames in os.walk(root, topdown=False, onerror=_raise):
+		for name in filenames:
+			yield join(folder, name)
+		for name in dirnames:
+			yield join(folder, name)
@@ -2,21 +2,27 @@
 
 from __future__ import annotations
 
+import os
+import stat
 import time
 import tempfile
 from contextlib import contextmanager
 
 from pathlib import Path
-from typing import Optional, Generator, Any
+from typing import Optional, Generator, Any, List, Tuple
 
 from ..logutil import get_logger
 from .base import PathOpsBase, PathLike
-from .filters import matches_filters, iter_dir_filtered
+from .filters import compile_name_filters, filter_names, name_predicate
+from ._dirwatch import open_dir_watch
 
 LOG = get_logger(__name__)
 
 __all__ = ["Dirs"]
 
+_DIR_CACHE_TTL = 1.0  # seconds a try_get_dir result is reused
+_DIR_CACHE_MAX = 128  # cached try_get_dir results per instance
+
 
 class Dirs(PathOpsBase):
 	"""
@@ -39,10 +45,11 @@ class Dirs(PathOpsBase):
 		:raises FileNotFoundError: When the directory does not exist and ``create=False``.
 		"""
 		target = self._abs(p)
-		if target.exists():
-			if not target.is_dir():
+		found = self._classify(target, follow_symlinks=True)  # one stat instead of exists + is_dir
+		if found is not None:
+			if found[0] != stat.S_IFDIR:
 				raise NotADirectoryError(f"Path exists and is not a directory: {target}")
-			return target.resolve()
+			return Path(os.path.realpath(target))
 
 		if create:
 			from .create import Create
@@ -61,26 +68,62 @@ class Dirs(PathOpsBase):
 		:return: Resolved directory path, or ``None`` when missing and ``missing_ok=True``.
 		:raises FileNotFoundError: When missing and ``missing_ok`` is ``False``.
 		:raises NotADirectoryError: Whe the path exists but is not a directory.
+
+		Found directories are remembered for ``_DIR_CACHE_TTL`` seconds (polling loops
+		and nested helpers ask for the same folder repeatedly); deletes, moves and
+		renames through this instance drop the cache.
 		"""
 		raw = str(folder_path).strip() if isinstance(folder_path, PathLike) else ""
+		key = (raw, str(self.base_dir))
+		now = time.monotonic()
+		hit = self._dir_resolve_cache.get(key)
+		if hit is not None and now - hit[0] < _DIR_CACHE_TTL:
+			return hit[1]
+
 		if raw in {"", ".", "./", ".\\"}:
 			root = self.base_dir
 		else:
 			root = self._abs(raw)
 
-		if not root.exists() and raw and raw == self.base_dir.name and self.base_dir.exists():
-			root = self.base_dir
+		found = self._classify(root, follow_symlinks=True)
+		if found is None and raw and raw == self.base_dir.name:
+			base_found = self._classify(self.base_dir, follow_symlinks=True)
+			if base_found is not None:
+				root, found = self.base_dir, base_found
 
-		if not root.exists():
+		if found is None:
 			if missing_ok:
 				LOG.warning("Directory not found (missing_ok=True): %s", root)
 				return None
 			raise FileNotFoundError(f"Directory does not exist: {root}")
-		if not root.is_dir():
+		if found[0] != stat.S_IFDIR:
 			raise NotADirectoryError(f"Path exists but is not a directory: {root}")
-		return root.resolve()
+
+		resolved = Path(os.path.realpath(root))
+		if len(self._dir_resolve_cache) >= _DIR_CACHE_MAX:
+			del self._dir_resolve_cache[next(iter(self._dir_resolve_cache))]  # FIFO eviction
+		self._dir_resolve_cache[key] = (now, resolved)
+		return resolved
 
 	# --- Queries ---
+	@staticmethod
+	def _snapshot_dir(root: Path) -> List[Tuple[str, bool]]:
+		"""Read *root* once into ``(name, is_file)`` pairs from the cached ``DirEntry`` data."""
+		with os.scandir(root) as it:
+			return [(entry.name, entry.is_file()) for entry in it]
+
+	def _matching_names(self, root: Path, *, files_only: bool, **filters) -> List[str]:
+		"""
+		Names of the direct children of *root* passing the filters.
+
+		:param root: Directory to scan (non-recursive).
+		:param files_only: Consider files only (no subdirectories).
+		:param filters: Keyword arguments for :func:`~sciwork.fs.filters.filter_names`.
+		:return: Matching names in scan order.
+		"""
+		names = [name for name, is_file in self._snapshot_dir(root) if is_file or not files_only]
+		return filter_names(names, **filters)
+
 	def is_folder_empty(
 			self,
 			folder_path: Optional[PathLike] = None,
@@ -112,19 +155,28 @@ class Dirs(PathOpsBase):
 		root = self.try_get_dir(inspected)
 		assert root is not None  # try_get_dir raises when missing_ok=False
 
-		# Fast path: return on first match
-		for entry in root.iterdir():
-			if files_only and not entry.is_file():
-				continue
-			if matches_filters(
-					entry.name,
-					include_hidden=include_hidden,
-					pattern=pattern,
-					antipattern=antipattern,
-					shell_pattern=shell_pattern
-			):
-				LOG.info("Folder %s is not empty", root)
-				return False
+		accept = name_predicate(compile_name_filters(
+			include_hidden=include_hidden,
+			pattern=pattern,
+			antipattern=antipattern,
+			shell_pattern=shell_pattern
+		))
+		# The first surviving entry decides; the rest of the directory is never read
+		try:
+			with os.scandir(root) as it:
+				empty = not any(
+					(accept is None or accept(entry.name)) and (not files_only or entry.is_file())
+					for entry in it
+				)
+		except FileNotFoundError:
+			# Cached by try_get_dir but removed by someone else since: re-check uncached,
+			# so the caller gets the usual "Directory does not exist" error
+			self._forget_dir_caches()
+			self.try_get_dir(inspected)
+			raise
+		if not empty:
+			LOG.info("Folder %s is not empty", root)
+			return False
 		LOG.info("Folder %s is empty", root)
 		return True
 
@@ -143,10 +195,15 @@ class Dirs(PathOpsBase):
 		"""
 		Poll a folder until at least one entry matches the filters.
 
+		Between scans the call blocks on a native directory watch (inotify, kqueue or
+		``FindFirstChangeNotification``) where available, so new entries are noticed
+		immediately; otherwise it sleeps for *poll_interval*.
+
 		:param folder_path: Folder to watch.
 							If ``None``, the :attr:`base_dir` is used.
 		:param timeout:  Maximum time to wait in seconds. Use 0 for a single check.
-		:param poll_interval: Delay between checks in seconds.
+		:param poll_interval: Delay between checks in seconds (maximum wait between
+								re-scans when a directory watch is active).
 		:param include_hidden: If False, ignore dot-files.
 		:param pattern: Include only names containing this substring.
 		:param antipattern: Exclude names containing this substring.
@@ -162,30 +219,39 @@ class Dirs(PathOpsBase):
 		assert root is not None
 
 		deadline = time.monotonic() + max(0.0, timeout)
+		interval = max(0.05, poll_interval)
+		# Opened before the first scan so nothing created in between is missed
+		watch = open_dir_watch(root) if timeout > 0 else None
 
-		while True:
-			try:
-				# count (stop early on first match for speed)
-				count = 0
-				for _ in iter_dir_filtered(
+		try:
+			while True:
+				try:
+					count = len(self._matching_names(
 						root,
+						files_only=files_only,
 						include_hidden=include_hidden,
 						pattern=pattern,
 						antipattern=antipattern,
-						shell_pattern=shell_pattern,
-						files_only=files_only
-				):
-					count += 1
+						shell_pattern=shell_pattern
+					))
 					if count > 0:
 						LOG.info("Folder became non-empty (%d match%s): %s",
 						         count, "" if count == 1 else "es", root)
 						return count
-			except PermissionError as exc:
-				LOG.warning("Permission issue while scanning %s: %s", root, exc)
+				except PermissionError as exc:
+					LOG.warning("Permission issue while scanning %s: %s", root, exc)
 
-			if time.monotonic() >= deadline:
-				raise TimeoutError(f"Timeout waiting for folder '{root}' to become non-empty.")
-			time.sleep(max(0.05, poll_interval))
+				remaining = deadline - time.monotonic()
+				if remaining <= 0:
+					raise TimeoutError(f"Timeout waiting for folder '{root}' to become non-empty.")
+				if watch is None:
+					time.sleep(interval)
+				else:
+					# Wakes up on a new entry; poll_interval stays as a safety re-scan period
+					watch.wait(min(interval, remaining))
+		finally:
+			if watch is not None:
+				watch.close()
 
 	# --- Temporary directories ---
 	@contextmanager
@@ -233,6 +299,7 @@ class Dirs(PathOpsBase):
 			finally:
 				LOG.info("Removing temp dir: %s", path)
 				td.cleanup()
+				self._forget_dir_caches()
 		else:
 			path = Path(tempfile.mkdtemp(prefix=prefix, suffix=suffix, dir=temp_parent)).resolve()
 			LOG.info("Created temp dir: %s", path)
@@ -2,9 +2,13 @@
 
 from __future__ import annotations
 
+import codecs
 import csv
+import threading
 from pathlib import Path
-from typing import Iterable, Optional
+from functools import lru_cache
+from itertools import islice
+from typing import Iterable, Optional, Tuple
 
 from ..logutil import get_logger
 from .base import PathLike
@@ -20,12 +24,29 @@ except ImportError:
 
 __all__ = ["Encoding"]
 
+_ASCII_BYTES = bytes(range(0x80))
+
+# libmagic loads and parses its whole database per ``Magic`` instance: build one, lazily
+_MAGIC_MIME = None
+_MAGIC_MIME_LOCK = threading.Lock()
+
+
+def _get_mime_magic():
+	"""Shared ``MAGIC.Magic(mime=True)`` (python-magic serializes ``from_buffer`` itself)."""
+	global _MAGIC_MIME
+	if _MAGIC_MIME is None:
+		with _MAGIC_MIME_LOCK:
+			if _MAGIC_MIME is None:
+				_MAGIC_MIME = MAGIC.Magic(mime=True)
+	return _MAGIC_MIME
+
 
 class Encoding:
 	"""
 	Text encoding and delimiter utilities (best-effort, lazy optional deps).
 
 	Pipeline for encoding detection (in order):
+		0) byte-order mark / pure ASCII sample (no detector needed)
 		1) libmagic: ``charset=...`` from MIME string
 		2) charset-normalizer
 		3) chardet
@@ -33,9 +54,28 @@ class Encoding:
 
 	Delimiter detection:
 		- csv.Sniffer (sample)
-		- pandas (probe candidates; pick first yielding >1 column)
+		- csv.reader (probe candidates; pick first yielding >1 column)
 	"""
 	# --- Encoding detection ---
+	@staticmethod
+	def _detect_encoding_bom_ascii(sample: bytes) -> Optional[str]:
+		"""
+		Settle the obvious cases without any detector: a byte-order mark, or a
+		sample with no byte >= 0x80 (one C-level ``bytes.translate`` pass).
+
+		:param sample: Initial byte sample from the file.
+		:return: ``"utf-8-sig"``, ``"utf-32"``, ``"utf-16"`` or ``"ascii"``; else None.
+		"""
+		if sample.startswith(codecs.BOM_UTF8):
+			return "utf-8-sig"
+		if sample.startswith((codecs.BOM_UTF32_LE, codecs.BOM_UTF32_BE)):  # before UTF-16: same prefix
+			return "utf-32"
+		if sample.startswith((codecs.BOM_UTF16_LE, codecs.BOM_UTF16_BE)):
+			return "utf-16"
+		if not sample.translate(None, _ASCII_BYTES):
+			return "ascii"
+		return None
+
 	@staticmethod
 	def _detect_encoding_magic(sample: bytes) -> Optional[str]:
 		"""
@@ -46,8 +86,7 @@ class Encoding:
 		"""
 		try:
 			# python-magic compatible API
-			m = MAGIC.Magic(mime=True)
-			s = m.from_buffer(sample)  # e.g., "text/plain; charset=us-ascii"
+			s = _get_mime_magic().from_buffer(sample)  # e.g., "text/plain; charset=us-ascii"
 			if s and "charset=" in s:
 				enc = s.split("charset=", 1)[-1].strip()
 				if enc:
@@ -113,21 +152,13 @@ class Encoding:
 
 	# --- Delimiter detection ---
 	@staticmethod
-	def _normalize_candidates(candidates: Iterable[str]) -> list[str]:
+	@lru_cache(maxsize=32)
+	def _normalize_candidates(candidates: Tuple[str, ...]) -> Tuple[str, ...]:
 		"""
-		Normalize candidate delimiter tokens (convert literal ``"\\t"`` to tab).
+		Normalize candidate delimiter tokens (convert literal ``"\\t"`` to tab),
+		unique and in order. Cached: callers pass the same few candidate tuples.
 		"""
-		out: list[str] = []
-		for c in candidates:
-			out.append("\t" if c == "\\t" else c)
-		# make unique but keep order
-		seen = set()
-		uniq: list[str] = []
-		for c in out:
-			if c not in seen:
-				seen.add(c)
-				uniq.append(c)
-		return uniq
+		return tuple(dict.fromkeys("\t" if c == "\\t" else c for c in candidates))
 
 	def _sniff_delimiter_sample(
 			self,
@@ -146,7 +177,7 @@ class Encoding:
 		:param max_lines: Max lines to read for the sample.
 		:return: Detected delimiter or None.
 		"""
-		cand = self._normalize_candidates(candidates)
+		cand = self._normalize_candidates(tuple(candidates))
 
 		sample_lines: list[str] = []
 		try:
@@ -168,29 +199,40 @@ class Encoding:
 			return None
 		return None
 
-	def _pandas_guess_delimiter(
+	def _stdlib_guess_delimiter(
 			self,
 			file_path: Path,
 			*,
 			encoding: str,
 			candidates: Iterable[str],
+			max_lines: int = 10,
 	) -> Optional[str]:
 		"""
-		Try candidate delimiters with pandas and pick the first yielding >1 column.
+		Split the first non-blank row with :func:`csv.reader` per candidate delimiter
+		and pick the first yielding >1 column. The file is read once for all candidates.
 
 		:param file_path: Text file path.
 		:param encoding: Encoding to open the file.
 		:param candidates: Iterable of candidate delimiter characters.
+		:param max_lines: Lines to read (the first non-blank one is split).
 		:return: Detected delimiter or None.
 		"""
-		for delim in self._normalize_candidates(candidates):
+		try:
+			with open(file_path, "r", encoding=encoding, errors="replace") as fh:
+				sample = [line for line in islice(fh, max_lines) if line.strip()]
+		except OSError:
+			return None
+		if not sample:
+			return None
+
+		for delim in self._normalize_candidates(tuple(candidates)):
 			try:
-				df = pd.read_csv(file_path, encoding=encoding, delimiter=delim, nrows=10)
-				if getattr(df, "shape", (1, 1))[1] > 1:
-					LOG.debug("Delimiter '%s' detected by pandas", delim)
-					return delim
-			except Exception:
+				row = next(csv.reader(sample, delimiter=delim))
+			except (csv.Error, StopIteration, TypeError):
 				continue
+			if len(row) > 1:
+				LOG.debug("Delimiter '%s' detected by column count", delim)
+				return delim
 		return None
 
 	# --- Main Methods ---
@@ -205,6 +247,7 @@ class Encoding:
 		Detect text encoding of a file (best-effort; optimized for Central European texts).
 
 		Detection pipeline:
+			0) :meth:`_detect_encoding_bom_ascii`
 			1) :meth:`_detect_encoding_magic`
 			2) :meth:`_detect_encoding_charset_normalizer`
 			3) :meth:`_detect_encoding_chardet`
@@ -226,7 +269,7 @@ class Encoding:
 		with open(p, "rb") as fh:
 			sample = fh.read(sample_size)
 
-		enc = (
+		enc = self._detect_encoding_bom_ascii(sample) or (
 				self._detect_encoding_magic(sample)
 				or self._detect_encoding_charset_normalizer(sample)
 				or self._detect_encoding_chardet(sample)
@@ -254,7 +297,7 @@ class Encoding:
 
 		Pipeline:
 			1) :meth:`_sniff_delimiter_sample` (csv.Sniffer)
-			2) :meth:`_pandas_guess_delimiter` (quick DataFrame probes)
+			2) :meth:`_stdlib_guess_delimiter` (column count of the first row)
 
 		:param file_path: Text file path.
 		:param encoding: Text encoding; if None, runs :meth:`detect_encoding` first.
@@ -271,11 +314,11 @@ class Encoding:
 		if encoding is None:
 			encoding = self.detect_encoding(p)
 
-		candidates = candidates or [",", ";", "\\t", "|", ":"]
+		candidates = self._normalize_candidates(tuple(candidates or [",", ";", "\\t", "|", ":"]))
 
 		delim = (
 				self._sniff_delimiter_sample(p, encoding=encoding, candidates=candidates, max_lines=max_lines)
-				or self._pandas_guess_delimiter(p, encoding=encoding, candidates=candidates)
+				or self._stdlib_guess_delimiter(p, encoding=encoding, candidates=candidates)
 		)
 		if delim:
 			return delim
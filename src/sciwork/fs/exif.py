@@ -104,8 +104,9 @@ def _decode_exif_maps(exif_obj: Any, ExifTags: Any) -> Tuple[Dict[str, Any], Dic
 		for gk, gv in gps_raw.items():
 			gps_map[gpstags.get(gk, str(gk))] = gv
 
-	# Some Pillow builds expose get_ifd(); try it as a bonus path
-	get_ifd = getattr(exif_obj, "get_ifd", None)
+	# Some Pillow builds expose get_ifd(); try it as a bonus path when GPSInfo did not
+	# already carry the decoded tags (modern Pillow leaves only the IFD offset there)
+	get_ifd = None if gps_map else getattr(exif_obj, "get_ifd", None)
 	if callable(get_ifd):
 		try:
 			gps_ifd = get_ifd(0x8825)  # GPS IFD
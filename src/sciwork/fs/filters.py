@@ -3,17 +3,25 @@
 from __future__ import annotations
 
 import fnmatch
+import os
 import re
 import time
 from datetime import datetime, timezone
+from functools import lru_cache
 from pathlib import Path
-from typing import Iterator, Optional, Union
+from itertools import filterfalse
+from operator import methodcaller
+from typing import Callable, Iterable, Iterator, List, Optional, Tuple, Union
 
 __all__ = [
 	"matches_filters",
+	"compile_name_filters",
+	"name_predicate",
+	"filter_names",
 	"parse_duration_seconds",
 	"coerce_time_cutoff",
 	"is_hidden_path",
+	"is_hidden_name",
 	"mtime_matches",
 	"iter_dir_filtered"
 ]
@@ -42,16 +50,113 @@ def matches_filters(
 	:param antipattern: Optional substring that must NOT be present in the name.
 	:param shell_pattern: Optional shell-style pattern (e.g., "*.txt") to match against.
 	:return: True if the name matches all enabled filters, False otherwise.
+
+	Loops over many names should build the test once with :func:`name_predicate`.
 	"""
-	if not include_hidden and name.startswith("."):
-		return False
-	if pattern and pattern not in name:
-		return False
-	if antipattern and antipattern in name:
-		return False
-	if shell_pattern and not fnmatch.fnmatch(name, shell_pattern):
-		return False
-	return True
+	accept = name_predicate(compile_name_filters(
+		include_hidden=include_hidden,
+		pattern=pattern,
+		antipattern=antipattern,
+		shell_pattern=shell_pattern
+	))
+	return accept is None or accept(name)
+
+
+# (include_hidden, pattern, antipattern, compiled shell_pattern matcher)
+NameFilters = Tuple[bool, Optional[str], Optional[str], Optional[Callable[[str], Optional[re.Match]]]]
+
+# fnmatch.fnmatch() normalizes case per call only where normcase does something (Windows)
+_FOLD_CASE = os.path.normcase("A") != "A"
+
+
+@lru_cache(maxsize=64)
+def _compiled_shell(pat: str) -> re.Pattern:
+	"""Compiled regex of the shell pattern *pat*; polling loops reuse the same few patterns."""
+	return re.compile(fnmatch.translate(pat))
+
+
+def compile_name_filters(
+		*,
+		include_hidden: bool = True,
+		pattern: Optional[str] = None,
+		antipattern: Optional[str] = None,
+		shell_pattern: Optional[str] = None
+) -> NameFilters:
+	"""
+	Prepare the :func:`matches_filters` criteria once for a loop over many names:
+	the shell pattern is translated and compiled a single time.
+
+	:param include_hidden: If False, hidden entries (starting with '.') are excluded.
+	:param pattern: Optional substring that must be present in the name.
+	:param antipattern: Optional substring that must NOT be present in the name.
+	:param shell_pattern: Optional shell-style pattern (e.g., "*.txt") to match against.
+	:return: Opaque tuple for :func:`name_predicate`.
+	"""
+	shell_match = None
+	if shell_pattern:
+		if _FOLD_CASE:
+			shell_pattern = os.path.normcase(shell_pattern)
+		shell_match = _compiled_shell(shell_pattern).match
+	return include_hidden, pattern or None, antipattern or None, shell_match
+
+
+def name_predicate(filters: NameFilters) -> Optional[Callable[[str], bool]]:
+	"""
+	Fold criteria from :func:`compile_name_filters` into one closure for walkers
+	that test names inline; all criteria are bound as closure locals. This is the
+	single implementation of the name test (:func:`matches_filters` wraps it).
+
+	:param filters: Result of :func:`compile_name_filters`.
+	:return: ``accept(name) -> bool``, or ``None`` when every name passes.
+	"""
+	include_hidden, pattern, antipattern, shell_match = filters
+	if include_hidden and not (pattern or antipattern or shell_match):
+		return None
+	fold = os.path.normcase if _FOLD_CASE else None
+
+	def accept(name: str) -> bool:
+		return (
+			(include_hidden or not name.startswith("."))
+			and (not pattern or pattern in name)
+			and (not antipattern or antipattern not in name)
+			and (shell_match is None or shell_match(fold(name) if fold else name) is not None)
+		)
+
+	return accept
+
+
+def filter_names(
+		names: Iterable[str],
+		*,
+		include_hidden: bool = True,
+		pattern: Optional[str] = None,
+		antipattern: Optional[str] = None,
+		shell_pattern: Optional[str] = None
+) -> List[str]:
+	"""
+	Batch form of :func:`matches_filters`: keep the *names* passing all criteria.
+
+	The cheap substring tests run first as chained iterators; the shell pattern is
+	then applied to the survivors in one :func:`fnmatch.filter` call (one regex
+	compile, same case handling as :func:`fnmatch.fnmatch`).
+
+	:param names: Entry names (not paths).
+	:param include_hidden: If False, hidden names (starting with '.') are dropped.
+	:param pattern: Optional substring that must be present in the name.
+	:param antipattern: Optional substring that must NOT be present in the name.
+	:param shell_pattern: Optional shell-style pattern (e.g., "*.txt") to match against.
+	:return: Matching names in their original order.
+	"""
+	selected: Iterable[str] = names
+	if not include_hidden:
+		selected = filterfalse(methodcaller("startswith", "."), selected)
+	if pattern:
+		selected = (name for name in selected if pattern in name)
+	if antipattern:
+		selected = filterfalse(methodcaller("__contains__", antipattern), selected)
+	if shell_pattern:
+		return fnmatch.filter(selected if isinstance(selected, list) else list(selected), shell_pattern)
+	return list(selected)
 
 
 def parse_duration_seconds(spec: str) -> Optional[float]:
@@ -115,6 +220,19 @@ def coerce_time_cutoff(
 	return None
 
 
+def is_hidden_name(name: str) -> bool:
+	"""
+	Return True if the single path component *name* is hidden (starts with '.').
+
+	Lets directory walkers decide from ``DirEntry.name`` alone and prune hidden
+	subtrees instead of calling :func:`is_hidden_path` per candidate.
+
+	:param name: File or directory name (not a path).
+	:return: True when hidden, False otherwise.
+	"""
+	return name.startswith(".")
+
+
 def is_hidden_path(root: Path, entry: Path) -> bool:
 	"""
 	Return True if *entry* is hidden relative to *root* (any path part starts with '.').
@@ -131,7 +249,7 @@ def is_hidden_path(root: Path, entry: Path) -> bool:
 
 
 def mtime_matches(
-		p: Path,
+		p: Union[Path, os.DirEntry],
 		*,
 		older_than: Optional[Union[int, float, str, datetime]] = None,
 		newer_than: Optional[Union[int, float, str, datetime]] = None
@@ -139,7 +257,7 @@ def mtime_matches(
 	"""
 	Check whether ``p.stat().st_mtime`` matches the given time bounds.
 
-	:param p: Path to check.
+	:param p: Path (or :class:`os.DirEntry`) to check.
 	:param older_than: Keep entries strictly older than this (see :func:`coerce_time_cutoff`).
 	:param newer_than: Keep entries strictly newer than this.
 	:return: True if both bounds (when present) pass.
@@ -186,19 +304,21 @@ def iter_dir_filtered(
 	:param newer_than: Optional mtime greater than cutoff.
 	:yield: Paths matching filters.
 	"""
-	for entry in root.iterdir():
-		if files_only and not entry.is_file():
-			continue
-		if not matches_filters(
-			entry.name,
-			include_hidden=include_hidden,
-			pattern=pattern,
-			antipattern=antipattern,
-			shell_pattern=shell_pattern
-		):
-			continue
-		if older_than is None and newer_than is None:
-			yield entry
-			continue
-		if mtime_matches(entry, older_than=older_than, newer_than=newer_than):
-			yield entry
+	accept = name_predicate(compile_name_filters(
+		include_hidden=include_hidden,
+		pattern=pattern,
+		antipattern=antipattern,
+		shell_pattern=shell_pattern
+	))
+	# DirEntry: is_file() and the mtime stat() come from the cached scan data where possible
+	with os.scandir(root) as it:
+		for entry in it:
+			if files_only and not entry.is_file():
+				continue
+			if accept is not None and not accept(entry.name):
+				continue
+			if older_than is None and newer_than is None:
+				yield Path(entry.path)
+				continue
+			if mtime_matches(entry, older_than=older_than, newer_than=newer_than):
+				yield Path(entry.path)
@@ -7,7 +7,7 @@ from typing import Any, Dict, Optional, Union
 
 from .base import PathLike, PathOpsBase
 from ..logutil import get_logger
-from .filters import matches_filters, coerce_time_cutoff
+from .filters import compile_name_filters, name_predicate, coerce_time_cutoff
 from .inspect import build_metadata, extract_exif
 
 LOG = get_logger(__name__)
@@ -83,12 +83,12 @@ class GetContents(PathOpsBase):
 		if recursive and not follow_symlinks:
 			it = (p for p in it if not (p.is_dir() and p.is_symlink()))
 
+		accept = name_predicate(compile_name_filters(
+			include_hidden=include_hidden,
+			pattern=pattern, antipattern=antipattern, shell_pattern=shell_pattern
+		))
 		for entry in it:
-			name = entry.name
-			if not matches_filters(
-					name, include_hidden=include_hidden,
-					pattern=pattern, antipattern=antipattern, shell_pattern=shell_pattern
-			):
+			if accept is not None and not accept(entry.name):
 				continue
 			try:
 				st = entry.lstat()
@@ -5,6 +5,7 @@ from __future__ import annotations
 import os
 import mimetypes
 
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Dict, Optional
 from datetime import datetime, timezone
@@ -35,6 +36,12 @@ def _iso_utc(ts: float) -> str:
 	return datetime.fromtimestamp(ts, tz=timezone.utc).isoformat(timespec="seconds")
 
 
+@lru_cache(maxsize=4096)
+def _guess_mime(name: str) -> Optional[str]:
+	"""Filename-based MIME guess, memoized (``mimetypes`` only looks at the name)."""
+	return mimetypes.guess_type(name)[0]
+
+
 def build_metadata(path: Path, *, st: Optional[os.stat_result] = None) -> Dict[str, Any]:
 	"""
 	Return unified filesystem metadata for *path*.
@@ -70,7 +77,7 @@ def build_metadata(path: Path, *, st: Optional[os.stat_result] = None) -> Dict[s
 	modified = _iso_utc(modified_ts)
 	accessed = _iso_utc(accessed_ts)
 
-	mime, _ = mimetypes.guess_type(p.name)
+	mime = _guess_mime(p.name)
 	ext = p.suffix.lower()
 
 	return {
@@ -126,6 +126,7 @@ class Paths(PathOpsBase):
 				LOG.exception("OS error while renaming '%s' -> '%s': %s", src, target, exc)
 				raise
 
+		self._forget_dir_caches()  # the old path (and any directory below it) is gone
 		LOG.info("Renamed %s -> %s", src, target)
 		return target.resolve()
 
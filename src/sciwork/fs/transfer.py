@@ -75,6 +75,7 @@ class Transfer(PathOpsBase):
 					LOG.error("Transfer class requires the optional dependency 'sciwork.fs.Delete' to work.")
 					raise
 				Delete().delete(target, recursive=True, missing_ok=True)
+				self._forget_dir_caches()  # directories cached by this instance may be gone
 			else:
 				try:
 					target.unlink()
@@ -212,6 +213,7 @@ class Transfer(PathOpsBase):
 					)
 			elif operation == "move":
 				self._move_any(src, target)
+				self._forget_dir_caches()  # the source tree no longer exists
 			else:
 				raise ValueError(f"Unsupported operation (must be 'copy' or 'move': {operation}")
 		except PermissionError:
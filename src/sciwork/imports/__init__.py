@@ -15,6 +15,7 @@ _MAGIC_HINT = (
 np = numpy = lazy_module("numpy", install="pip install numpy", reason="numerical arrays")
 pd = pandas = lazy_module("pandas", install="pip install pandas", reason="data analysis and dataframes")
 sp = scipy = lazy_module("scipy", install="pip install scipy", reason="scientific computing")
+numba = lazy_module("numba", install="pip install numba", reason="compiled numeric kernels")
 matplotlib = lazy_module("matplotlib", install="pip install matplotlib", reason="plotting")
 plt = pyplot = lazy_module("matplotlib.pyplot", install="pip install matplotlib", reason="plot rendering")
 PIL = lazy_module("PIL", install="pip install Pillow", reason="image processing")
@@ -23,11 +24,19 @@ ZIPFILE = zipfile = lazy_module("zipfile", install="pip install zipfile", reason
 pyzipper = lazy_module("pyzipper", install="pip install pyzipper", reason="AES-256 encryption for ZIP archives")
 TARFILE = tarfile = lazy_module("tarfile", install="pip install tarfile", reason="TAR archives")
 RARFILE = rarfile = lazy_module("rarfile", install="pip install rarfile", reason="RAR archive")
+libarchive = lazy_module("libarchive", install="pip install libarchive-c", reason="in-process RAR extraction via libarchive")
+zlib_ng = lazy_module("zlib_ng", install="pip install zlib-ng", reason="faster DEFLATE for ZIP/gzip archives")
 
 MAGIC = magic = lazy_module("magic", install=_MAGIC_HINT, reason="file type identification")
 charset_normalizer = lazy_module("charset_normalizer", install="pip install charset-normalizer", reason="normalize character encodings")
 chardet = lazy_module("chardet", install="pip install chardet", reason="detect character encodings")
 
+orjson = lazy_module("orjson", install="pip install orjson", reason="fast JSON serialization")
+
+ahocorasick = lazy_module("ahocorasick", install="pip install pyahocorasick", reason="multi-keyword string matching")
+
+liburing = lazy_module("liburing", install="pip install liburing", reason="io_uring batched unlink (Linux)")
+
 send2trash = Send2Trash = lazy_module("send2trash", install="pip install Send2Trash", reason="send files to trash")
 
 openpyxl = lazy_module("openpyxl", install="pip install openpyxl", reason="read/write Excel files")
@@ -37,7 +46,7 @@ sif_parser = sif = SIF = lazy_module("sif_parser", install="pip install sif_pars
 __all__ = [
 	"LazyModule", "lazy_module",
 	# data
-	"np", "numpy", "pd", "pandas", "sp", "scipy",
+	"np", "numpy", "pd", "pandas", "sp", "scipy", "numba",
 	# plotting
 	"matplotlib", "plt", "pyplot",
 	# image
@@ -47,11 +56,17 @@ __all__ = [
 	# TAR archives
 	"TARFILE", "tarfile",
 	# RAR archives
-	"RARFILE", "rarfile",
+	"RARFILE", "rarfile", "libarchive",
+	# DEFLATE acceleration
+	"zlib_ng",
 	# encoding
 	"MAGIC", "magic", "charset_normalizer", "chardet",
+	# serialization
+	"orjson",
+	# text matching
+	"ahocorasick",
 	# deletion
-	"send2trash", "Send2Trash",
+	"send2trash", "Send2Trash", "liburing",
 	# data
 	"openpyxl", "ET", "et", "sif_parser", "sif", "SIF"
 ]
@@ -0,0 +1,98 @@
+# tests/test_subtraction.py
+
+from pathlib import Path
+import sys
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+np = pytest.importorskip("numpy")
+
+from sciwork.data.ops._kernels import _segmented_subtract_loop, _segmented_subtract_numpy
+from sciwork.data.ops.subtraction import Subtraction
+
+
+def _reference(data, blank, indices, fractions):
+	"""
+	Segment-by-segment subtraction exactly as originally written (zero-initialized
+	buffer, ``start < len`` guard): an empty segment after the first raises IndexError.
+	"""
+	adjusted = np.zeros_like(data)
+	previous_end = None
+	for idx, (start, end) in enumerate(zip(indices[:-1], indices[1:])):
+		segment = data[start:end] - blank[start:end] * fractions[idx]
+		if previous_end is not None and start < len(adjusted):
+			segment = segment + (adjusted[previous_end - 1] - segment[0])
+		adjusted[start:end] = segment
+		previous_end = end
+	return adjusted
+
+
+@pytest.mark.parametrize("positions", [[-1.0], [3.5], [2.5, 6.5], [20.0]])
+def test_segmented_subtract_matches_reference(positions):
+	x = np.arange(10, dtype=float)
+	data = x * 3.0
+	blank = x.copy()
+	fractions = np.arange(1, len(positions) + 2, dtype=float)
+	indices = np.asarray(Subtraction._get_segment_indices(x, positions), dtype=np.intp)
+
+	# Stale values in a reused buffer must not leak into the result
+	out = np.full_like(data, 99.0)
+	_segmented_subtract_numpy(data, blank, indices, fractions, out)
+
+	np.testing.assert_allclose(out, _reference(data, blank, indices, fractions))
+
+
+@pytest.mark.parametrize(
+	"positions, fractions, same_positions, same_fractions",
+	[
+		([3.5, 3.6], [1.0, 2.0, 3.0], [3.5], [1.0, 3.0]),  # empty middle segment
+		([-2.0, -1.0, 6.5], [1.0, 2.0, 3.0, 4.0], [-1.0, 6.5], [1.0, 3.0, 4.0]),  # two empty leading
+	]
+)
+def test_segmented_subtract_skips_empty_segments(positions, fractions, same_positions, same_fractions):
+	# Changed behavior: the original raised IndexError on an empty segment after the first;
+	# now it is skipped, giving the result of the same split without that segment
+	x = np.arange(10, dtype=float)
+	data, blank = x * 3.0, x.copy()
+	indices = np.asarray(Subtraction._get_segment_indices(x, positions), dtype=np.intp)
+	with pytest.raises(IndexError):
+		_reference(data, blank, indices, fractions)
+
+	out = np.full_like(data, 99.0)
+	_segmented_subtract_numpy(data, blank, indices, np.asarray(fractions), out)
+	same = np.asarray(Subtraction._get_segment_indices(x, same_positions), dtype=np.intp)
+	np.testing.assert_allclose(out, _reference(data, blank, same, same_fractions))
+
+
+def test_segmented_subtract_empty_leading_segment():
+	x = np.arange(5, dtype=float)
+	indices = np.asarray(Subtraction._get_segment_indices(x, [-1.0]), dtype=np.intp)
+	out = np.empty_like(x)
+	_segmented_subtract_numpy(x * 3.0, x, indices, np.array([1.0, 2.0]), out)
+
+	np.testing.assert_allclose(out, [0.0, 1.0, 2.0, 3.0, 4.0])
+
+
+@pytest.mark.parametrize("positions", [[-1.0], [3.5], [-2.0, -1.0, 6.5], [20.0]])
+def test_segmented_kernels_agree(positions):
+	x = np.linspace(0.0, 9.0, 10)
+	data = np.sin(x) * 5.0
+	blank = np.cos(x)
+	fractions = np.linspace(0.5, 2.0, len(positions) + 1)
+	indices = np.asarray(Subtraction._get_segment_indices(x, positions), dtype=np.intp)
+
+	kernels = [_segmented_subtract_loop]  # plain Python: same code Numba compiles
+	try:
+		import numba
+		kernels.append(numba.njit(_segmented_subtract_loop))
+	except ImportError:
+		pass
+
+	expected = np.full_like(data, 99.0)
+	_segmented_subtract_numpy(data, blank, indices, fractions, expected)
+	for kernel in kernels:
+		out = np.full_like(data, -99.0)
+		kernel(data, blank, indices, fractions, out)
+		np.testing.assert_allclose(out, expected)